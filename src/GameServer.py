@@ -1,53 +1,173 @@
 import os
 import enum
 import json
-import pygame
-from typing import Dict
+import random
+from collections.abc import Mapping
+from typing import Dict, Iterable
 from pathlib import Path
-from src.deck import Deck
+from src.card import LlamaCard
+from src.deck import Deck, make_rng
+from src.event_bus import EventBus, EventType
 from src.hand import Hand
+from src.journal import GameJournal
 from src.player import Player
 from src.game_state import GameState
-from src.ui.event import post_event, CustomEvent
+from src.game_log import GameLog, NULL_LOG
 from src.player_interaction import PlayerInteraction
 from src.player_interactions.init import all_player_types
 
-# Инициализация Pygame
-pygame.init()
-
 # Перечисление для различных фаз игры
 class GamePhase(enum.StrEnum):
     CHOOSE_CARD = "Choose card"  # Фаза выбора карты -> DRAW_EXTRA, NEXT_PLAYER
     DRAW_EXTRA = "Draw extra card"  # Фаза вытягивания дополнительной карты -> CHOOSE_CARD_AGAIN
     CHOOSE_CARD_AGAIN = "Choose card again"  # Фаза повторного выбора карты -> NEXT_PLAYER
-    NEXT_PLAYER = "Switch current player"  # Фаза смены текущего игрока -> ROUND_END, CHOOSE_CARD (NEXT_PLAYER)
+    NEXT_PLAYER = "Switch current player"  # Фаза смены текущего игрока -> END_ROUND, CHOOSE_CARD (вышедшие пропускаются)
     DETERMINE_WINNER = "Determine the winner"  # Фаза определения победителя -> DECLARE_WINNER
     DECLARE_WINNER = "Declare a winner"  # Фаза объявления победителя -> GAME_END
     GAME_END = "Game ended"  # Фаза окончания игры
     BEGIN_ROUND = "Begin round" # начинаем раунд, раздаем карты -> CHOOSE_CARD
     END_ROUND = "End round"     # конец раунда, подсчет очков -> BEGIN_ROUND, DETERMINE_WINNER
 
+Seats = Dict[Player, PlayerInteraction] | Iterable[tuple[Player, PlayerInteraction]]
+
+
+def split_seats(seats: Seats) -> tuple[list[Player], list[PlayerInteraction]]:
+    # Игроки и их интерфейсы по местам; пары (игрок, интерфейс) допускают одинаковые имена
+    pairs = list(seats.items() if isinstance(seats, Mapping) else seats)
+    return [player for player, _ in pairs], [interaction for _, interaction in pairs]
+
+
+def find_seat(players: list[Player], player: Player) -> int:
+    # Место игрока: сначала по тождеству, затем по равенству (хэш Player не вычисляется)
+    for seat, p in enumerate(players):
+        if p is player:
+            return seat
+    for seat, p in enumerate(players):
+        if p == player:
+            return seat
+    raise KeyError(player)
+
+
+class SeatMapping(Mapping):
+    # Совместимый с прежним Dict[Player, PlayerInteraction] вид мест сервера (только чтение).
+    # Игрок ищется сначала по тождеству, затем по равенству; хэш Player не вычисляется
+    def __init__(self, players: list[Player], interactions: list[PlayerInteraction]):
+        self._players = players
+        self._interactions = interactions
+
+    def __getitem__(self, player: Player) -> PlayerInteraction:
+        return self._interactions[find_seat(self._players, player)]
+
+    def __iter__(self):
+        return iter(self._players)
+
+    def __len__(self):
+        return len(self._players)
+
+    def values(self):
+        return list(self._interactions)
+
+    def items(self):
+        return list(zip(self._players, self._interactions))
+
+
+class DecisionRequest:
+    # Решение, которого ждёт сервер: метод интерфейса игрока на месте seat и его аргументы.
+    # Создаётся фазой выбора карты, когда игрок уже получил inform_game_state
+    __slots__ = ('seat', 'interaction', 'method', 'args', 'playable_cards')
+
+    def __init__(self, seat: int, interaction: PlayerInteraction, method: str, args: tuple,
+                 playable_cards: list[LlamaCard]):
+        self.seat = seat
+        self.interaction = interaction
+        self.method = method  # 'choose_card', 'choose_quit' или 'choose_to_play'
+        self.args = args
+        self.playable_cards = playable_cards  # играбельные карты руки на момент запроса
+
+    def ask(self):
+        # Ответ самого интерфейса игрока
+        return getattr(self.interaction, self.method)(*self.args)
+
+    def __repr__(self):
+        return f"DecisionRequest(seat={self.seat}, method={self.method!r}, args={self.args})"
+
+
 # Класс для управления игровым процессом
 class GameServer:
     INITIAL_HAND_SIZE = 6  # Начальный размер руки игроков
-
-    def __init__(self, player_types: Dict[Player, PlayerInteraction], game_state: GameState):
+    # методы фаз; run_one_step вызывает их через таблицу, собранную compile_phases()
+    PHASE_METHODS = {
+        GamePhase.BEGIN_ROUND: 'round_begin',                       # CHOOSE_CARD
+        GamePhase.CHOOSE_CARD: 'choose_card_phase',                 # DRAW_EXTRA | NEXT_PLAYER
+        GamePhase.CHOOSE_CARD_AGAIN: 'choose_card_again_phase',     # NEXT_PLAYER
+        GamePhase.DRAW_EXTRA: 'draw_extra_phase',                   # CHOOSE_CARD_AGAIN | NEXT_PLAYER
+        GamePhase.NEXT_PLAYER: 'next_player_phase',                 # CHOOSE_CARD | END_ROUND
+        GamePhase.END_ROUND: 'round_end',                           # BEGIN_ROUND | DETERMINE_WINNER
+        GamePhase.DETERMINE_WINNER: 'determine_winner_phase',
+        GamePhase.DECLARE_WINNER: 'declare_winner_phase',
+    }
+
+    def __init__(self, player_types: Seats | list[PlayerInteraction], game_state: GameState,
+                 rng: random.Random | None = None, headless: bool = False, log: GameLog | None = None):
+        # headless=True - безголовый режим: без вывода в консоль (боты, симуляции).
+        # pygame сервер не трогает: очередь событий pygame подключает интерфейс (src/ui/view_game.py)
+        # player_types - интерфейсы игроков по местам game_state.players: список или пары (игрок, интерфейс)
         self.game_state = game_state  # Состояние игры
         self.player_types = player_types  # Типы игроков
         self.current_phase = GamePhase.CHOOSE_CARD  # Текущая фаза игры
         self.turn_count = 0  # Счетчик ходов
+        self.rounds_played = 0  # Число сыгранных раундов
+        self.winner: Player | None = None  # Победитель, когда игра окончена
+        self.rng = rng if rng is not None else make_rng()  # Генератор случайных чисел партии (тасование колод)
+        self.journal: GameJournal | None = None  # Журнал ходов (см. src/journal.py), если подключен
+        self.metrics = None  # Замеры фаз и игроков (см. src/instrumentation.py), если подключены
+        self.headless = headless
+        self.log = log if log is not None else (NULL_LOG if headless else GameLog())  # Приёмник сообщений
+        self.event_bus: EventBus | None = None  # Шина событий партии (см. src/event_bus.py), если подключена
+        self._request: DecisionRequest | None = None  # решение, на котором остановился run_until_decision
+        self.compile_phases()
+
+    @property
+    def player_types(self) -> SeatMapping:
+        # Прежний доступ игрок -> интерфейс; движок берёт интерфейс по месту из self.interactions
+        return SeatMapping(self.game_state.players, self.interactions)
+
+    @player_types.setter
+    def player_types(self, player_types: Seats | list[PlayerInteraction]):
+        if isinstance(player_types, Mapping):
+            # интерфейс каждого места - по его игроку, порядок словаря не важен
+            keys, values = split_seats(player_types)
+            interactions = []
+            for player in self.game_state.players:
+                try:
+                    interactions.append(values[find_seat(keys, player)])
+                except KeyError:
+                    raise ValueError(f"No player interaction for seat of {player.name!r}") from None
+        else:
+            interactions = [seat[1] if isinstance(seat, tuple) else seat for seat in player_types]
+        if len(interactions) != len(self.game_state.players):
+            raise ValueError(f"{len(interactions)} player interactions for {len(self.game_state.players)} seats")
+        self.interactions: list[PlayerInteraction] = interactions  # Интерфейсы игроков по местам
 
     @classmethod
-    def load_game(cls, filename: str | Path):
-        # Загрузка состояния игры из файла
+    def load_game(cls, filename: str | Path, **kwargs):
+        # Загрузка состояния игры из файла (контрольной точки) и повтор хвоста журнала ходов, если он есть
         with open(filename, 'r', encoding='utf-8') as fin:
             data = json.load(fin)  # Чтение данных из JSON-файла
-            game_state = GameState.load(data)  # Загрузка состояния игры
-            player_types = {
-                player: next(pt for pt in all_player_types if pt.__name__ == player_data['kind'])(player.name)
-                for player, player_data in zip(game_state.players, data['players'])
-            }
-            return cls(player_types=player_types, game_state=game_state)
+        game_state = GameState.load(data)  # Загрузка состояния игры
+        player_types = [
+            next(pt for pt in all_player_types if pt.__name__ == player_data['kind'])(
+                player.name, **({'table': player_data['table']} if 'table' in player_data else {}))
+            for player, player_data in zip(game_state.players, data['players'])
+        ]
+        for seat, player_data in enumerate(data['players']):
+            game_state.set_quit(seat, player_data.get('quit', False))
+        server = cls(player_types=player_types, game_state=game_state, **kwargs)
+        if 'phase' in data:
+            server.current_phase = GamePhase(data['phase'])
+        for _, op, *args in GameJournal.read_tail(filename, after_seq=data.get('seq', 0)):
+            server.current_phase = server.apply_record(op, *args)
+        return server
 
     def save(self, filename: str | Path):
         # Сохранение текущего состояния игры в файл
@@ -57,79 +177,192 @@ class GameServer:
     def save_to_dict(self):
         # Преобразование состояния игры в словарь для сохранения
         data = self.game_state.save()
-        for player_index, player in enumerate(self.player_types.keys()):
-            data['players'][player_index]['kind'] = self.player_types[player].__class__.__name__
+        data['phase'] = str(self.current_phase)
+        for player_index, (player, interaction) in enumerate(zip(self.game_state.players, self.interactions)):
+            data['players'][player_index]['kind'] = interaction.__class__.__name__
+            data['players'][player_index]['quit'] = player.quit
+            table = getattr(interaction, 'table', None)  # TableBot создаётся по пути к своей таблице
+            if table is not None:
+                data['players'][player_index]['table'] = str(table.path)
         return data
 
-    @classmethod
-    def new_game(cls, player_types: Dict[Player, PlayerInteraction]):
-        # Создание новой игры с заданными типами игроков
-        deck = Deck()  # Создание колоды
+    def attach_journal(self, filename: str | Path, **kwargs) -> GameJournal:
+        # Подключение журнала ходов: пишем контрольную точку, дальше каждый ход дописывается в журнал
+        self.journal = GameJournal(filename, **kwargs)
+        self.journal.checkpoint(self)
+        return self.journal
+
+    def attach_metrics(self, metrics=None):
+        # Подключение замеров времени фаз и обратных вызовов игроков; без замеров движок их не проверяет
+        from src.instrumentation import GameMetrics
+        if self.metrics is not None:
+            self.detach_metrics()
+        self.metrics = metrics if metrics is not None else GameMetrics()
+        self.metrics.install(self)
+        return self.metrics
+
+    def detach_metrics(self):
+        # Отключение замеров; собранные данные остаются в объекте замеров
+        if self.metrics is not None:
+            self.metrics.uninstall(self)
+            self.metrics = None
+
+    def attach_event_bus(self, event_bus: EventBus | None = None) -> EventBus:
+        # Подключение шины событий; без шины события не создаются
+        if self.event_bus is None or event_bus is not None:
+            self.event_bus = event_bus if event_bus is not None else EventBus()
+        return self.event_bus
+
+    def apply_record(self, op: str, *args) -> GamePhase:
+        # Повтор записи журнала при восстановлении партии; возвращает фазу после записи
+        game_state = self.game_state
+        if op == 'deal':
+            game_state.deck = Deck.load(args[0])
+            for seat in range(len(game_state.players)):
+                game_state.set_quit(seat, False)
+            game_state.deal_cards(self.INITIAL_HAND_SIZE)
+            return GamePhase.CHOOSE_CARD
+        if op == 'play':
+            card = LlamaCard(args[1])  # ход записан за текущего игрока args[0]
+            game_state.play_card(card)
+            return GamePhase.NEXT_PLAYER
+        if op == 'pass':
+            return GamePhase.NEXT_PLAYER
+        if op == 'stay':
+            return GamePhase.DRAW_EXTRA
+        if op == 'draw':
+            game_state.draw_card()
+            return GamePhase.CHOOSE_CARD_AGAIN
+        if op == 'quit':
+            game_state.set_quit(args[0], True)
+            return GamePhase.NEXT_PLAYER
+        if op == 'turn':
+            game_state.set_current_player(args[0])  # ход переходит к записанному месту (вышедшие пропущены)
+            return GamePhase.CHOOSE_CARD
+        if op == 'round_end':
+            return self.round_end()
+        raise ValueError(f"Unknown journal record {op!r}")
 
-        game_state = GameState(list(player_types.keys()), deck, deck.draw_card())  # Инициализация состояния игры
-        return cls(player_types, game_state)
+    @classmethod
+    def new_game(cls, player_types: Seats, seed: int | None = None, **kwargs):
+        # Создание новой игры с заданными типами игроков (словарь или пары игрок-интерфейс в порядке мест);
+        # seed задаёт тасование всех колод партии
+        rng = make_rng(seed)
+        deck = Deck(rng=rng)  # Создание перемешанной колоды
+
+        players, interactions = split_seats(player_types)
+        game_state = GameState(players, deck, None)  # Инициализация состояния игры
+        game_state.deal_cards(cls.INITIAL_HAND_SIZE)  # Раздаем карты всем игрокам
+        game_state.turn_top_card()  # Открываем верхнюю карту
+        return cls(interactions, game_state, rng=rng, **kwargs)
 
     def run(self):
         # Основной цикл игры
-        print("=== Игра началась! ===")
+        self.log.info("=== Игра началась! ===")
         while self.current_phase != GamePhase.GAME_END:
             self.run_one_step()
+        if self.event_bus is not None:
+            self.event_bus.flush()
 
     def round_begin(self):
         # Начало раунда, раздача карт
-        # Проверяем, загружена ли игра из JSON файла
-        if self.game_state.is_loaded_from_json:
-            return GamePhase.CHOOSE_CARD  # Если загружены из JSON, просто переходим к выбору карты
-        # Если руки пустые у текущего игрока, то надо сделать колоду, перемешать и раздавать карты
+        # Если руки пустые у текущего игрока, то надо сделать новую перемешанную колоду и раздать карты
+        # (загруженная из JSON партия с розданными картами продолжается без раздачи)
         current_player = self.game_state.current_player()
         if current_player.hand.is_empty():
-            deck = Deck()  # Создание колоды
-            deck.shuffle()
-            self.game_state.deck = deck
-            self.game_state.deal_cards()  # Раздаем карты всем игрокам
+            self.game_state.deck = Deck(rng=self.rng)  # Создание перемешанной колоды
+            if self.journal is not None:
+                self.journal.record('deal', self.game_state.deck.save())
+            for seat in range(len(self.game_state.players)):
+                self.game_state.set_quit(seat, False)  # выход из раунда действует только до конца раунда
+            self.game_state.deal_cards(self.INITIAL_HAND_SIZE)  # Раздаем карты всем игрокам
+            self.inform_all('inform_round_begin', self.game_state)
 
         return GamePhase.CHOOSE_CARD  # Переход к фазе выбора карты
 
     def round_end(self):
         # Конец раунда
-        for player in self.game_state.players:
+        if self.journal is not None:
+            self.journal.record('round_end')
+        self.rounds_played += 1
+        next_phase = GamePhase.BEGIN_ROUND  # Переход к началу нового раунда, новая колода создаётся при раздаче
+        for seat, player in enumerate(self.game_state.players):
             # Считаем очки игрока на основе его руки, учитывая только уникальные значения карт
             unique_values = set(card.value for card in player.hand.cards)  # Получаем уникальные значения
             player_score = sum(unique_values)  # Суммируем уникальные значения
-            player.score += player_score  # Добавляем очки к общему счету игрока
+            self.game_state.add_score(seat, player_score)  # Добавляем очки к общему счету игрока
             # Очищаем руку игрока
-            player.hand.clear()
+            self.game_state.clear_hand(seat)
             # Проверяем, если у игрока 40 или больше очков
             if player.score >= 40:
-                return GamePhase.DETERMINE_WINNER  # Конец игры, если у кого-то 40 или больше очков
-        # Делаем новую колоду и перемешиваем ее
-        self.game_state.deck = Deck()
-        self.game_state.deck.shuffle()
-        return GamePhase.BEGIN_ROUND  # Переход к началу нового раунда
+                next_phase = GamePhase.DETERMINE_WINNER  # Конец игры, если у кого-то 40 или больше очков
+                break
+        if self.event_bus is not None:
+            self.event_bus.publish(EventType.ROUND_END)  # после начисления очков
+        return next_phase
+
+    def compile_phases(self):
+        # Таблица фаза -> метод; пересобирается, когда методы фаз экземпляра подменяются (замеры)
+        self._phases = {phase: getattr(self, name) for phase, name in self.PHASE_METHODS.items()}
+        self._decision_requests = {
+            GamePhase.CHOOSE_CARD: self.choose_card_request,
+            GamePhase.CHOOSE_CARD_AGAIN: self.choose_card_again_request,
+        }
 
     def run_one_step(self):
         # Выполнение одного шага в зависимости от текущей фазы игры
-        phases = {
-            GamePhase.BEGIN_ROUND: self.round_begin,        # CHOOSE_CARD
-            GamePhase.CHOOSE_CARD: self.choose_card_phase,  # DRAW_EXTRA | NEXT_PLAYER
-            GamePhase.CHOOSE_CARD_AGAIN: self.choose_card_again_phase,  # NEXT_PLAYER
-            GamePhase.DRAW_EXTRA: self.draw_extra_phase,    # CHOOSE_CARD_AGAIN | NEXT_PLAYER
-            GamePhase.NEXT_PLAYER: self.next_player_phase,
-                # CHOOSE_CARD (следующий игрок пытается играть)
-                # NEXT_PLAYER (этот игрок в состоянии quit и идем к следующему игроку)
-                # END_ROUND (все игроки в состоянии quit)
-            GamePhase.END_ROUND: self.round_end,            # BEGIN_ROUND, DETERMINE_WINNER
-            GamePhase.DETERMINE_WINNER: self.determine_winner_phase,
-            GamePhase.DECLARE_WINNER: self.declare_winner_phase
-        }
-        self.current_phase = phases[self.current_phase]()  # Переход к следующей фазе
+        self._request = None
+        self.current_phase = self._phases[self.current_phase]()  # Переход к следующей фазе
+        if self.journal is not None and self.journal.needs_checkpoint:
+            self.journal.checkpoint(self)
+
+    def run_until_decision(self) -> DecisionRequest | None:
+        # Выполняет фазы без участия игроков (раздача, смена хода, конец раунда, ...) до ближайшего
+        # решения и возвращает его; игрок к этому моменту уже получил inform_game_state.
+        # None - партия окончена. Ответ передаётся в decide(ответ)
+        phases = self._phases
+        requests = self._decision_requests
+        while True:
+            phase = self.current_phase
+            if phase == GamePhase.GAME_END:
+                return None
+            build = requests.get(phase)
+            if build is None:
+                self.current_phase = phases[phase]()
+            else:
+                request = build()
+                if request is not None:
+                    self._request = request
+                    return request
+                self.current_phase = GamePhase.NEXT_PLAYER  # решать нечего - как в самой фазе
+            if self.journal is not None and self.journal.needs_checkpoint:
+                self.journal.checkpoint(self)
+
+    def play(self):
+        # Партия как генератор: выдаёт DecisionRequest, ответ игрока принимает через send(),
+        # по окончании возвращает победителя. Так один поток ведёт много партий вперемешку (src/scheduler.py)
+        while (request := self.run_until_decision()) is not None:
+            self.decide((yield request))
+        if self.event_bus is not None:
+            self.event_bus.flush()
+        return self.winner
+
+    def decide(self, answer):
+        # Завершает фазу решения, полученного от run_until_decision, с ответом игрока answer
+        request = self._request
+        if request is None:
+            raise RuntimeError(f"No decision pending in phase {self.current_phase}")
+        self._request = None
+        self.current_phase = self._phases[self.current_phase](request, answer)
+        if self.journal is not None and self.journal.needs_checkpoint:
+            self.journal.checkpoint(self)
 
     def determine_winner_phase(self) -> GamePhase:
         # Фаза определения победителя
         players = self.game_state.players
-        print("\nТекущие очки игроков:")
+        self.log.info("\nТекущие очки игроков:")
         for player in players:
-            print(f"{player.name}: {player.score}")  # Вывод очков каждого игрока
+            self.log.info("%s: %s", player.name, player.score)  # Вывод очков каждого игрока
 
         # Проверка, если кто-то достиг 40 очков
         if any(player.score >= 40 for player in players):
@@ -151,72 +384,122 @@ class GameServer:
 
     def declare_winner_phase(self, winner: Player) -> GamePhase:
         # Фаза объявления победителя
-        print(f"\n🎉 {winner.name} выиграл с результатом {winner.score}! 🎉")
-        post_event(CustomEvent.DECLARE_WINNER, player_index=self.game_state.current_player_index)
+        self.winner = winner
+        self.log.info("\n🎉 %s выиграл с результатом %s! 🎉", winner.name, winner.score)
+        if self.event_bus is not None:
+            self.event_bus.publish(EventType.WINNER, self.game_state.players.index(winner))
         return GamePhase.GAME_END
 
     def next_player_phase(self) -> GamePhase:
         # Фаза смены текущего игрока
         current_player = self.game_state.current_player()
-        print(f'{current_player.name}: {current_player.hand}')
+        self.log.info('%s: %s', current_player.name, current_player.hand)
 
         # если у текущего игрока пустая рука, то завершаем раунд и он победитель
         if current_player.hand.is_empty():
-            print(f'{current_player.name}: Сыграны все карты с руки')
+            self.log.info('%s: Сыграны все карты с руки', current_player.name)
             return GamePhase.END_ROUND  # Если у игрока нет карт, завершаем раунд
         # Проверяем, если все игроки в состоянии quit
-        if all(player.quit for player in self.game_state.players):
-            print(f'Все игроки QUIT')
+        if self.game_state.all_quit():
+            self.log.info('Все игроки QUIT')
             return GamePhase.END_ROUND  # Все игроки вышли, завершаем раунд
 
-        self.game_state.next_player()  # Переход к следующему игроку
-        print(f"\n=== Ход {self.game_state.current_player().name} ===")
+        self.game_state.next_active_player()  # Переход к следующему игроку, вышедшие пропускаются
+        if self.journal is not None:
+            self.journal.record('turn', self.game_state.current_player_index)
+        self.log.info("\n=== Ход %s ===", self.game_state.current_player().name)
         return GamePhase.CHOOSE_CARD  # Переход к фазе выбора карты
 
-    def choose_card_again_phase(self) -> GamePhase:
-        # Фаза повторного выбора карты
-        current_player = self.game_state.current_player()
-        playable_cards = current_player.hand.playable_cards(self.game_state.top)
-        if playable_cards:
-            card = playable_cards[0]
-            if self.player_types[current_player].choose_to_play(self.game_state.top, card):
-                current_player.hand.remove_card(card)  # Удаление карты из руки
-                self.game_state.top = card  # Обновление верхней карты
-                print(f'Игрок {current_player.name} сыграл {card}')
-                print(f'Top: {self.game_state.top}')
-
-                self.inform_all("inform_card_played", current_player, card)
-                post_event(CustomEvent.PLAY_CARD, card=card, player_index=self.game_state.current_player_index)
+    def choose_card_again_request(self) -> DecisionRequest | None:
+        # Решение фазы повторного выбора карты: играть ли первую играбельную карту; None - играть нечего
+        game_state = self.game_state
+        seat = game_state.current_player_index
+        current_player = game_state.players[seat]
+        playable_cards = current_player.hand.playable_cards(game_state.top)
+        if not playable_cards:
+            return None
+        interaction = self.interactions[seat]
+        interaction.inform_game_state(game_state, seat)
+        return DecisionRequest(seat, interaction, 'choose_to_play', (game_state.top, playable_cards[0]), playable_cards)
+
+    def choose_card_again_phase(self, request: DecisionRequest | None = None, answer=None) -> GamePhase:
+        # Фаза повторного выбора карты; request и answer - решение, полученное вне фазы (decide)
+        if request is None:
+            request = self.choose_card_again_request()
+            if request is None:
+                return GamePhase.NEXT_PLAYER
+            answer = self.ask(request.interaction, request.method, *request.args)
+        current_player = self.game_state.players[request.seat]
+        if answer:
+            card = request.playable_cards[0]
+            self.game_state.play_card(card)  # Карта из руки становится верхней
+            if self.journal is not None:
+                self.journal.record('play', request.seat, card.value)
+            self.log.info('Игрок %s сыграл %s', current_player.name, card)
+            self.log.info('Top: %s', self.game_state.top)
+
+            self.inform_all("inform_card_played", current_player, card)
+            if self.event_bus is not None:
+                self.event_bus.publish(EventType.PLAY, request.seat, card)
+        elif self.journal is not None:
+            self.journal.record('pass', request.seat)
         return GamePhase.NEXT_PLAYER
 
-    def choose_card_phase(self) -> GamePhase:
-        # Фаза выбора карты
-        current_player = self.game_state.current_player()
+    def choose_card_request(self) -> DecisionRequest | None:
+        # Решение фазы выбора карты: какую карту сыграть или, без играбельных карт, выйти ли из раунда;
+        # None - игрок уже вышел из раунда
+        game_state = self.game_state
+        seat = game_state.current_player_index
+        current_player = game_state.players[seat]
         # если игрок РАНЬШЕ решил закончить ход, то вместо игры карт, передаем ход другому игроку
         if current_player.quit:
-            print(f'Игрок {current_player.name} в состоянии QUIT, ход переходит следующему игроку.')
-            return GamePhase.NEXT_PLAYER
-
-        playable_cards = current_player.hand.playable_cards(self.game_state.top)
-        print(f"\nИгрок {current_player.name} {current_player.hand} может сыграть: {playable_cards} на {self.game_state.top}")
-
-        if not playable_cards:
+            self.log.info('Игрок %s в состоянии QUIT, ход переходит следующему игроку.', current_player.name)
+            return None
+
+        hand, top = current_player.hand, game_state.top
+        playable_cards = hand.playable_cards(top)
+        self.log.info("\nИгрок %s %s может сыграть: %s на %s", current_player.name, hand, playable_cards, top)
+
+        interaction = self.interactions[seat]
+        interaction.inform_game_state(game_state, seat)
+        method = 'choose_card' if playable_cards else 'choose_quit'
+        return DecisionRequest(seat, interaction, method, (hand, top), playable_cards)
+
+    def choose_card_phase(self, request: DecisionRequest | None = None, answer=None) -> GamePhase:
+        # Фаза выбора карты; request и answer - решение, полученное вне фазы (decide)
+        if request is None:
+            request = self.choose_card_request()
+            if request is None:
+                return GamePhase.NEXT_PLAYER
+            answer = self.ask(request.interaction, request.method, *request.args)
+        seat = request.seat
+        current_player = self.game_state.players[seat]
+        if request.method == 'choose_quit':
             # выбрали не тянуть карту, а закончить играть в этом раунде
-            if self.player_types[current_player].choose_quit(current_player.hand, self.game_state.top) : # Игрок выбирает карту:
-                current_player.quit = True
+            if answer:
+                self.game_state.set_quit(seat, True)
+                if self.journal is not None:
+                    self.journal.record('quit', seat)
+                if self.event_bus is not None:
+                    self.event_bus.publish(EventType.QUIT, seat)
                 return GamePhase.NEXT_PLAYER
-            print(f"Игрок {current_player.name} не может сыграть ни одной карты.")
+            self.log.info("Игрок %s не может сыграть ни одной карты.", current_player.name)
+            if self.journal is not None:
+                self.journal.record('stay', seat)
             return GamePhase.DRAW_EXTRA  # Переход к фазе вытягивания дополнительной карты
 
-        card = self.player_types[current_player].choose_card(current_player.hand,
-                                                             self.game_state.top)  # Игрок выбирает карту
-        if card and card in playable_cards:
-            current_player.hand.remove_card(card)  # Удаление карты из руки
-            self.game_state.top = card  # Обновление верхней карты
-            print(f'Игрок {current_player.name} сыграл {card}')
-            print(f'Top: {self.game_state.top}')
-            self.player_types[current_player].inform_card_played(current_player, card)
-            post_event(CustomEvent.PLAY_CARD, card=card, player_index=self.game_state.current_player_index)
+        card = answer
+        if card is not None and card in request.playable_cards:
+            self.game_state.play_card(card)  # Карта из руки становится верхней
+            if self.journal is not None:
+                self.journal.record('play', seat, card.value)
+            self.log.info('Игрок %s сыграл %s', current_player.name, card)
+            self.log.info('Top: %s', self.game_state.top)
+            self.inform_all("inform_card_played", current_player, card)
+            if self.event_bus is not None:
+                self.event_bus.publish(EventType.PLAY, seat, card)
+        elif self.journal is not None:
+            self.journal.record('pass', seat)
         return GamePhase.NEXT_PLAYER
 
     def draw_extra_phase(self) -> GamePhase:
@@ -224,18 +507,30 @@ class GameServer:
         current_player = self.game_state.current_player()
         drawn_card = self.game_state.draw_card()  # Вытягивание карты из колоды
         if drawn_card is None:
-            print("Колода пуста, ход пропущен.")
+            self.log.info("Колода пуста, ход пропущен.")
             # костыль: если колода пустая, то переходим в quit
-            current_player.quit = True
+            self.game_state.set_quit(self.game_state.current_player_index, True)
+            if self.journal is not None:
+                self.journal.record('quit', self.game_state.current_player_index)
+            if self.event_bus is not None:
+                self.event_bus.publish(EventType.QUIT, self.game_state.current_player_index)
             return GamePhase.NEXT_PLAYER
+        if self.journal is not None:
+            self.journal.record('draw', self.game_state.current_player_index, drawn_card.value)
+        if self.event_bus is not None:
+            self.event_bus.publish(EventType.DRAW, self.game_state.current_player_index, drawn_card)
 
-        self.player_types[current_player].inform_card_drawn(current_player, drawn_card)
-        print(f"Игрок {current_player.name} вытянул карту: {drawn_card}")
+        self.interactions[self.game_state.current_player_index].inform_card_drawn(current_player, drawn_card)
+        self.log.info("Игрок %s вытянул карту: %s", current_player.name, drawn_card)
         return GamePhase.CHOOSE_CARD_AGAIN
 
+    def ask(self, interaction: PlayerInteraction, method: str, *args):
+        # Решение игрока: choose_card, choose_quit или choose_to_play
+        return getattr(interaction, method)(*args)
+
     def inform_all(self, method: str, *args, **kwargs):
         # Информирование всех игроков о событии
-        for player in self.player_types.values():
+        for player in self.interactions:
             getattr(player, method)(*args, **kwargs)  # Вызов метода для каждого игрока
 
     def calculate_points(self, card):
@@ -289,8 +584,9 @@ def __main__():
     save_file = 'lama.json'
     server = GameServer.load_game(save_file) if os.path.exists(save_file) else GameServer.new_game(
         GameServer.get_players())
-    server.save(save_file)
+    server.attach_journal(save_file)  # контрольная точка и журнал ходов рядом с ней
     server.run()
+    server.journal.close()
 
 
 if __name__ == "__main__":
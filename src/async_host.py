@@ -0,0 +1,96 @@
+"""
+Асинхронный хост: много столов (GameServer) в одном цикле событий asyncio.
+
+    host = GameHost(move_timeout=30)
+    for players in tables:
+        host.add(GameServer.new_game(players, headless=True))
+    servers = asyncio.run(host.run())
+
+Столы ходят по очереди; решение игрока, которое надо ждать (асинхронные методы
+choose_*_async переопределены или игрок BLOCKING, например Human), не останавливает
+остальные столы. Стол ведёт партию генератором GameServer.play(): получает
+DecisionRequest (игрок к этому моменту уже знает состояние игры), дожидается ответа
+и передаёт его в партию, фаза при этом не выполняется заново. Если игрок не ответил
+за move_timeout секунд, ход делается за него запасным игроком (по умолчанию Bot).
+
+Ожидание блокирующего игрока в потоке при тайм-ауте не прерывается: поток закончится,
+когда игрок ответит, но ответ будет отброшен.
+"""
+import asyncio
+import typing
+
+from src.GameServer import GameServer, DecisionRequest
+from src.player_interaction import PlayerInteraction
+from src.player_interactions.ai_player import Bot
+
+DECISIONS = ('choose_card', 'choose_quit', 'choose_to_play')
+
+
+def needs_await(interaction: PlayerInteraction, method: str) -> bool:
+    """True, если решение method игрока нужно ждать в цикле событий, а не вызывать сразу."""
+    if interaction.BLOCKING:
+        return True
+    name = method + '_async'
+    return getattr(type(interaction), name, None) is not getattr(PlayerInteraction, name)
+
+
+class AsyncTable:
+    """Один стол: GameServer, решения которого ожидаются асинхронно."""
+    YIELD_EVERY = 64  # решений подряд без ожидания, после которых стол уступает цикл событий
+
+    def __init__(self, server: GameServer, move_timeout: float | None = None,
+                 fallback: PlayerInteraction | None = None):
+        self.server = server
+        self.move_timeout = move_timeout
+        self.fallback = fallback if fallback is not None else Bot('fallback')
+        self.timeouts = 0  # ходов, сделанных за игрока запасным игроком
+
+    async def _decide(self, request: DecisionRequest):
+        answer = getattr(request.interaction, request.method + '_async')(*request.args)
+        try:
+            return await asyncio.wait_for(answer, self.move_timeout)
+        except TimeoutError:
+            self.timeouts += 1
+            return getattr(self.fallback, request.method)(*request.args)
+
+    async def play(self) -> GameServer:
+        """Доигрывает партию до конца."""
+        game = self.server.play()
+        steps = 0
+        answer = None
+        while True:
+            try:
+                request = game.send(answer)
+            except StopIteration:
+                return self.server
+            if needs_await(request.interaction, request.method):
+                answer = await self._decide(request)
+                continue
+            answer = request.ask()
+            steps += 1
+            if steps % self.YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+
+
+class GameHost:
+    def __init__(self, move_timeout: float | None = None, fallback: PlayerInteraction | None = None):
+        self.move_timeout = move_timeout
+        self.fallback = fallback
+        self.tables: list[AsyncTable] = []
+
+    def add(self, server: GameServer) -> AsyncTable:
+        table = AsyncTable(server, self.move_timeout, self.fallback)
+        self.tables.append(table)
+        return table
+
+    async def run(self) -> list[GameServer]:
+        """Доигрывает все добавленные столы; результат - серверы в порядке добавления."""
+        return list(await asyncio.gather(*(table.play() for table in self.tables)))
+
+
+def run_tables(servers: typing.Iterable[GameServer], **kwargs) -> list[GameServer]:
+    """Синхронная обёртка: доигрывает все партии в одном цикле событий."""
+    host = GameHost(**kwargs)
+    for server in servers:
+        host.add(server)
+    return asyncio.run(host.run())
@@ -0,0 +1,180 @@
+"""
+Пакетный симулятор партий ботов на NumPy.
+
+N партий идут синхронно, состояние хранится в массивах: гистограммы рук (N, P, 7),
+колоды (N, 56) с размером колоды, верхние карты, очки и флаги quit. За одну итерацию
+каждая незавершённая партия делает один ход текущего игрока политикой Bot
+(играть первую играбельную карту, иначе тянуть карту и играть первую играбельную)
+и проходит проверки фазы NEXT_PLAYER / END_ROUND.
+
+Результаты совпадают с GameServer для тех же seed, если у игроков HistogramHand
+(Bot играет первую карту из playable_cards, а у HistogramHand это первое играбельное
+значение в порядке LlamaCard.VALUES). Колоды тасуются тем же алгоритмом, что и
+deck.shuffle_values, на тех же числах random() генератора make_rng(seed), поэтому
+раздачи совпадают карта в карту; из Python берутся только сами числа, а обмены
+выполняются в NumPy сразу для всех партий.
+"""
+import typing
+
+import numpy as np
+
+from src.card import LlamaCard, PLAYABLE_MASK, CARDS_BY_MASK
+from src.deck import make_rng
+
+N_VALUES = len(LlamaCard.VALUES)
+DECK_SIZE = N_VALUES * LlamaCard.COPIES
+WIN_SCORE = 40  # игра заканчивается, когда у кого-то 40 очков
+
+_BITS = 1 << np.arange(N_VALUES)
+_PLAYABLE = np.array(PLAYABLE_MASK, dtype=np.int64)
+# первое значение в маске в порядке LlamaCard.VALUES (как HistogramHand.playable_cards()[0])
+_FIRST = np.array([cards[0].value if cards else -1 for cards in CARDS_BY_MASK], dtype=np.intp)
+# очки за раунд как в GameServer.round_end: сумма различных значений карт (лама - 0)
+_POINTS = np.arange(N_VALUES)
+_ALL_VALUES = np.array([card.value for card in LlamaCard.all_cards()], dtype=np.intp)
+_SHUFFLE_DRAWS = range(DECK_SIZE - 1)
+
+
+class BatchResult:
+    """Итоги пакета партий: очки (N, P), индекс победителя (N,) и число сыгранных раундов (N,)."""
+    def __init__(self, scores: np.ndarray, winners: np.ndarray, rounds: np.ndarray):
+        self.scores = scores
+        self.winners = winners
+        self.rounds = rounds
+
+    def __len__(self):
+        return len(self.winners)
+
+
+class BatchSimulator:
+    def __init__(self, seeds: typing.Sequence[int], n_players: int, hand_size: int = 6):
+        n = len(seeds)
+        self.n_players = n_players
+        self.hand_size = hand_size
+        self.rngs = [make_rng(seed).random for seed in seeds]  # как в GameServer.new_game(seed=...)
+        self.counts = np.zeros((n, n_players, N_VALUES), dtype=np.int16)
+        self.decks = np.zeros((n, DECK_SIZE), dtype=np.intp)
+        self.deck_size = np.zeros(n, dtype=np.intp)
+        self.top = np.zeros(n, dtype=np.intp)
+        self.scores = np.zeros((n, n_players), dtype=np.int64)
+        self.quit = np.zeros((n, n_players), dtype=bool)
+        self.current = np.zeros(n, dtype=np.intp)
+        self.rounds = np.zeros(n, dtype=np.int64)
+        self.winners = np.full(n, -1, dtype=np.intp)
+        self.done = np.zeros(n, dtype=bool)
+
+        # раздача по кругу сверху колоды: k-я взятая карта лежит на позиции DECK_SIZE-1-k
+        # и достаётся игроку k % n_players
+        dealt = min(n_players * hand_size, DECK_SIZE)
+        order = np.arange(dealt)
+        self._deal_positions = DECK_SIZE - 1 - order
+        self._deal_players = order % n_players
+        self._dealt = dealt
+
+        # новая партия: раздача и открытая верхняя карта из той же колоды (GameServer.new_game)
+        games = np.arange(n)
+        self._deal(games)
+        self.deck_size -= 1
+        self.top[:] = self.decks[games, self.deck_size]
+
+    def _deal(self, games: np.ndarray):
+        """Новая перемешанная колода и раздача карт в партиях games."""
+        if not len(games):
+            return
+        # тасование Фишера-Йетса как в deck.shuffle_values, по всем партиям сразу
+        rngs = self.rngs
+        rands = np.array([[rand() for _ in _SHUFFLE_DRAWS] for rand in map(rngs.__getitem__, games)])
+        decks = np.tile(_ALL_VALUES, (len(games), 1))
+        rows = np.arange(len(games))
+        for step, i in enumerate(range(DECK_SIZE - 1, 0, -1)):
+            j = (rands[:, step] * (i + 1)).astype(np.intp)
+            swapped = decks[rows, j]
+            decks[rows, j] = decks[:, i]
+            decks[:, i] = swapped
+        self.decks[games] = decks
+        rows = np.repeat(games, self._dealt)
+        players = np.tile(self._deal_players, len(games))
+        np.add.at(self.counts, (rows, players, decks[:, self._deal_positions].ravel()), 1)
+        self.deck_size[games] = DECK_SIZE - self._dealt
+
+    def _turn(self, games: np.ndarray):
+        """Ход текущего игрока в партиях games (фазы CHOOSE_CARD, DRAW_EXTRA, CHOOSE_CARD_AGAIN)."""
+        players = self.current[games]
+        active = ~self.quit[games, players]  # вышедшие из раунда игроки пропускают ход
+        games, players = games[active], players[active]
+        mask = (self.counts[games, players] > 0) @ _BITS
+        playable = mask & _PLAYABLE[self.top[games]]
+        can_play = playable != 0
+
+        # нечего играть: тянем карту, а если колода пуста - выходим из раунда
+        drawing, draw_players, draw_mask = games[~can_play], players[~can_play], mask[~can_play]
+        empty = self.deck_size[drawing] == 0
+        self.quit[drawing[empty], draw_players[empty]] = True
+        drawing, draw_players, draw_mask = drawing[~empty], draw_players[~empty], draw_mask[~empty]
+        self.deck_size[drawing] -= 1
+        drawn = self.decks[drawing, self.deck_size[drawing]]
+        self.counts[drawing, draw_players, drawn] += 1
+        # после взятия играется первая играбельная карта руки (не обязательно взятая)
+        again = (draw_mask | (1 << drawn)) & _PLAYABLE[self.top[drawing]]
+        play_again = again != 0
+
+        play_games = np.concatenate([games[can_play], drawing[play_again]])
+        play_players = np.concatenate([players[can_play], draw_players[play_again]])
+        values = _FIRST[np.concatenate([playable[can_play], again[play_again]])]
+        self.counts[play_games, play_players, values] -= 1
+        self.top[play_games] = values
+
+    def _next_player(self, games: np.ndarray):
+        """Фаза NEXT_PLAYER: конец раунда или передача хода."""
+        players = self.current[games]
+        hand_empty = self.counts[games, players].sum(axis=1) == 0
+        all_quit = self.quit[games].all(axis=1)
+        end = hand_empty | all_quit
+        moving = games[~end]
+        self.current[moving] = (self.current[moving] + 1) % self.n_players
+        self._round_end(games[end])
+
+    def _round_end(self, games: np.ndarray):
+        """Фаза END_ROUND: подсчёт очков, затем конец игры или новый раунд."""
+        if not len(games):
+            return
+        self.rounds[games] += 1
+        scores = self.scores[games]
+        new_scores = scores + (self.counts[games] > 0) @ _POINTS
+        # как в GameServer.round_end: очки начисляются по порядку, пока кто-то не наберёт 40
+        hit = new_scores >= WIN_SCORE
+        game_over = hit.any(axis=1)
+        last_scored = np.where(game_over, hit.argmax(axis=1), self.n_players - 1)
+        scored = np.arange(self.n_players) <= last_scored[:, None]
+        self.scores[games] = np.where(scored, new_scores, scores)
+
+        finished = games[game_over]
+        self._determine_winner(finished)
+        playing = games[~game_over]
+        self.counts[playing] = 0
+        self.quit[playing] = False  # выход из раунда действует только до конца раунда
+        self._deal(playing)
+
+    def _determine_winner(self, games: np.ndarray):
+        """Фаза DETERMINE_WINNER: первый игрок с наименьшим счётом среди набравших меньше 40."""
+        scores = self.scores[games]
+        below = scores < WIN_SCORE
+        masked = np.where(below, scores, np.iinfo(scores.dtype).max)
+        self.winners[games] = np.where(below.any(axis=1), masked.argmin(axis=1), scores.argmin(axis=1))
+        self.done[games] = True
+
+    def step(self):
+        """Один ход во всех незавершённых партиях."""
+        games = np.flatnonzero(~self.done)
+        self._turn(games)
+        self._next_player(games)
+
+    def run(self) -> BatchResult:
+        while not self.done.all():
+            self.step()
+        return BatchResult(self.scores.copy(), self.winners.copy(), self.rounds.copy())
+
+
+def simulate(seeds: typing.Sequence[int], n_players: int, hand_size: int = 6) -> BatchResult:
+    """Играет партии ботов для каждого seed и возвращает их итоги."""
+    return BatchSimulator(seeds, n_players, hand_size).run()
@@ -3,22 +3,50 @@ from typing import Self
 class LlamaCard:
     VALUES = list(range(1, 7)) + [0]  # возможные значения карт (1-6 и 0 для "Ламы")
     LLAMA = 0  # значение для карты "Лама"
+    COPIES = 8  # количество карт каждого значения в колоде
 
-    def __init__(self, value: int):
+    # Карта неизменяема и хранит только значение; на каждое значение существует
+    # ровно один общий экземпляр (см. CARDS ниже), поэтому LlamaCard(3) не создаёт объект.
+    __slots__ = ('value',)
+
+    def __new__(cls, value: int):
         """value (int): Номинальное значение карты."""
-        # инициализация карты с проверкой значения
-        if value not in LlamaCard.VALUES:
+        # возвращаем общий экземпляр с проверкой значения
+        if not isinstance(value, int) or not 0 <= value < len(CARDS):
             raise ValueError
-        self.value = value
+        return CARDS[value]
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        # при распаковке (pickle, copy) возвращается тот же общий экземпляр
+        return LlamaCard, (self.value,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __repr__(self):
         return str(self.value)
 
     def __eq__(self, other):
-        # сравнение карт
+        # сравнение карт: экземпляры общие, поэтому карты равны только сами себе;
+        # с int сравниваем значение без создания временной карты
+        if other.__class__ is LlamaCard:
+            return self is other
         if isinstance(other, int):
-            other = LlamaCard(value=other)
-        return self.value == other.value
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self):
+        # совпадает с hash(int), так как карта равна своему значению
+        return self.value
 
     def __lt__(self, other):
         return self.value < other.value
@@ -28,24 +56,18 @@ class LlamaCard:
 
     @staticmethod
     def load(text: str):
-        return LlamaCard(value=int(text))
+        card = _CARDS_BY_TEXT.get(text)
+        if card is None:
+            card = LlamaCard(value=int(text))
+        return card
 
     def can_play_on(self, other: Self) -> bool:
-        if self.value == other.value or self.value == other.value + 1:
-            return True
-        if self.value == LlamaCard.LLAMA:
-            return other.value == 6 or other.value == LlamaCard.LLAMA
-        if other.value == LlamaCard.LLAMA:
-            return self.value == 1 or self.value == LlamaCard.LLAMA
-        return False
+        return CAN_PLAY_ON[self.value][other.value]
 
     @staticmethod
     def all_cards():
-        # создание всех возможных карт
-        cards = []
-        for val in LlamaCard.VALUES:
-            cards.extend([LlamaCard(value=val) for _ in range(8)])  # Создаем 8 карт для каждого значения
-        return cards
+        # все карты колоды: общие экземпляры, по 8 на каждое значение
+        return list(_ALL_CARDS)
 
     def score(self, cards):
         """
@@ -63,3 +85,39 @@ class LlamaCard:
             return 0
         else:  # В противном случае возвращаем номинальное значение карты
             return self.value
+
+
+def _can_play_on_rule(value: int, top: int) -> bool:
+    # правила игры: то же значение или на 1 больше; лама на 6 или на ламу; 1 на ламу
+    if value == top or value == top + 1:
+        return True
+    if value == LlamaCard.LLAMA:
+        return top == 6 or top == LlamaCard.LLAMA
+    if top == LlamaCard.LLAMA:
+        return value == 1 or value == LlamaCard.LLAMA
+    return False
+
+
+def _make_card(value: int) -> LlamaCard:
+    card = object.__new__(LlamaCard)
+    object.__setattr__(card, 'value', value)
+    return card
+
+
+# Общие экземпляры карт: CARDS[value]
+CARDS: tuple[LlamaCard, ...] = tuple(_make_card(value) for value in range(len(LlamaCard.VALUES)))
+_CARDS_BY_TEXT = {str(card.value): card for card in CARDS}
+_ALL_CARDS = tuple(CARDS[value] for value in LlamaCard.VALUES for _ in range(LlamaCard.COPIES))
+
+# Таблица допустимых ходов, строится один раз из правил: CAN_PLAY_ON[value][top]
+CAN_PLAY_ON: tuple[tuple[bool, ...], ...] = tuple(
+    tuple(_can_play_on_rule(value, top) for top in range(len(CARDS))) for value in range(len(CARDS))
+)
+# PLAYABLE_MASK[top] - битовая маска значений (бит value), которые можно сыграть на top
+PLAYABLE_MASK: tuple[int, ...] = tuple(
+    sum(1 << value for value in range(len(CARDS)) if CAN_PLAY_ON[value][top]) for top in range(len(CARDS))
+)
+# CARDS_BY_MASK[mask] - карты, значения которых входят в маску, в порядке LlamaCard.VALUES
+CARDS_BY_MASK: tuple[tuple[LlamaCard, ...], ...] = tuple(
+    tuple(CARDS[value] for value in LlamaCard.VALUES if mask >> value & 1) for mask in range(1 << len(CARDS))
+)
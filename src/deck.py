@@ -1,14 +1,84 @@
 import random
 import typing
-from src.card import LlamaCard
+from src.card import LlamaCard, CARDS
+
+# Значения всех карт новой колоды в порядке LlamaCard.all_cards()
+_ALL_VALUES = bytes(card.value for card in LlamaCard.all_cards())
+
+
+def make_rng(seed: int | None = None) -> random.Random:
+    """
+    Создаёт собственный генератор случайных чисел для колоды или партии.
+    Без seed генератор инициализируется из глобального random, поэтому random.seed()
+    по-прежнему делает партии воспроизводимыми.
+    """
+    if seed is None:
+        seed = random.getrandbits(64)
+    return random.Random(seed)
+
+
+def shuffle_values(values: bytearray, size: int, rng: random.Random):
+    """
+    Перемешивает первые size значений (тасование Фишера-Йетса). Берёт ровно size - 1
+    чисел rng.random(), по одному на позицию от size - 1 до 1: этот поток чисел
+    воспроизводит пакетный симулятор (src/batch_sim.py).
+    """
+    rand = rng.random
+    for i in range(size - 1, 0, -1):
+        j = int(rand() * (i + 1))
+        values[i], values[j] = values[j], values[i]
+
 
 class Deck:
-    def __init__(self, cards: typing.Optional[list[LlamaCard]] = None):
+    """
+    Колода хранит значения карт в bytearray; _size - курсор: карты с индексами
+    0.._size-1 ещё в колоде, верхняя карта - последняя. Взятие карты только сдвигает курсор.
+    """
+    def __init__(self, cards: typing.Optional[list[LlamaCard]] = None, rng: random.Random | None = None):
+        self._rng = rng
         if cards is None:
             # создание новой колоды
-            cards = LlamaCard.all_cards()
-            random.shuffle(cards)
-        self.cards: list[LlamaCard] = cards
+            values = bytearray(_ALL_VALUES)
+            shuffle_values(values, len(values), self.rng)
+        else:
+            values = bytearray(card.value for card in cards)
+        self._values: bytearray = values
+        self._size: int = len(values)
+
+    @classmethod
+    def from_values(cls, values: bytes, rng: random.Random | None = None) -> typing.Self:
+        """Создаёт колоду из значений карт (нижняя карта первая)."""
+        deck = cls([], rng=rng)
+        deck._values = bytearray(values)
+        deck._size = len(values)
+        return deck
+
+    @property
+    def rng(self) -> random.Random:
+        """Генератор случайных чисел колоды; создаётся при первом перемешивании."""
+        if self._rng is None:
+            self._rng = make_rng()
+        return self._rng
+
+    @property
+    def cards(self) -> list[LlamaCard]:
+        """Карты, оставшиеся в колоде (верхняя карта последняя)."""
+        values = self._values
+        return [CARDS[values[i]] for i in range(self._size)]
+
+    @property
+    def values(self) -> bytes:
+        """Значения карт, оставшихся в колоде (верхняя карта последняя)."""
+        return bytes(self._values[:self._size])
+
+    def __len__(self):
+        return self._size
+
+    def value(self, pos: int) -> int:
+        """Значение карты на позиции pos (0 - нижняя карта, len - 1 - верхняя)."""
+        if not 0 <= pos < self._size:
+            raise IndexError(pos)
+        return self._values[pos]
 
     def __repr__(self):
         return self.save()
@@ -16,30 +86,50 @@ class Deck:
     def __eq__(self, other):
         if isinstance(other, str):
             other = Deck.load(other)
-        return self.cards == other.cards
+        return self._values[:self._size] == other._values[:other._size]
 
     def save(self) -> str:
         """Сохраняет колоду в строковом формате."""
-        scards = [c.save() for c in self.cards]
-        return " ".join(scards)
+        values = self._values
+        return " ".join([str(values[i]) for i in range(self._size)])
 
     @classmethod
     def load(cls, text: str) -> typing.Self:
         """Загружает колоду из строкового формата."""
-        cards = [LlamaCard.load(s) for s in text.split()]
-        return cls(cards=cards)
+        return cls.from_values(bytes(LlamaCard.load(s).value for s in text.split()))
 
     def draw_card(self) -> LlamaCard:
         """Берет карту из колоды и возвращает её. Если колода пуста, выбрасывает исключение."""
-        if not self.cards:
+        if not self._size:
             raise ValueError("Cannot draw from an empty deck.")
-        return self.cards.pop()
+        self._size -= 1
+        return CARDS[self._values[self._size]]
+
+    def undraw(self):
+        """Возвращает на верх колоды последнюю взятую карту (отмена draw_card)."""
+        if self._size == len(self._values):
+            raise ValueError("No drawn card to return.")
+        self._size += 1
+
+    def deal(self, n_players: int, n_cards: int) -> list[list[LlamaCard]]:
+        """
+        Раздаёт по n_cards карт n_players игрокам за одну операцию, в том же порядке,
+        что и поочерёдное взятие карт по кругу. Если карт не хватает, раздаёт сколько есть.
+        """
+        total = min(n_players * n_cards, self._size)
+        start = self._size - total
+        block = self._values[start:self._size]
+        self._size = start
+        # k-я по счёту взятая карта - block[total - 1 - k], она достаётся игроку k % n_players
+        return [
+            [CARDS[v] for v in block[total - 1 - p::-n_players]] if p < total else []
+            for p in range(n_players)
+        ]
 
     def shuffle(self):
         """Перемешивает карты в колоде."""
-        random.shuffle(self.cards)
+        shuffle_values(self._values, self._size, self.rng)
 
     def is_empty(self) -> bool:
         """Проверяет, пуста ли колода."""
-        return len(self.cards) == 0
-
+        return self._size == 0
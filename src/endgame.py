@@ -0,0 +1,248 @@
+"""
+Точное решение конца раунда.
+
+EndgameSolver перебирает оставшееся дерево раунда: ходы игроков и случайные взятия
+из колоды (ожидание по составу колоды, порядок карт неизвестен). Каждый игрок
+минимизирует свои очки за раунд (max^n), очки считаются как в GameServer.round_end.
+Результаты хранятся в таблице с вытеснением давно не использованных позиций (LRU).
+Ключ позиции канонический: игроки перечислены начиная с того, кто ходит, поэтому одна
+и та же расстановка у разных мест стола - одна запись.
+
+EndgameMixin подключает решатель к любому PlayerInteraction: когда в колоде и на руках
+мало карт, решения choose_card, choose_quit и choose_to_play принимаются точно
+(с усреднением по случайным расстановкам чужих рук), иначе - методами базового класса.
+"""
+import collections
+import typing
+
+from src.card import LlamaCard, CARDS, PLAYABLE_MASK
+from src.deck import make_rng
+from src.player import Player
+from src.simulation import (N_VALUES, VALUES_BY_MASK, FIRST_BY_MASK, RoundSim, hand_histogram, determinize,
+                            unseen_counts, CARD, QUIT_OR_DRAW, AGAIN, QUIT, DRAW, PLAY, PASS)
+
+# Внутри решателя рука - одно целое: по 4 бита на число карт каждого значения
+# и бит QUIT_BIT - игрок вышел из раунда; состав колоды упакован так же.
+# В конце раунда карт одного значения на руке и в колоде не больше 15.
+QUIT_BIT = 1 << 4 * N_VALUES
+_CARDS_FIELD = QUIT_BIT - 1
+_ONE = tuple(1 << 4 * v for v in range(N_VALUES))
+# маска значений по упакованной руке: ненулевые тетрады -> биты, по 4 тетрады за раз
+_NIBBLE_MASK = {sum(1 << 4 * i for i in range(4) if m >> i & 1): m for m in range(16)}
+_NONZERO = sum(1 << 4 * v for v in range(N_VALUES))
+_POINTS_BY_MASK = tuple(sum(v for v in range(N_VALUES) if m >> v & 1) for m in range(1 << N_VALUES))
+
+Hands = tuple[int, ...]
+
+
+def pack(counts: typing.Sequence[int]) -> int:
+    packed = 0
+    for value in range(N_VALUES):
+        packed |= counts[value] << 4 * value
+    return packed
+
+
+def _mask(packed: int) -> int:
+    x = packed & _CARDS_FIELD
+    nonzero = (x | x >> 1 | x >> 2 | x >> 3) & _NONZERO
+    return _NIBBLE_MASK[nonzero & 0xFFFF] | _NIBBLE_MASK[nonzero >> 16] << 4
+
+
+class EndgameSolver:
+    def __init__(self, max_entries: int = 500_000):
+        self.max_entries = max_entries
+        self.table: collections.OrderedDict[tuple, tuple[float, ...]] = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.table.clear()
+        self.hits = self.misses = 0
+
+    def action_values(self, kind: int, hands: typing.Sequence[typing.Sequence[int]], deck: typing.Sequence[int],
+                      top: int, quit: typing.Sequence[bool], seat: int) -> dict[int, float]:
+        """
+        Ожидаемые очки игрока seat за раунд для каждого его действия в решении вида kind.
+        :param hands: Гистограммы рук всех игроков.
+        :param deck: Состав колоды: deck[value] - число карт значения value.
+        """
+        packed = self._pack_hands(hands, quit, seat)
+        phase = AGAIN if kind == AGAIN else CARD
+        deck = pack(deck)
+        return {action: self._action_value(action, top, deck, packed)[0]
+                for action in self._actions(phase, top, packed)}
+
+    def values(self, sim: RoundSim) -> list[float]:
+        """Ожидаемые очки всех игроков за раунд с начала хода текущего игрока (колода - только состав)."""
+        n = len(sim.counts)
+        deck = [0] * N_VALUES
+        for value in sim.deck:
+            deck[value] += 1
+        result = self._solve(CARD, sim.top, pack(deck), self._pack_hands(sim.counts, sim.quit, sim.current))
+        return [result[(seat - sim.current) % n] for seat in range(n)]
+
+    @staticmethod
+    def _pack_hands(hands, quit, seat: int) -> Hands:
+        # канонический порядок: начиная с игрока seat
+        n = len(hands)
+        order = [(seat + i) % n for i in range(n)]
+        return tuple(pack(hands[i]) | (QUIT_BIT if quit[i] else 0) for i in order)
+
+    # --- перебор; позиция всегда с точки зрения ходящего (места 0) ---
+
+    @staticmethod
+    def _actions(phase: int, top: int, hands: Hands) -> tuple[int, ...]:
+        hand = hands[0]
+        playable = _mask(hand) & PLAYABLE_MASK[top]
+        if phase == AGAIN:
+            return (PLAY, PASS) if playable else (PASS,)
+        if hand & QUIT_BIT:
+            return (PASS,)  # вышедший игрок пропускает ход
+        if playable:
+            return VALUES_BY_MASK[playable]
+        return DRAW, QUIT
+
+    def _solve(self, phase: int, top: int, deck: int, hands: Hands) -> tuple[float, ...]:
+        key = (phase, top, deck, hands)
+        table = self.table
+        values = table.get(key)
+        if values is not None:
+            table.move_to_end(key)
+            self.hits += 1
+            return values
+        self.misses += 1
+        for action in self._actions(phase, top, hands):
+            result = self._action_value(action, top, deck, hands)
+            if values is None or result[0] < values[0]:
+                values = result
+        table[key] = values
+        if len(table) > self.max_entries:
+            table.popitem(last=False)
+        return values
+
+    def _action_value(self, action: int, top: int, deck: int, hands: Hands) -> tuple[float, ...]:
+        hand = hands[0]
+        if action < N_VALUES:
+            return self._end_turn(action, deck, (hand - _ONE[action],) + hands[1:])
+        if action == PLAY:
+            value = FIRST_BY_MASK[_mask(hand) & PLAYABLE_MASK[top]]
+            return self._end_turn(value, deck, (hand - _ONE[value],) + hands[1:])
+        if action == PASS:
+            return self._end_turn(top, deck, hands)
+        if action == QUIT or not deck:  # из пустой колоды взять нельзя - игрок выходит
+            return self._end_turn(top, deck, (hand | QUIT_BIT,) + hands[1:])
+        # DRAW: ожидание по значению взятой карты
+        counts = [deck >> 4 * value & 15 for value in range(N_VALUES)]
+        total = sum(counts)
+        expected = [0.0] * len(hands)
+        for value, count in enumerate(counts):
+            if not count:
+                continue
+            one = _ONE[value]
+            result = self._solve(AGAIN, top, deck - one, (hand + one,) + hands[1:])
+            p = count / total
+            for i, v in enumerate(result):
+                expected[i] += p * v
+        return tuple(expected)
+
+    def _end_turn(self, top: int, deck: int, hands: Hands) -> tuple[float, ...]:
+        # фаза NEXT_PLAYER: конец раунда или ход следующего игрока
+        if not hands[0] & _CARDS_FIELD or all(hand & QUIT_BIT for hand in hands):
+            return tuple(_POINTS_BY_MASK[_mask(hand)] for hand in hands)
+        result = self._solve(CARD, top, deck, hands[1:] + hands[:1])
+        return result[-1:] + result[:-1]
+
+
+_shared_solver: EndgameSolver | None = None
+
+
+def shared_solver() -> EndgameSolver:
+    """Общий решатель процесса: позиции, повторяющиеся в разных партиях, берутся из его таблицы."""
+    global _shared_solver
+    if _shared_solver is None:
+        _shared_solver = EndgameSolver()
+    return _shared_solver
+
+
+class EndgameMixin:
+    """
+    Примесь к PlayerInteraction: точные решения в конце раунда.
+
+        class EndgameBot(EndgameMixin, Bot): ...
+
+    Решатель включается, когда в колоде не больше ENDGAME_DECK карт и на руках у всех
+    вместе не больше ENDGAME_HAND_CARDS карт. Чужие руки неизвестны, поэтому ожидаемые
+    очки каждого действия усредняются по ENDGAME_SAMPLES случайным расстановкам
+    невидимых карт (как в MCTSBot).
+    """
+    ENDGAME_DECK = 4
+    ENDGAME_HAND_CARDS = 12
+    ENDGAME_SAMPLES = 8
+    endgame_solver: EndgameSolver | None = None  # None - общий решатель процесса
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._endgame_rng = make_rng()
+        self._endgame_played = [0] * N_VALUES  # карты, сыгранные в текущем раунде
+        self._endgame_state = None
+        self._endgame_seat = 0
+
+    def inform_round_begin(self, game_state):
+        self._endgame_played = [0] * N_VALUES
+        super().inform_round_begin(game_state)
+
+    def inform_game_state(self, game_state, seat: int):
+        self._endgame_state = game_state
+        self._endgame_seat = seat
+        super().inform_game_state(game_state, seat)
+
+    def inform_card_played(self, player: Player, card: LlamaCard):
+        self._endgame_played[card.value] += 1
+        super().inform_card_played(player, card)
+
+    def choose_card(self, hand, top: LlamaCard, *args, **kwargs):
+        action = self.endgame_action(CARD)
+        if action is None or action >= N_VALUES:
+            return super().choose_card(hand, top, *args, **kwargs)
+        return CARDS[action]
+
+    def choose_quit(self, hand, top: LlamaCard, *args, **kwargs) -> bool:
+        action = self.endgame_action(QUIT_OR_DRAW)
+        if action is None:
+            return super().choose_quit(hand, top, *args, **kwargs)
+        return action == QUIT
+
+    def choose_to_play(self, top: LlamaCard, drawn: LlamaCard) -> bool:
+        action = self.endgame_action(AGAIN)
+        if action is None:
+            return super().choose_to_play(top, drawn)
+        return action == PLAY
+
+    def endgame_action(self, kind: int) -> int | None:
+        """Лучшее действие по решателю или None, если позиция ещё не эндшпиль."""
+        game_state = self._endgame_state
+        if game_state is None:
+            return None
+        players = game_state.players
+        sizes = [len(p.hand) for p in players]
+        deck_size = len(game_state.deck)
+        if deck_size > self.ENDGAME_DECK or sum(sizes) > self.ENDGAME_HAND_CARDS:
+            return None
+        seat = self._endgame_seat
+        own = hand_histogram(players[seat].hand)
+        top = game_state.top.value
+        quit = [p.quit for p in players]
+        solver = self.endgame_solver if self.endgame_solver is not None else shared_solver()
+        unseen = unseen_counts(own, self._endgame_played)
+        totals: dict[int, float] = {}
+        for _ in range(self.ENDGAME_SAMPLES):
+            sim = determinize(seat, own, sizes, deck_size, unseen, top, seat, quit, self._endgame_rng)
+            deck = [0] * N_VALUES
+            for value in sim.deck:
+                deck[value] += 1
+            values = solver.action_values(kind, sim.counts, deck, top, quit, seat)
+            if len(values) == 1:
+                return next(iter(values))
+            for action, value in values.items():
+                totals[action] = totals.get(action, 0.0) + value
+        return min(totals, key=totals.__getitem__)
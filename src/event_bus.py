@@ -0,0 +1,105 @@
+"""
+Шина событий партии внутри процесса: GameServer публикует, интерфейс и другие потребители подписываются.
+
+    bus = server.attach_event_bus()
+    bus.subscribe(on_play, EventType.PLAY)    # сразу на каждое событие
+    bus.subscribe_batch(on_tick)              # пачкой при flush(), например раз в кадр
+
+Записи событий GameEvent заранее созданы и используются повторно, поэтому запись
+действительна только внутри обратного вызова; сохранить её можно через copy().
+Если flush() долго не вызывается, пачка доставляется досрочно, когда заполнится буфер:
+события не теряются и не копятся без предела. Пока подписчиков нет, publish почти ничего не стоит.
+"""
+import enum
+import typing
+
+from src.card import LlamaCard
+
+
+class EventType(enum.IntEnum):
+    PLAY = 0        # игрок сыграл карту
+    DRAW = 1        # игрок взял карту из колоды
+    QUIT = 2        # игрок вышел из раунда
+    ROUND_END = 3   # раунд окончен, очки начислены
+    WINNER = 4      # объявлен победитель партии
+
+
+class GameEvent:
+    __slots__ = ('type', 'player_index', 'card', 'seq')
+
+    def __init__(self, event_type: EventType = EventType.PLAY, player_index: int = -1,
+                 card: LlamaCard | None = None, seq: int = 0):
+        self.type = event_type
+        self.player_index = player_index  # -1 - событие не относится к игроку
+        self.card = card
+        self.seq = seq  # номер события на шине
+
+    def copy(self) -> typing.Self:
+        return GameEvent(self.type, self.player_index, self.card, self.seq)
+
+    def __eq__(self, other):
+        return (isinstance(other, GameEvent) and self.type == other.type
+                and self.player_index == other.player_index and self.card == other.card)
+
+    def __repr__(self):
+        return f"GameEvent({self.type.name}, player_index={self.player_index}, card={self.card}, seq={self.seq})"
+
+
+Listener = typing.Callable[[GameEvent], None]
+BatchListener = typing.Callable[[list[GameEvent]], None]
+
+
+class EventBus:
+    def __init__(self, capacity: int = 256):
+        # два буфера записей: пока подписчики читают одну пачку, новые события пишутся в другой
+        self._records = [GameEvent() for _ in range(capacity)]
+        self._spare = [GameEvent() for _ in range(capacity)]
+        self._size = 0
+        self._listeners: list[list[Listener]] = [[] for _ in EventType]
+        self._batch_listeners: list[BatchListener] = []
+        self.seq = 0  # событий опубликовано
+
+    def subscribe(self, listener: Listener, *types: EventType):
+        """Подписка на события указанных типов (без типов - на все)."""
+        for event_type in types or EventType:
+            self._listeners[event_type].append(listener)
+
+    def unsubscribe(self, listener: Listener | BatchListener):
+        for listeners in self._listeners:
+            while listener in listeners:
+                listeners.remove(listener)
+        while listener in self._batch_listeners:
+            self._batch_listeners.remove(listener)
+
+    def subscribe_batch(self, listener: BatchListener):
+        """Подписка на пачки событий, накопленных между вызовами flush()."""
+        self._batch_listeners.append(listener)
+
+    def publish(self, event_type: EventType, player_index: int = -1, card: LlamaCard | None = None):
+        self.seq += 1
+        listeners = self._listeners[event_type]
+        batched = bool(self._batch_listeners)
+        if not listeners and not batched:
+            return
+        if self._size == len(self._records):
+            self.flush()
+        record = self._records[self._size]
+        record.type = event_type
+        record.player_index = player_index
+        record.card = card
+        record.seq = self.seq
+        if batched:
+            self._size += 1
+        for listener in listeners:
+            listener(record)
+
+    def flush(self):
+        """Доставляет накопленную пачку подписчикам subscribe_batch (вызывается раз в такт)."""
+        size = self._size
+        if not size:
+            return
+        batch = self._records[:size]
+        self._records, self._spare = self._spare, self._records
+        self._size = 0
+        for listener in self._batch_listeners:
+            listener(batch)
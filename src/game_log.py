@@ -0,0 +1,60 @@
+import enum
+from typing import Callable
+
+
+class LogLevel(enum.IntEnum):
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    OFF = 100  # ничего не выводить
+
+
+class GameLog:
+    """
+    Приёмник сообщений игрового движка. Пропускает сообщения с уровнем не ниже level
+    и передаёт их в write (по умолчанию print). Сообщение форматируется (msg % args)
+    только если оно будет выведено.
+    """
+    def __init__(self, level: LogLevel = LogLevel.INFO, write: Callable[[str], None] = print):
+        self.level = level
+        self.write = write
+
+    def enabled(self, level: LogLevel) -> bool:
+        return level >= self.level
+
+    def log(self, level: LogLevel, msg: str, *args):
+        if level >= self.level:
+            self.write(msg % args if args else msg)
+
+    def debug(self, msg: str, *args):
+        if LogLevel.DEBUG >= self.level:
+            self.write(msg % args if args else msg)
+
+    def info(self, msg: str, *args):
+        if LogLevel.INFO >= self.level:
+            self.write(msg % args if args else msg)
+
+    def warning(self, msg: str, *args):
+        if LogLevel.WARNING >= self.level:
+            self.write(msg % args if args else msg)
+
+
+class NullLog(GameLog):
+    """Приёмник, который ничего не выводит: для безголового режима."""
+    def __init__(self):
+        super().__init__(LogLevel.OFF)
+
+    def log(self, level: LogLevel, msg: str, *args):
+        pass
+
+    def debug(self, msg: str, *args):
+        pass
+
+    def info(self, msg: str, *args):
+        pass
+
+    def warning(self, msg: str, *args):
+        pass
+
+
+NULL_LOG = NullLog()
@@ -1,16 +1,323 @@
+import hashlib
+import random
+import struct
 from src.player import Player  # Импортируйте класс Player
+from src.hand import Hand  # Импортируйте класс Hand
 from src.deck import Deck  # Импортируйте класс Deck
-from src.card import LlamaCard  # Импортируйте класс LlamaCard
+from src.card import LlamaCard, CARDS, PLAYABLE_MASK  # Импортируйте класс LlamaCard
+from src.simulation import QUIT, DRAW, PASS, VALUES_BY_MASK
+
+# Бинарный формат снимка состояния (см. GameState.to_bytes):
+#   заголовок: версия, число игроков, индекс текущего игрока, верхняя карта (0x0F - нет), размер колоды;
+#   битовая маска quit игроков ((n + 7) // 8 байт);
+#   для каждого игрока: очки (uint16), число карт в руке, длина имени и имя в UTF-8;
+#   карты колоды, затем карты рук игроков - по 4 бита на карту, старшая тетрада первая.
+_BINARY_VERSION = 1
+_HEADER = struct.Struct('<BBBBB')
+_PLAYER = struct.Struct('<HBB')
+_NO_CARD = 0x0F
+_NIBBLES = [bytes((b >> 4, b & 0x0F)) for b in range(256)]
+
+
+def _pack_nibbles(values: bytes) -> bytes:
+    if len(values) % 2:
+        values += bytes((_NO_CARD,))
+    return bytes([values[i] << 4 | values[i + 1] for i in range(0, len(values), 2)])
+
+
+def _unpack_nibbles(data: bytes, count: int) -> bytes:
+    return b''.join([_NIBBLES[b] for b in data])[:count]
+
+
+# Ключи Zobrist (64 бита) для хэша состояния: одни и те же в любом процессе.
+# Рука учитывается гистограммой: ключ (место, значение, число карт этого значения).
+_MASK64 = (1 << 64) - 1
+_N_VALUES = len(LlamaCard.VALUES)
+_MAX_COUNT = _N_VALUES * LlamaCard.COPIES
+_zobrist_rng = random.Random(0x1A3A)
+_Z_TOP = [0] + [_zobrist_rng.getrandbits(64) for _ in range(_N_VALUES)]  # индекс value + 1, 0 - нет карты
+_Z_DECK = [[_zobrist_rng.getrandbits(64) for _ in range(_N_VALUES)] for _ in range(_MAX_COUNT)]
+_Z_HAND: list[list[list[int]]] = []  # [место][значение][число карт], ключ нуля карт - 0
+_Z_CURRENT: list[int] = []
+_Z_QUIT: list[int] = []
+
+
+def _seat_keys(n_players: int):
+    while len(_Z_HAND) < n_players:
+        _Z_HAND.append([[0] + [_zobrist_rng.getrandbits(64) for _ in range(_MAX_COUNT)] for _ in range(_N_VALUES)])
+        _Z_CURRENT.append(_zobrist_rng.getrandbits(64))
+        _Z_QUIT.append(_zobrist_rng.getrandbits(64))
+
+
+def _mix64(x: int) -> int:
+    # splitmix64: ключ для значений без таблицы (очки, имена)
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def _score_key(seat: int, score: int) -> int:
+    return _mix64(seat << 32 | score & 0xFFFFFFFF)
+
+
+_name_keys: dict[tuple[int, str], int] = {}
+
+
+def _name_key(seat: int, name: str) -> int:
+    key = _name_keys.get((seat, name))
+    if key is None:
+        digest = hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest()
+        key = _name_keys[(seat, name)] = _mix64(seat ^ int.from_bytes(digest, 'little'))
+    return key
+
+
+# допустимые действия apply() (коды как в src/simulation.py): выбор карты - играбельные значения или пас,
+# без играбельных - выйти или взять (из пустой колоды только выйти), после взятия - первая играбельная или пас
+_CARD_ACTIONS = tuple(values + (PASS,) if values else (QUIT, DRAW) for values in VALUES_BY_MASK)
+_QUIT_ONLY = (QUIT,)
+_PASS_ONLY = (PASS,)
+_AGAIN_ACTIONS = tuple((value, PASS) for value in range(_N_VALUES))
+
+
+def _deck_key(values: bytes) -> int:
+    key = 0
+    for pos, value in enumerate(values):
+        key ^= _Z_DECK[pos][value]
+    return key
+
 
 class GameState:
     def __init__(
             self, players: list[Player], deck: Deck, top: LlamaCard, current_player: int = 0, is_loaded_from_json: bool = False
     ):
         self.players: list[Player] = players
-        self.deck: Deck = deck
-        self.top: LlamaCard = top
+        self._deck: Deck = deck
+        self._top: LlamaCard = top
         self.__current_player: int = current_player
         self.is_loaded_from_json: bool = is_loaded_from_json
+        self._hash: int | None = None  # хэш без флагов quit; None - хэш ещё не запрашивали
+        self._quit_hash = 0
+        # места, ещё не вышедшие из раунда: бит seat; поддерживается set_quit
+        self._active = sum(1 << seat for seat, player in enumerate(players) if not player.quit)
+        self._again = False  # текущий игрок уже взял карту и решает, играть ли её
+        self._round_over = False  # раунд закончен ходом через apply()
+        self._moves: list[tuple] = []  # стек ходов apply() для undo()
+
+    # --- хэш состояния (Zobrist) ---
+    # Считается при первом запросе, дальше поддерживается за O(1) методами этого класса
+    # (draw_card, play_card, next_player, deal_cards, set_quit, add_score, clear_hand
+    # и присваиванием top, deck). Пока хэш не запрошен, обновления ничего не стоят.
+    # Кто меняет руки, очки или флаги quit игроков напрямую, должен вызвать rehash().
+
+    def rehash(self):
+        """Пересчитывает хэш состояния с нуля и включает его поддержку."""
+        players = self.players
+        _seat_keys(len(players))
+        self._counts = [[0] * _N_VALUES for _ in players]  # гистограммы рук для обновления хэша
+        key = _Z_TOP[0 if self._top is None else self._top.value + 1] ^ _deck_key(self._deck.values)
+        quit_key = 0
+        if players:
+            key ^= _Z_CURRENT[self.__current_player]
+        for seat, player in enumerate(players):
+            counts = self._counts[seat]
+            for card in player.hand.cards:
+                counts[card.value] += 1
+            keys = _Z_HAND[seat]
+            for value in range(_N_VALUES):
+                key ^= keys[value][counts[value]]
+            key ^= _score_key(seat, player.score) ^ _name_key(seat, player.name)
+            if player.quit:
+                quit_key ^= _Z_QUIT[seat]
+        self._hash = key
+        self._quit_hash = quit_key
+
+    @property
+    def state_hash(self) -> int:
+        """64-битный хэш позиции, включая флаги quit: ключ для кэшей поиска и дедупликации."""
+        if self._hash is None:
+            self.rehash()
+        return self._hash ^ self._quit_hash
+
+    def __hash__(self):
+        # без флагов quit: __eq__ их не сравнивает
+        if self._hash is None:
+            self.rehash()
+        return self._hash
+
+    def _hand_delta(self, seat: int, value: int, delta: int):
+        counts = self._counts[seat]
+        keys = _Z_HAND[seat][value]
+        count = counts[value]
+        counts[value] = count + delta
+        self._hash ^= keys[count] ^ keys[count + delta]
+
+    def _deck_pop(self, count: int):
+        # с вершины колоды уходят count карт
+        if self._hash is None:
+            return
+        deck = self._deck
+        for pos in range(len(deck) - count, len(deck)):
+            self._hash ^= _Z_DECK[pos][deck.value(pos)]
+
+    @property
+    def top(self) -> LlamaCard:
+        return self._top
+
+    @top.setter
+    def top(self, card: LlamaCard):
+        if self._hash is not None:
+            self._hash ^= _Z_TOP[0 if self._top is None else self._top.value + 1] ^ _Z_TOP[
+                0 if card is None else card.value + 1]
+        self._top = card
+
+    @property
+    def deck(self) -> Deck:
+        return self._deck
+
+    @deck.setter
+    def deck(self, deck: Deck):
+        if self._hash is not None:
+            self._hash ^= _deck_key(self._deck.values) ^ _deck_key(deck.values)
+        self._deck = deck
+
+    def set_quit(self, seat: int, quit: bool):
+        """Игрок seat выходит из раунда (quit=True) или возвращается в него."""
+        player = self.players[seat]
+        if player.quit != quit:
+            player.quit = quit
+            self._active ^= 1 << seat
+            if self._hash is not None:
+                self._quit_hash ^= _Z_QUIT[seat]
+
+    def add_score(self, seat: int, points: int):
+        player = self.players[seat]
+        if self._hash is not None:
+            self._hash ^= _score_key(seat, player.score) ^ _score_key(seat, player.score + points)
+        player.score += points
+
+    def clear_hand(self, seat: int):
+        if self._hash is not None:
+            counts = self._counts[seat]
+            keys = _Z_HAND[seat]
+            for value in range(_N_VALUES):
+                self._hash ^= keys[value][counts[value]]
+                counts[value] = 0
+        self.players[seat].hand.clear()
+
+    # --- ходы для поиска: legal_actions / apply / undo ---
+    # Ход - целый код действия: значение карты 0..6, QUIT, DRAW или PASS (см. src/simulation.py).
+    # Порядок решений как в GameServer: с играбельными картами игрок играет одну из них или пасует,
+    # без них выходит или берёт карту, а после взятия играет первую играбельную карту руки или пасует.
+    # apply() кладёт на стек запись из нескольких чисел, undo() откатывает ход за O(1) без копий
+    # состояния; хэш поддерживается обоими. Очки в конце раунда apply() не начисляет.
+
+    def legal_actions(self) -> tuple[int, ...]:
+        """Коды допустимых действий текущего игрока; пустой кортеж - раунд окончен."""
+        if self._round_over:
+            return ()
+        player = self.players[self.__current_player]
+        if player.quit:
+            return _PASS_ONLY
+        if self._again:
+            playable = player.hand.playable_cards(self._top)
+            return _AGAIN_ACTIONS[playable[0].value] if playable else _PASS_ONLY
+        playable = player.hand.value_mask() & PLAYABLE_MASK[self._top.value]
+        if not playable and not len(self._deck):
+            return _QUIT_ONLY
+        return _CARD_ACTIONS[playable]
+
+    def apply(self, action: int):
+        """Текущий игрок делает ход action (код из legal_actions())."""
+        seat = self.__current_player
+        player = self.players[seat]
+        record = (action, seat, self._top, self._again, self._round_over)
+        self._moves.append(record)
+        if action == DRAW:
+            if self._hash is not None:
+                pos = len(self._deck) - 1
+                self._hash ^= _Z_DECK[pos][self._deck.value(pos)]
+            card = self._deck.draw_card()
+            player.hand.add_card(card)
+            if self._hash is not None:
+                self._hand_delta(seat, card.value, 1)
+            if player.hand.playable_cards(self._top):
+                self._again = True
+                return
+        elif action == QUIT:
+            self.set_quit(seat, True)
+        elif action != PASS:
+            card = CARDS[action]
+            pos = player.hand.pop_card(card)
+            if self._hash is not None:
+                self._hand_delta(seat, action, -1)
+            self.top = card
+            self._moves[-1] = record + (pos,)
+        self._again = False
+        self._end_turn(player)
+
+    def _end_turn(self, player: Player):
+        # как next_player_phase GameServer; вышедшие игроки пропускаются сразу
+        if player.hand.is_empty() or not self._active:
+            self._round_over = True
+            return
+        self.next_active_player()
+
+    def undo(self):
+        """Отменяет последний ход apply()."""
+        action, seat, top, again, round_over, *extra = self._moves.pop()
+        self.set_current_player(seat)
+        self._again = again
+        self._round_over = round_over
+        player = self.players[seat]
+        if action == DRAW:
+            self._deck.undraw()  # взятая карта осталась в массиве колоды за курсором
+            pos = len(self._deck) - 1
+            card = self._deck.value(pos)
+            player.hand.pop_card(CARDS[card], last=True)
+            if self._hash is not None:
+                self._hand_delta(seat, card, -1)
+                self._hash ^= _Z_DECK[pos][card]
+        elif action == QUIT:
+            self.set_quit(seat, False)
+        elif action != PASS:
+            player.hand.insert_card(extra[0], CARDS[action])
+            if self._hash is not None:
+                self._hand_delta(seat, action, 1)
+            self.top = top
+
+    # --- кольцо активных мест ---
+    # Вышедшие из раунда места пропускаются за O(1) по битовой маске _active.
+    # Флаг quit меняется только через set_quit (или до создания GameState).
+
+    @property
+    def active_count(self) -> int:
+        """Сколько игроков ещё не вышли из раунда."""
+        return self._active.bit_count()
+
+    def all_quit(self) -> bool:
+        return not self._active
+
+    def next_active_seat(self, seat: int) -> int:
+        """Ближайшее после seat (по кругу, включая само seat) невышедшее место; -1, если таких нет."""
+        active = self._active
+        if not active:
+            return -1
+        later = active >> (seat + 1)
+        if later:
+            return seat + (later & -later).bit_length()
+        return (active & -active).bit_length() - 1
+
+    def next_active_player(self):
+        """Ход переходит к следующему невышедшему игроку (если все вышли - не переходит)."""
+        seat = self.next_active_seat(self.__current_player)
+        if seat >= 0:
+            self.set_current_player(seat)
+
+    def set_current_player(self, seat: int):
+        if self._hash is not None:
+            self._hash ^= _Z_CURRENT[self.__current_player] ^ _Z_CURRENT[seat]
+        self.__current_player = seat
 
     @property
     def current_player_index(self):   #Возвращает индекс текущего игрока
@@ -49,23 +356,90 @@ class GameState:
             is_loaded_from_json = True
         )
 
+    def to_bytes(self) -> bytes: #Метод, который упаковывает состояние игры в компактный бинарный снимок
+        """Бинарный снимок состояния: заголовок и карты по 4 бита."""
+        players = self.players
+        quit_mask = 0
+        parts = []
+        values = bytearray(self.deck.values)
+        for i, player in enumerate(players):
+            if player.quit:
+                quit_mask |= 1 << i
+            name = player.name.encode('utf-8')
+            hand = [c.value for c in player.hand.cards]
+            values.extend(hand)
+            if len(name) > 0xFF:
+                raise ValueError(f"Player name {player.name!r} is longer than 255 bytes in UTF-8")
+            if not 0 <= player.score <= 0xFFFF:
+                raise ValueError(f"Score {player.score} of {player.name!r} does not fit the binary format (0..65535)")
+            parts.append(_PLAYER.pack(player.score, len(hand), len(name)))
+            parts.append(name)
+        header = _HEADER.pack(
+            _BINARY_VERSION, len(players), self.__current_player,
+            _NO_CARD if self.top is None else self.top.value, len(self.deck),
+        )
+        return b''.join([header, quit_mask.to_bytes((len(players) + 7) // 8, 'little'), *parts,
+                         _pack_nibbles(values)])
+
+    @classmethod
+    def from_bytes(cls, data: bytes): #Класс-метод, который восстанавливает состояние игры из бинарного снимка
+        """Восстанавливает состояние, сохранённое to_bytes()."""
+        version, n_players, current, top, deck_size = _HEADER.unpack_from(data)
+        if version != _BINARY_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        offset = _HEADER.size
+        mask_size = (n_players + 7) // 8
+        quit_mask = int.from_bytes(data[offset:offset + mask_size], 'little')
+        offset += mask_size
+        header = []
+        for _ in range(n_players):
+            score, hand_size, name_size = _PLAYER.unpack_from(data, offset)
+            offset += _PLAYER.size
+            header.append((data[offset:offset + name_size].decode('utf-8'), score, hand_size))
+            offset += name_size
+        total = deck_size + sum(hand_size for _, _, hand_size in header)
+        values = _unpack_nibbles(data[offset:], total)
+        players = []
+        pos = deck_size
+        for i, (name, score, hand_size) in enumerate(header):
+            player = Player(name, Hand([CARDS[v] for v in values[pos:pos + hand_size]]), score)
+            player.quit = bool(quit_mask >> i & 1)
+            players.append(player)
+            pos += hand_size
+        return cls(
+            players=players,
+            deck=Deck.from_values(values[:deck_size]),
+            top=None if top == _NO_CARD else CARDS[top],
+            current_player=current,
+            is_loaded_from_json=True
+        )
+
     def next_player(self): #Метод, который переходит к следующему игроку
         """Ход переходит к следующему игроку."""
         n = len(self.players)
-        self.__current_player = (self.__current_player + 1) % n
+        current = self.__current_player
+        self.__current_player = (current + 1) % n
+        if self._hash is not None:
+            self._hash ^= _Z_CURRENT[current] ^ _Z_CURRENT[self.__current_player]
 
     def draw_card(self) -> LlamaCard: #Метод, позволяющий текущему игроку взять карту из колоды
         """Текущий игрок берет карту из колоды."""
-        if not self.deck.cards:  # Проверяем, что в колоде есть карты
-            print("Колода пуста, нельзя взять карту.")
-            return None
+        if self.deck.is_empty():  # Проверяем, что в колоде есть карты
+            return None  # Колода пуста, нельзя взять карту
+        if self._hash is not None:
+            pos = len(self.deck) - 1
+            self._hash ^= _Z_DECK[pos][self.deck.value(pos)]
         card = self.deck.draw_card()
         self.current_player().hand.add_card(card)
+        if self._hash is not None:
+            self._hand_delta(self.__current_player, card.value, 1)
         return card
 
     def play_card(self, card: LlamaCard): #Метод, который позволяет текущему игроку сыграть карту
         """Карта card от текущего игрока переходит в top."""
         if card.can_play_on(self.top):  # Проверяем, можно ли сыграть карту
+            if self._hash is not None and self._counts[self.__current_player][card.value]:
+                self._hand_delta(self.__current_player, card.value, -1)
             self.current_player().hand.remove_card(card)
             self.top = card
         else:
@@ -73,16 +447,26 @@ class GameState:
 
     def deal_cards(self, num_cards: int = 6): #Метод для раздачи карт игрокам
         """Раздача карт игрокам."""
-        for _ in range(num_cards):
-            for player in self.players:
-                if self.deck.cards:  # Проверяем, что в колоде есть карты
-                    player.hand.add_card(self.deck.draw_card())
+        self._deck_pop(min(len(self.players) * num_cards, len(self.deck)))
+        hands = self.deck.deal(len(self.players), num_cards)  # карты раздаются по кругу, пока есть в колоде
+        for seat, (player, cards) in enumerate(zip(self.players, hands)):
+            player.hand.add_cards(cards)
+            if self._hash is not None:
+                for card in cards:
+                    self._hand_delta(seat, card.value, 1)
+
+    def turn_top_card(self): #Метод, который открывает верхнюю карту колоды
+        """Верхняя карта колоды становится картой top."""
+        self._deck_pop(1)
+        self.top = self.deck.draw_card()
 
     def start_game(self): #Метод для начала игры, который перемешивает колоду и раздает карты
         """Начало игры."""
         self.deck.shuffle()
+        if self._hash is not None:
+            self.rehash()
         self.deal_cards()
-        self.top = self.deck.draw_card()  # Перевернуть верхнюю карту
+        self.turn_top_card()  # Перевернуть верхнюю карту
         print(f"Начальная карта: {self.top}")
 
     def end_round(self): #Метод, который обрабатывает конец раунда, подсчитывая очки игроков
@@ -92,8 +476,8 @@ class GameState:
         for name, score in scores.items():
             print(f"{name}: {score} очков")
         # Здесь можно добавить логику для определения победителя
-        for player in self.players:
-            player.hand.clear()  # Очистка рук игроков
+        for seat in range(len(self.players)):
+            self.clear_hand(seat)  # Очистка рук игроков
 
     def is_round_over(self) -> bool: #Метод, который проверяет, закончился ли раунд
         """Проверка, закончился ли раунд."""
@@ -123,7 +507,7 @@ class GameState:
                 print(f"{current.name} берет карту.")
                 break
             elif action == "выйти":
-                current.hand.clear()  # Убираем карты игрока
+                self.clear_hand(self.__current_player)  # Убираем карты игрока
                 print(f"{current.name} выходит из раунда.")
                 break
             else:
@@ -1,5 +1,5 @@
 import typing
-from src.card import LlamaCard
+from src.card import LlamaCard, PLAYABLE_MASK, CARDS_BY_MASK
 
 class Hand:
     def __init__(self, cards: list[LlamaCard] = None):
@@ -9,7 +9,11 @@ class Hand:
 
     def playable_cards(self, top_card: LlamaCard) -> list[LlamaCard]:
         """Возвращает список карт, которые можно сыграть на верхнюю карту."""
-        return [card for card in self.cards if card.can_play_on(top_card)]
+        mask = PLAYABLE_MASK[top_card.value]
+        return [card for card in self.cards if mask >> card.value & 1]
+
+    def __len__(self):
+        return len(self.cards)
 
     def __repr__(self):
         return self.save()
@@ -31,6 +35,10 @@ class Hand:
         """Добавляет карту в руку."""
         self.cards.append(card)
 
+    def add_cards(self, cards: list[LlamaCard]):
+        """Добавляет в руку несколько карт."""
+        self.cards.extend(cards)
+
     @classmethod
     def load(cls, text: str) -> typing.Self:
         """Преобразует строку в формате '3 1 6' в объект Hand. Возвращает руку."""
@@ -44,6 +52,33 @@ class Hand:
         except ValueError:
             print(f"Card {card} not found in hand.")
 
+    def pop_card(self, card: LlamaCard, last: bool = False) -> int:
+        """
+        Удаляет карту и возвращает её позицию в руке (для insert_card при отмене хода).
+        last=True - удаляется последняя такая карта (отмена add_card).
+        """
+        cards = self.cards
+        if not last:
+            pos = cards.index(card)
+            del cards[pos]
+            return pos
+        for pos in range(len(cards) - 1, -1, -1):
+            if cards[pos] == card:
+                del cards[pos]
+                return pos
+        raise ValueError(f"Card {card} not found in hand.")
+
+    def insert_card(self, pos: int, card: LlamaCard):
+        """Возвращает карту на позицию pos."""
+        self.cards.insert(pos, card)
+
+    def value_mask(self) -> int:
+        """Битовая маска значений карт в руке."""
+        mask = 0
+        for card in self.cards:
+            mask |= 1 << card.value
+        return mask
+
     def score(self) -> int:
         """Возвращает сумму очков карт в руке."""
         return sum(c.score(self.cards) for c in self.cards)
@@ -54,4 +89,114 @@ class Hand:
 
     def clear(self):
         """Убираем все карты из руки."""
-        self.cards.clear()
\ No newline at end of file
+        self.cards.clear()
+
+class HistogramHand(Hand):
+    """
+    Рука в виде гистограммы: counts[value] - количество карт каждого значения,
+    mask - битовая маска присутствующих значений. Добавление, удаление, подсчёт очков
+    и поиск играбельных карт выполняются за постоянное время. Порядок карт не хранится:
+    cards и save() перечисляют карты в порядке LlamaCard.VALUES.
+    """
+    def __init__(self, cards: list[LlamaCard] = None):
+        self.counts: list[int] = [0] * len(LlamaCard.VALUES)
+        self.mask: int = 0
+        self._size: int = 0
+        self._score: int = 0
+        if cards:
+            for card in cards:
+                self.add_card(card)
+
+    @property
+    def cards(self) -> list[LlamaCard]:
+        """Список карт руки в порядке LlamaCard.VALUES."""
+        counts = self.counts
+        return [LlamaCard(v) for v in LlamaCard.VALUES for _ in range(counts[v])]
+
+    def __len__(self):
+        return self._size
+
+    def playable_cards(self, top_card: LlamaCard) -> list[LlamaCard]:
+        """Возвращает по одной карте каждого значения, которое можно сыграть на верхнюю карту."""
+        return list(CARDS_BY_MASK[self.mask & PLAYABLE_MASK[top_card.value]])
+
+    def save(self) -> str:
+        """Преобразует руку в строку в формате '1 3 6'."""
+        counts = self.counts
+        return ' '.join(str(v) for v in LlamaCard.VALUES for _ in range(counts[v]))
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            other = Hand.load(other)
+        if isinstance(other, HistogramHand):
+            return self.counts == other.counts
+        elif isinstance(other, Hand):
+            return self.counts == HistogramHand(other.cards).counts
+        return False
+
+    def add_card(self, card: LlamaCard):
+        """Добавляет карту в руку."""
+        v = card.value
+        n = self.counts[v] + 1
+        self.counts[v] = n
+        self.mask |= 1 << v
+        self._size += 1
+        # Лама всегда 10 очков, остальные значения дают очки, только если карта одна
+        if v == LlamaCard.LLAMA:
+            self._score += 10
+        elif n == 1:
+            self._score += v
+        elif n == 2:
+            self._score -= v
+
+    def add_cards(self, cards: list[LlamaCard]):
+        """Добавляет в руку несколько карт."""
+        for card in cards:
+            self.add_card(card)
+
+    def remove_card(self, card: LlamaCard):
+        """Удаляет карту из руки, если она там есть."""
+        v = card.value
+        n = self.counts[v]
+        if not n:
+            print(f"Card {card} not found in hand.")
+            return
+        n -= 1
+        self.counts[v] = n
+        if not n:
+            self.mask &= ~(1 << v)
+        self._size -= 1
+        if v == LlamaCard.LLAMA:
+            self._score -= 10
+        elif n == 0:
+            self._score -= v
+        elif n == 1:
+            self._score += v
+
+    def pop_card(self, card: LlamaCard, last: bool = False) -> int:
+        """Удаляет карту; позиции у гистограммы нет, возвращается -1."""
+        if not self.counts[card.value]:
+            raise ValueError(f"Card {card} not found in hand.")
+        self.remove_card(card)
+        return -1
+
+    def insert_card(self, pos: int, card: LlamaCard):
+        self.add_card(card)
+
+    def value_mask(self) -> int:
+        return self.mask
+
+    def score(self) -> int:
+        """Возвращает сумму очков карт в руке."""
+        return self._score
+
+    def is_empty(self) -> bool:
+        """Возвращает True, если рука пустая"""
+        return not self._size
+
+    def clear(self):
+        """Убираем все карты из руки."""
+        self.counts = [0] * len(LlamaCard.VALUES)
+        self.mask = 0
+        self._size = 0
+        self._score = 0
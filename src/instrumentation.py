@@ -0,0 +1,209 @@
+"""
+Замеры игрового движка: время фаз GameServer.run_one_step и обратных вызовов PlayerInteraction,
+счётчики взятий, розыгрышей, выходов из раунда и раундов.
+
+    metrics = server.attach_metrics()
+    server.run()
+    metrics.save_json('metrics.json')
+    print(metrics.to_prometheus())
+
+Замеры подключаются к конкретным объектам: методы фаз сервера и методы игроков
+подменяются атрибутами экземпляра с замером времени, detach возвращает всё как было.
+Пока замеры не подключены, движок работает без единой лишней проверки.
+Один GameMetrics можно подключить к нескольким серверам по очереди - данные суммируются.
+"""
+import functools
+import json
+import random
+import time
+import typing
+from pathlib import Path
+
+from src.GameServer import GameServer, GamePhase
+
+# методы GameServer, которые run_one_step вызывает в каждой фазе
+PHASE_METHODS = GameServer.PHASE_METHODS
+# фазы, в которых текущий игрок может сыграть, взять карту или выйти из раунда
+_TURN_PHASES = (GamePhase.CHOOSE_CARD, GamePhase.CHOOSE_CARD_AGAIN, GamePhase.DRAW_EXTRA)
+CALLBACKS = ('choose_card', 'choose_quit', 'choose_to_play', 'inform_card_drawn', 'inform_card_played',
+             'inform_round_begin', 'inform_game_state')
+COUNTERS = ('draws', 'plays', 'quits', 'rounds', 'games')
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class Timing:
+    """Число вызовов, суммарное время и выборка длительностей (reservoir sampling) для квантилей."""
+    def __init__(self, max_samples: int, rng: random.Random):
+        self.count = 0
+        self.total_ns = 0
+        self.samples: list[int] = []
+        self._max_samples = max_samples
+        self._rng = rng
+
+    def add(self, ns: int):
+        self.count += 1
+        self.total_ns += ns
+        if len(self.samples) < self._max_samples:
+            self.samples.append(ns)
+        else:
+            i = self._rng.randrange(self.count)
+            if i < self._max_samples:
+                self.samples[i] = ns
+
+    def quantile(self, q: float) -> int:
+        if not self.samples:
+            return 0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> dict:
+        data = {'count': self.count, 'total_ns': self.total_ns,
+                'mean_ns': self.total_ns / self.count if self.count else 0.0}
+        for q in QUANTILES:
+            data[f'p{round(q * 100)}_ns'] = self.quantile(q)
+        return data
+
+
+class GameMetrics:
+    def __init__(self, max_samples: int = 10_000, seed: int = 0,
+                 clock: typing.Callable[[], int] = time.perf_counter_ns):
+        self.max_samples = max_samples
+        self.clock = clock
+        self._rng = random.Random(seed)  # выборка длительностей воспроизводима
+        self.phases: dict[GamePhase, Timing] = {}
+        self.callbacks: dict[str, Timing] = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._installed: dict[int, tuple[object, list[str]]] = {}  # id(объекта) -> (объект, подменённые атрибуты)
+
+    def _timing(self, table: dict, key) -> Timing:
+        timing = table.get(key)
+        if timing is None:
+            timing = table[key] = Timing(self.max_samples, self._rng)
+        return timing
+
+    # --- подключение ---
+
+    def install(self, server: GameServer):
+        """Подключает замеры к серверу и ко всем его игрокам."""
+        names = []
+        for phase, name in PHASE_METHODS.items():
+            setattr(server, name, self._wrap_phase(server, phase, getattr(server, name)))
+            names.append(name)
+        self._installed[id(server)] = (server, names)
+        server.compile_phases()
+        for interaction in server.interactions:
+            # игрок-класс (GameServer.get_players) общий для всех партий процесса: его методы не подменяются
+            if isinstance(interaction, type) or id(interaction) in self._installed:
+                continue
+            names = []
+            for name in CALLBACKS:
+                method = getattr(interaction, name, None)
+                if method is not None:
+                    setattr(interaction, name, self._wrap_callback(name, method))
+                    names.append(name)
+            self._installed[id(interaction)] = (interaction, names)
+
+    def uninstall(self, server: GameServer | None = None):
+        """Снимает замеры с сервера и его игроков (без аргумента - со всех объектов)."""
+        if server is None:
+            targets = list(self._installed)
+        else:
+            targets = [id(server)] + [id(i) for i in server.interactions]
+        for key in targets:
+            obj, names = self._installed.pop(key, (None, []))
+            for name in names:
+                delattr(obj, name)  # снова виден метод класса
+            if isinstance(obj, GameServer):
+                obj.compile_phases()
+
+    def _wrap_phase(self, server: GameServer, phase: GamePhase, method):
+        timing = self._timing(self.phases, phase)
+        clock = self.clock
+        counters = self.counters
+
+        if phase in _TURN_PHASES:
+            @functools.wraps(method)
+            def timed(*args, **kwargs):
+                player = server.game_state.current_player()
+                size, quit = len(player.hand), player.quit
+                start = clock()
+                result = method(*args, **kwargs)
+                timing.add(clock() - start)
+                new_size = len(player.hand)
+                if new_size < size:
+                    counters['plays'] += 1
+                elif new_size > size:
+                    counters['draws'] += 1
+                if player.quit and not quit:
+                    counters['quits'] += 1
+                return result
+            return timed
+
+        counter = {GamePhase.END_ROUND: 'rounds', GamePhase.DECLARE_WINNER: 'games'}.get(phase)
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            result = method(*args, **kwargs)
+            timing.add(clock() - start)
+            if counter is not None:
+                counters[counter] += 1
+            return result
+        return timed
+
+    def _wrap_callback(self, name: str, method):
+        timing = self._timing(self.callbacks, name)
+        clock = self.clock
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timing.add(clock() - start)
+        return timed
+
+    # --- выгрузка ---
+
+    def reset(self):
+        # обнуление на месте: подключённые обёртки держат ссылки на эти объекты
+        for timing in (*self.phases.values(), *self.callbacks.values()):
+            timing.count = timing.total_ns = 0
+            timing.samples.clear()
+        for name in self.counters:
+            self.counters[name] = 0
+
+    def to_dict(self) -> dict:
+        return {
+            'phases': {str(phase): timing.to_dict() for phase, timing in self.phases.items() if timing.count},
+            'callbacks': {name: timing.to_dict() for name, timing in self.callbacks.items() if timing.count},
+            'counters': dict(self.counters),
+        }
+
+    def save_json(self, filename: str | Path):
+        with open(filename, 'w', encoding='utf-8') as fout:
+            json.dump(self.to_dict(), fout, indent=4, ensure_ascii=False)
+
+    def to_prometheus(self, prefix: str = 'lama') -> str:
+        """Текстовый формат Prometheus: summary в секундах по фазам и обратным вызовам, счётчики."""
+        lines = []
+        for metric, label, table in ((f'{prefix}_phase_seconds', 'phase', self.phases),
+                                     (f'{prefix}_callback_seconds', 'callback', self.callbacks)):
+            lines.append(f'# TYPE {metric} summary')
+            for key, timing in table.items():
+                if not timing.count:
+                    continue
+                labels = f'{label}="{_escape(str(key))}"'
+                for q in QUANTILES:
+                    lines.append(f'{metric}{{{labels},quantile="{q}"}} {timing.quantile(q) / 1e9:.9f}')
+                lines.append(f'{metric}_sum{{{labels}}} {timing.total_ns / 1e9:.9f}')
+                lines.append(f'{metric}_count{{{labels}}} {timing.count}')
+        for name, value in self.counters.items():
+            lines.append(f'# TYPE {prefix}_{name}_total counter')
+            lines.append(f'{prefix}_{name}_total {value}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,79 @@
+import json
+import os
+from pathlib import Path
+
+
+class GameJournal:
+    """
+    Журнал партии: контрольная точка (save-файл в формате GameServer.save) и рядом
+    дописываемый журнал ходов filename + '.log'. Каждая запись - одна строка JSON
+    [seq, op, *args], поэтому ход стоит одной короткой последовательной записи.
+    Каждые checkpoint_every записей GameServer пишет новую контрольную точку, а журнал обнуляется.
+    """
+    def __init__(self, filename: str | Path, checkpoint_every: int = 256, sync: bool = False):
+        self.filename = Path(filename)
+        self.log_path = self.log_path_for(self.filename)
+        self.checkpoint_every = checkpoint_every
+        self.sync = sync  # fsync после каждой записи (защита и от сбоя ОС, а не только процесса)
+        self.seq = 0  # номер последней записи
+        self._since_checkpoint = 0
+        self._fd: int | None = None
+
+    @staticmethod
+    def log_path_for(filename: str | Path) -> Path:
+        filename = Path(filename)
+        return filename.with_name(filename.name + '.log')
+
+    @property
+    def needs_checkpoint(self) -> bool:
+        return self._since_checkpoint >= self.checkpoint_every
+
+    def record(self, op: str, *args):
+        """Дописывает в журнал действие или переход фазы."""
+        self.seq += 1
+        self._since_checkpoint += 1
+        line = json.dumps([self.seq, op, *args], ensure_ascii=False, separators=(',', ':')) + '\n'
+        if self._fd is None:
+            self._fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(self._fd, line.encode('utf-8'))
+        if self.sync:
+            os.fsync(self._fd)
+
+    def checkpoint(self, server):
+        """Записывает контрольную точку состояния сервера и обнуляет журнал."""
+        data = server.save_to_dict()
+        data['seq'] = self.seq
+        tmp = self.filename.with_name(self.filename.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as fout:
+            json.dump(data, fout, indent=4)
+            if self.sync:
+                fout.flush()
+                os.fsync(fout.fileno())
+        os.replace(tmp, self.filename)  # контрольная точка заменяется атомарно
+        # записи с seq не больше seq контрольной точки при восстановлении пропускаются,
+        # поэтому сбой между заменой файла и обнулением журнала безопасен
+        self.close()
+        self._fd = os.open(self.log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        self._since_checkpoint = 0
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @classmethod
+    def read_tail(cls, filename: str | Path, after_seq: int = 0) -> list[list]:
+        """Возвращает записи журнала с номером больше after_seq; оборванная последняя строка отбрасывается."""
+        log_path = cls.log_path_for(filename)
+        if not log_path.exists():
+            return []
+        records = []
+        with open(log_path, 'r', encoding='utf-8') as fin:
+            for line in fin:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # запись не успела дописаться до сбоя
+                if record[0] > after_seq:
+                    records.append(record)
+        return records
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from src.card import LlamaCard
@@ -5,6 +7,9 @@ from src.hand import Hand
 from src.player import Player
 
 class PlayerInteraction(ABC):
+    # True - решения ждут ввода человека; асинхронный хост вызывает их в отдельном потоке
+    BLOCKING = False
+
     @classmethod
     @abstractmethod
     def choose_card(
@@ -59,6 +64,41 @@ class PlayerInteraction(ABC):
         """
         print(f"{player.name} has played {card}.")
 
+    @classmethod
+    def inform_round_begin(cls, game_state):
+        """
+        Сообщает, что карты нового раунда розданы.
+        :param game_state: Состояние игры после раздачи.
+        """
+        pass
+
+    @classmethod
+    def inform_game_state(cls, game_state, seat: int):
+        """
+        Передаёт состояние игры перед решением игрока seat (choose_card, choose_quit, choose_to_play).
+        Чужие руки и порядок колоды игрок смотреть не должен: только их размеры.
+        :param game_state: Текущее состояние игры.
+        :param seat: Индекс игрока, который принимает решение.
+        """
+        pass
+
+    # Асинхронные варианты решений для src/async_host.py. По умолчанию вызывают обычные методы
+    # (блокирующие - в потоке); удалённые и медленные игроки переопределяют их.
+
+    async def choose_card_async(self, hand: Hand, top: LlamaCard) -> LlamaCard | None:
+        return await self._call_async(self.choose_card, hand, top)
+
+    async def choose_quit_async(self, hand: Hand, top: LlamaCard) -> bool:
+        return await self._call_async(self.choose_quit, hand, top)
+
+    async def choose_to_play_async(self, top: LlamaCard, drawn: LlamaCard) -> bool:
+        return await self._call_async(self.choose_to_play, top, drawn)
+
+    async def _call_async(self, method, *args):
+        if not self.BLOCKING:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, functools.partial(method, *args))
+
 class ExamplePlayerInteraction(PlayerInteraction):
     @classmethod
     def choose_card(
@@ -83,4 +123,4 @@ class ExamplePlayerInteraction(PlayerInteraction):
     @classmethod
     def choose_to_play(cls, top: LlamaCard, drawn: LlamaCard) -> bool:
         # Пример: играем карту, если она playable
-        return drawn.is_playable(top)
+        return drawn.can_play_on(top)
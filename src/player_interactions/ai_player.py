@@ -13,11 +13,9 @@ class Bot(PlayerInteraction):
         self.name = name
     @classmethod
     def choose_card(self, hand: Hand, top_card: LlamaCard) -> LlamaCard:
-        print(f"Player with hand {hand} can play {hand.playable_cards(top_card)} on top of {top_card}")
         playable_cards = hand.playable_cards(top_card)
         if not playable_cards:
-            print(f"Player could not play any card")
-            return None
+            return None  # Бот не может сыграть ни одной карты
         return playable_cards[0]  # Бот всегда играет первую доступную карту
 
     @classmethod
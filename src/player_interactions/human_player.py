@@ -4,6 +4,8 @@ from src.player import Player
 from src.player_interaction import PlayerInteraction
 
 class Human(PlayerInteraction):
+    BLOCKING = True  # ждёт input()
+
     def __init__(self, name: str):
         self.name = name
 
@@ -2,10 +2,12 @@
 
 from src.player_interactions.ai_player import Bot
 from src.player_interactions.human_player import Human
+from src.player_interactions.mcts_player import MCTSBot
+from src.player_interactions.table_player import TableBot
 
 # Определяем список всех классов игроков
-all_player_types = [Bot, Human]
+all_player_types = [Bot, Human, MCTSBot, TableBot]
 
-__all__ = ['Bot', 'Human', 'all_player_types']
+__all__ = ['Bot', 'Human', 'MCTSBot', 'TableBot', 'all_player_types']
 
 
@@ -0,0 +1,219 @@
+# src/player_interactions/mcts_player.py
+
+import math
+import random
+import time
+
+from src.card import LlamaCard, CARDS, PLAYABLE_MASK
+from src.deck import make_rng
+from src.hand import Hand
+from src.player import Player
+from src.player_interaction import PlayerInteraction
+from src.simulation import (N_VALUES, VALUES_BY_MASK, FIRST_BY_MASK, RoundSim, hand_histogram, counts_mask,
+                            determinize, unseen_counts, CARD, QUIT_OR_DRAW, AGAIN, QUIT, DRAW, PLAY, PASS,
+                            N_ACTIONS)
+
+_QUIT_OR_DRAW = (DRAW, QUIT)
+_AGAIN = (PLAY, PASS)
+MAX_POINTS = sum(range(N_VALUES))  # наибольшие очки руки за раунд
+
+
+class MCTSBot(PlayerInteraction):
+    """
+    Бот на Monte Carlo tree search по информационным множествам (ISMCTS).
+
+    Каждая итерация случайно раздаёт невидимые карты (колода без своей руки и сыгранных
+    в раунде карт) по рукам соперников и колоде, проходит по дереву своих решений
+    по UCB1 и доигрывает раунд политикой Bot. Узлы хранятся в таблице по ключу
+    информационного множества (своя рука, верхняя карта, размеры рук и колоды, флаги quit),
+    поэтому статистика переиспользуется между решениями одного раунда.
+    Соперники в поиске играют как Bot.
+
+    Бюджет решения: не больше iterations итераций и не дольше time_budget секунд
+    (None - без ограничения; если не задано ни то, ни другое, берётся ITERATIONS).
+    """
+    ITERATIONS = 200
+    TIME_BUDGET: float | None = None
+    EXPLORATION = 0.7
+    MAX_NODES = 100_000  # таблица очищается, если разрослась
+
+    def __init__(self, name: str, iterations: int | None = None, time_budget: float | None = None,
+                 seed: int | None = None):
+        self.name = name
+        self.time_budget = time_budget if time_budget is not None else self.TIME_BUDGET
+        if iterations is None and self.time_budget is None:
+            iterations = self.ITERATIONS
+        self.iterations = iterations
+        self.rng: random.Random = make_rng(seed)
+        self.played = [0] * N_VALUES  # карты, сыгранные в текущем раунде
+        self.nodes: dict[tuple, list] = {}  # ключ информационного множества -> [визиты, визиты[a], сумма[a]]
+        self.game_state = None
+        self.seat = 0
+
+    def __str__(self):
+        return "MCTSBot"
+
+    # --- сообщения сервера ---
+
+    def inform_round_begin(self, game_state):
+        self.played = [0] * N_VALUES
+        self.nodes.clear()
+
+    def inform_game_state(self, game_state, seat: int):
+        self.game_state = game_state
+        self.seat = seat
+
+    def inform_card_played(self, player: Player, card: LlamaCard):
+        self.played[card.value] += 1
+
+    def inform_card_drawn(self, current_player: Player, card: LlamaCard):
+        pass
+
+    # --- решения ---
+
+    def choose_card(self, hand: Hand, top: LlamaCard, hand_counts: list[int] | None = None) -> LlamaCard | None:
+        playable = counts_mask(hand_histogram(hand)) & PLAYABLE_MASK[top.value]
+        if not playable:
+            return None
+        values = VALUES_BY_MASK[playable]
+        if len(values) == 1 or self.game_state is None:
+            return CARDS[values[0]]
+        return CARDS[self.search(CARD)]
+
+    def choose_quit(self, hand: Hand, top: LlamaCard, hand_counts: list[int] | None = None) -> bool:
+        if self.game_state is None:
+            return False
+        return self.search(QUIT_OR_DRAW) == QUIT
+
+    def choose_to_play(self, top: LlamaCard, drawn: LlamaCard) -> bool:
+        if self.game_state is None:
+            return drawn.can_play_on(top)
+        return self.search(AGAIN) == PLAY
+
+    # --- поиск ---
+
+    def search(self, kind: int) -> int:
+        """Возвращает лучшее действие в текущем решении вида kind."""
+        game_state = self.game_state
+        seat = self.seat
+        players = game_state.players
+        own = hand_histogram(players[seat].hand)
+        sizes = [len(p.hand) for p in players]
+        deck_size = len(game_state.deck)
+        top = game_state.top.value
+        quit = [p.quit for p in players]
+        unseen = unseen_counts(own, self.played)
+        root = _key(kind, own, top, sizes, deck_size, quit)
+
+        if len(self.nodes) > self.MAX_NODES:
+            self.nodes.clear()
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
+        iterations = self.iterations if self.iterations is not None else math.inf
+        rng = self.rng
+        done = 0
+        while done < iterations:
+            sim = determinize(seat, own, sizes, deck_size, unseen, top, seat, quit, rng)
+            self._iterate(sim, seat, kind)
+            done += 1
+            if deadline is not None and not done & 15 and time.perf_counter() >= deadline:
+                break
+
+        actions = _actions(kind, own, top)
+        node = self.nodes.get(root)
+        if node is None:  # расстановки не совпали с тем, что видно (например, после загрузки партии)
+            return actions[0]
+        return max(actions, key=node[1].__getitem__)
+
+    def _iterate(self, sim: RoundSim, seat: int, kind: int):
+        """Одна итерация: спуск по дереву своих решений, доигрывание, обратное распространение."""
+        path = []  # (узел, действие)
+        in_tree = True
+        n = len(sim.sizes)
+        while True:
+            in_tree = self._own_turn(sim, seat, kind, path, in_tree)
+            kind = CARD
+            if sim.end_turn():
+                break
+            if not in_tree or sim.quit[seat]:
+                sim.rollout()  # дальше решений из дерева нет
+                break
+            over = False
+            while sim.current != seat:
+                sim.default_turn(sim.current)
+                if sim.end_turn():
+                    over = True
+                    break
+            if over:
+                break
+        points = sim.points()
+        own = points[seat]
+        others = (sum(points) - own) / (n - 1) if n > 1 else 0
+        reward = 0.5 + (others - own) / (2 * MAX_POINTS)
+        for node, action in path:
+            node[0] += 1
+            node[1][action] += 1
+            node[2][action] += reward
+
+    def _own_turn(self, sim: RoundSim, seat: int, kind: int, path: list, in_tree: bool) -> bool:
+        """Ход игрока seat: решения из дерева, пока не добавлен новый узел, дальше - как Bot."""
+        if sim.quit[seat]:
+            return in_tree
+        if kind == CARD:
+            playable = sim.playable(seat)
+            if playable:
+                if in_tree and len(VALUES_BY_MASK[playable]) > 1:
+                    action, in_tree = self._select(sim, seat, CARD, VALUES_BY_MASK[playable], path)
+                else:
+                    action = FIRST_BY_MASK[playable]
+                sim.play(seat, action)
+                return in_tree
+            kind = QUIT_OR_DRAW
+        if kind == QUIT_OR_DRAW:
+            action = DRAW
+            if in_tree:
+                action, in_tree = self._select(sim, seat, QUIT_OR_DRAW, _QUIT_OR_DRAW, path)
+            if action == QUIT or sim.draw(seat) < 0:
+                sim.quit_round(seat)
+                return in_tree
+        playable = sim.playable(seat)
+        if playable:
+            action = PLAY
+            if in_tree:
+                action, in_tree = self._select(sim, seat, AGAIN, _AGAIN, path)
+            if action == PLAY:
+                sim.play(seat, FIRST_BY_MASK[playable])
+        return in_tree
+
+    def _select(self, sim: RoundSim, seat: int, kind: int, actions: tuple[int, ...], path: list) -> tuple[int, bool]:
+        """UCB1 в узле; новый узел добавляется в таблицу, и дальше итерация идёт без дерева."""
+        key = _key(kind, sim.counts[seat], sim.top, sim.sizes, len(sim.deck), sim.quit)
+        node = self.nodes.get(key)
+        if node is None:
+            node = self.nodes[key] = [0, [0] * N_ACTIONS, [0.0] * N_ACTIONS]
+            action = actions[0]  # первым пробуется ход Bot, остальные - по мере визитов
+            path.append((node, action))
+            return action, False
+        total, visits, values = node
+        best, best_score = actions[0], -1.0
+        log_total = math.log(total + 1)
+        for action in actions:
+            n = visits[action]
+            if not n:
+                best = action
+                break
+            score = values[action] / n + self.EXPLORATION * math.sqrt(log_total / n)
+            if score > best_score:
+                best, best_score = action, score
+        path.append((node, best))
+        return best, True
+
+
+def _actions(kind: int, own: list[int], top: int) -> tuple[int, ...]:
+    if kind == CARD:
+        return VALUES_BY_MASK[counts_mask(own) & PLAYABLE_MASK[top]]
+    return _QUIT_OR_DRAW if kind == QUIT_OR_DRAW else _AGAIN
+
+
+def _key(kind: int, own, top: int, sizes, deck_size: int, quit) -> tuple:
+    # ключ информационного множества игрока seat: только то, что он видит
+    return kind, top, deck_size, tuple(own), tuple(sizes), tuple(quit)
@@ -0,0 +1,59 @@
+# src/player_interactions/table_player.py
+
+import os
+
+from src.card import LlamaCard, CARDS, PLAYABLE_MASK
+from src.hand import Hand
+from src.player_interactions.ai_player import Bot
+from src.policy_table import PolicyTable, open_table, state_index, opponent_min
+from src.simulation import VALUES_BY_MASK, hand_histogram, counts_mask, CARD, QUIT_OR_DRAW, AGAIN, QUIT, PLAY, PASS
+
+
+class TableBot(Bot):
+    """
+    Бот, который отвечает на решения одним чтением из заранее посчитанной таблицы
+    (src/policy_table.py). Путь к таблице - TABLE_PATH или переменная окружения LAMA_POLICY.
+    В состояниях, которых нет в таблице, играет как Bot.
+    """
+    TABLE_PATH = os.environ.get('LAMA_POLICY', 'policy.bin')
+
+    def __init__(self, name: str, table: PolicyTable | str | None = None):
+        super().__init__(name)
+        self.table = table if isinstance(table, PolicyTable) else open_table(table or self.TABLE_PATH)
+        self.game_state = None
+        self.seat = 0
+
+    def __str__(self):
+        return "TableBot"
+
+    def inform_game_state(self, game_state, seat: int):
+        self.game_state = game_state
+        self.seat = seat
+
+    def _lookup(self, kind: int, counts: list[int], top: LlamaCard) -> int:
+        game_state = self.game_state
+        if game_state is None:
+            return -1
+        players = game_state.players
+        sizes = [len(p.hand) for p in players]
+        quit = [p.quit for p in players]
+        return self.table[state_index(kind, counts, top.value, opponent_min(sizes, quit, self.seat),
+                                      len(game_state.deck))]
+
+    def choose_card(self, hand: Hand, top: LlamaCard, hand_counts: list[int] | None = None) -> LlamaCard | None:
+        counts = hand_histogram(hand)
+        values = VALUES_BY_MASK[counts_mask(counts) & PLAYABLE_MASK[top.value]]
+        if not values:
+            return None
+        action = self._lookup(CARD, counts, top) if len(values) > 1 else -1
+        return CARDS[action] if action in values else CARDS[values[0]]
+
+    def choose_quit(self, hand: Hand, top: LlamaCard, hand_counts: list[int] | None = None) -> bool:
+        return self._lookup(QUIT_OR_DRAW, hand_histogram(hand), top) == QUIT
+
+    def choose_to_play(self, top: LlamaCard, drawn: LlamaCard) -> bool:
+        if self.game_state is None:
+            return super().choose_to_play(top, drawn)
+        hand = self.game_state.players[self.seat].hand
+        action = self._lookup(AGAIN, hand_histogram(hand), top)
+        return action == PLAY or (action not in (PLAY, PASS) and super().choose_to_play(top, drawn))
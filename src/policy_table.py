@@ -0,0 +1,210 @@
+"""
+Таблица стратегии: действие для каждого абстрактного состояния, один байт на состояние.
+
+Абстрактное состояние игрока: вид решения, верхняя карта, своя рука (число карт каждого
+значения, обрезанное до 0, 1, 2+), корзина наименьшей руки среди не вышедших соперников
+и корзина размера колоды. Таблица строится заранее (train) и записывается в файл,
+который бот открывает через mmap: процессы с одной таблицей делят страницы файлового
+кэша, а загрузка не читает файл целиком.
+
+Обучение - Monte Carlo по партиям самоигры: в каждом решении, встреченном на траектории,
+каждое допустимое действие оценивается несколькими доигрываниями раунда (остаток
+раунда - политика Bot), в таблицу записывается действие с наименьшими средними очками.
+Траектории следующих проходов играются уже по таблице.
+
+    python -m src.policy_table --rounds 200000 --out policy.bin
+"""
+import argparse
+import mmap
+import os
+import random
+import struct
+import typing
+from pathlib import Path
+
+from src.card import LlamaCard
+from src.deck import Deck, make_rng
+from src.simulation import (N_VALUES, VALUES_BY_MASK, RoundSim, CARD, QUIT_OR_DRAW, AGAIN, QUIT, DRAW, PLAY, PASS,
+                            N_ACTIONS)
+
+MAGIC = b'LAMAPOL1'
+_HEADER = struct.Struct('<8sI')
+UNKNOWN = 0xFF  # состояние не встречалось при обучении
+
+HAND_STATES = 3 ** N_VALUES
+# корзины: наименьшая рука не вышедших соперников (0 - все вышли) и размер колоды
+_OPPONENT_BUCKET = (0, 1, 2, 3, 4, 4) + (5,) * 64
+_DECK_BUCKET = (0, 1, 1, 2, 2, 2, 2) + (3,) * 8 + (4,) * 64
+OPPONENT_BUCKETS = 6
+DECK_BUCKETS = 5
+N_KINDS = 3
+SIZE = N_KINDS * len(LlamaCard.VALUES) * OPPONENT_BUCKETS * DECK_BUCKETS * HAND_STATES
+_POW3 = tuple(3 ** v for v in range(N_VALUES))
+
+
+def state_index(kind: int, hand: typing.Sequence[int], top: int, opponent_min: int, deck_size: int) -> int:
+    """Номер абстрактного состояния; opponent_min - наименьшая рука не вышедших соперников (0 - таких нет)."""
+    index = ((kind * N_VALUES + top) * OPPONENT_BUCKETS + _OPPONENT_BUCKET[opponent_min]) * DECK_BUCKETS
+    index = (index + _DECK_BUCKET[deck_size]) * HAND_STATES
+    for value in range(N_VALUES):
+        count = hand[value]
+        if count:
+            index += _POW3[value] * (2 if count > 1 else 1)
+    return index
+
+
+def opponent_min(sizes: typing.Sequence[int], quit: typing.Sequence[bool], seat: int) -> int:
+    active = [size for i, size in enumerate(sizes) if i != seat and not quit[i]]
+    return min(active) if active else 0
+
+
+def sim_index(sim: RoundSim, seat: int, kind: int) -> int:
+    return state_index(kind, sim.counts[seat], sim.top, opponent_min(sim.sizes, sim.quit, seat), len(sim.deck))
+
+
+class PolicyTable:
+    """Таблица, открытая только для чтения через mmap."""
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as fin:
+            self._map = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, size = _HEADER.unpack_from(self._map)
+        if magic != MAGIC or size != SIZE or len(self._map) != _HEADER.size + size:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a policy table of this version")
+
+    def __getitem__(self, index: int) -> int:
+        return self._map[_HEADER.size + index]
+
+    def close(self):
+        self._map.close()
+
+    @staticmethod
+    def write(path: str | Path, table: bytes | bytearray):
+        """Записывает таблицу атомарно (через временный файл)."""
+        if len(table) != SIZE:
+            raise ValueError(f"Policy table must have {SIZE} entries")
+        path = Path(path)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as fout:
+            fout.write(_HEADER.pack(MAGIC, SIZE))
+            fout.write(table)
+        os.replace(tmp, path)
+
+
+_open_tables: dict[Path, PolicyTable] = {}
+
+
+def open_table(path: str | Path) -> PolicyTable:
+    """Таблица по пути; в процессе каждая таблица отображается в память один раз."""
+    path = Path(path).resolve()
+    table = _open_tables.get(path)
+    if table is None:
+        table = _open_tables[path] = PolicyTable(path)
+    return table
+
+
+# --- обучение ---
+
+def _decide(policy: bytearray, sim: RoundSim, seat: int, kind: int, actions: tuple[int, ...]) -> int:
+    action = policy[sim_index(sim, seat, kind)]
+    return action if action in actions else actions[0]
+
+
+def _evaluate(stats: dict, sim: RoundSim, seat: int, kind: int, actions: tuple[int, ...], samples: int):
+    # средние очки игрока seat за раунд после каждого действия (доигрывание - политика Bot)
+    entry = stats.get(index := sim_index(sim, seat, kind))
+    if entry is None:
+        entry = stats[index] = [[0] * N_ACTIONS, [0] * N_ACTIONS]
+    counts, sums = entry
+    for action in actions:
+        for _ in range(samples):
+            copy = sim.copy()
+            copy.take_action(seat, kind, action)
+            if not copy.end_turn():
+                copy.rollout()
+            counts[action] += 1
+            sums[action] += copy.points()[seat]
+
+
+def _play_round(policy: bytearray, stats: dict, sim: RoundSim, samples: int):
+    # раунд самоигры по текущей таблице; все решения с выбором оцениваются
+    while True:
+        seat = sim.current
+        if not sim.quit[seat]:
+            playable = sim.playable(seat)
+            if playable:
+                actions = VALUES_BY_MASK[playable]
+                action = actions[0]
+                if len(actions) > 1:
+                    _evaluate(stats, sim, seat, CARD, actions, samples)
+                    action = _decide(policy, sim, seat, CARD, actions)
+                sim.play(seat, action)
+            else:
+                _evaluate(stats, sim, seat, QUIT_OR_DRAW, (DRAW, QUIT), samples)
+                if _decide(policy, sim, seat, QUIT_OR_DRAW, (DRAW, QUIT)) == QUIT or sim.draw(seat) < 0:
+                    sim.quit_round(seat)
+                elif sim.playable(seat):
+                    _evaluate(stats, sim, seat, AGAIN, (PLAY, PASS), samples)
+                    sim.take_action(seat, AGAIN, _decide(policy, sim, seat, AGAIN, (PLAY, PASS)))
+        if sim.end_turn():
+            return
+
+
+def new_round(rng: random.Random, n_players: int, hand_size: int = 6) -> RoundSim:
+    """Свежая раздача: перемешанная колода, руки и открытая верхняя карта."""
+    deck = Deck(rng=rng)
+    hands = deck.deal(n_players, hand_size)
+    counts = []
+    for cards in hands:
+        hand = [0] * N_VALUES
+        for card in cards:
+            hand[card.value] += 1
+        counts.append(hand)
+    top = deck.draw_card().value
+    return RoundSim(counts, list(deck.values), top, 0, [False] * n_players)
+
+
+def train(rounds: int, n_players: int = 3, samples: int = 2, passes: int = 2, seed: int = 0,
+          policy: bytearray | None = None, progress: typing.Callable[[int, int], None] | None = None) -> bytearray:
+    """
+    Строит таблицу самоигрой: passes проходов по rounds раундов.
+    Состояния, не встреченные в проходе, сохраняют прежнее действие.
+    """
+    policy = bytearray([UNKNOWN]) * SIZE if policy is None else bytearray(policy)
+    for current_pass in range(passes):
+        rng = make_rng(seed * 1000 + current_pass)
+        stats: dict[int, list] = {}
+        for r in range(rounds):
+            _play_round(policy, stats, new_round(rng, n_players), samples)
+            if progress is not None:
+                progress(current_pass, r + 1)
+        for index, (counts, sums) in stats.items():
+            best = min((a for a in range(N_ACTIONS) if counts[a]), key=lambda a: sums[a] / counts[a])
+            policy[index] = best
+    return policy
+
+
+def __main__(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Обучение таблицы стратегии Lama")
+    parser.add_argument('--rounds', type=int, default=100_000, help="раундов самоигры за проход")
+    parser.add_argument('--passes', type=int, default=2)
+    parser.add_argument('--samples', type=int, default=2, help="доигрываний на действие")
+    parser.add_argument('--players', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default='policy.bin')
+    args = parser.parse_args(argv)
+
+    def progress(current_pass, done):
+        if done % 1000 == 0 or done == args.rounds:
+            print(f"\rпроход {current_pass + 1}/{args.passes}: {done}/{args.rounds}", end='', flush=True)
+
+    policy = train(args.rounds, args.players, args.samples, args.passes, args.seed, progress=progress)
+    print()
+    PolicyTable.write(args.out, policy)
+    known = SIZE - policy.count(UNKNOWN)
+    print(f"{args.out}: {known} из {SIZE} состояний")
+
+
+if __name__ == "__main__":
+    __main__()
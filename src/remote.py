@@ -0,0 +1,264 @@
+"""
+Игроки в других процессах: протокол поверх TCP и RemotePlayer.
+
+Протокол - строки JSON (одно сообщение - одна строка). Сервер шлёт запросы решений
+    {"id": 7, "seat": "Alex", "op": "choose_card", "hand": [1, 1, 4], "top": 3}
+    {"id": 8, "seat": "Alex", "op": "choose_quit", "hand": [1, 1, 4], "top": 3}
+    {"id": 9, "seat": "Alex", "op": "choose_to_play", "top": 3, "drawn": 4}
+и пачки уведомлений
+    {"op": "inform", "events": [["Alex", "card_played", "Bob", 4], ["Alex", "round_begin"], ...]}
+Перед решением игрок получает событие
+    ["Alex", "game_state", seat, names, hand_sizes, deck_size, quit_flags, hand, top]
+с тем, что он может знать; клиент восстанавливает по нему GameState для inform_game_state
+(чужие руки и колода - заглушки нужного размера).
+клиент отвечает {"id": 7, "result": 4} (карта - её значение, null - не играть) или {"id": 7, "error": "..."}.
+
+Запросы идут конвейером: на одном соединении может быть сколько угодно неотвеченных
+запросов (например, от разных столов GameHost), ответы сопоставляются по id.
+Уведомления inform_* не отправляются по одному: они копятся и уходят одной строкой
+перед следующим запросом или в конце текущей итерации цикла событий.
+
+RemotePlayer работает в асинхронном хосте (src/async_host.py). Эталонный клиент:
+
+    python -m src.remote --port 7777 --player Bot
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import typing
+
+from src.card import LlamaCard, CARDS
+from src.deck import Deck
+from src.game_state import GameState
+from src.hand import Hand
+from src.player import Player
+from src.player_interaction import PlayerInteraction
+
+LINE_LIMIT = 1 << 20
+
+
+def encode(message: dict) -> bytes:
+    return json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+class RemoteError(Exception):
+    """Клиент не смог принять решение."""
+
+
+class RemoteConnection:
+    """Серверная сторона соединения с клиентом; на одном соединении может быть много игроков."""
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+        self._pending: dict[int, asyncio.Future] = {}
+        self._events: list[list] = []
+        self._flush_scheduled = False
+        self._loop = asyncio.get_running_loop()
+        self._reader_task = self._loop.create_task(self._read_loop())
+
+    def player(self, name: str, seat: str | None = None) -> 'RemotePlayer':
+        return RemotePlayer(name, self, seat)
+
+    def notify(self, seat: str, event: str, *args):
+        self._events.append([seat, event, *args])
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        if self._events and not self.writer.is_closing():
+            self.writer.write(encode({'op': 'inform', 'events': self._events}))
+            self._events = []
+
+    async def request(self, seat: str, op: str, **fields):
+        request_id = next(self._ids)
+        future = self._loop.create_future()
+        self._pending[request_id] = future
+        try:
+            self._flush()  # уведомления раньше запроса, чтобы клиент видел их до решения
+            self.writer.write(encode({'id': request_id, 'seat': seat, 'op': op, **fields}))
+            await self.writer.drain()
+            return await future
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def _read_loop(self):
+        try:
+            while line := await self.reader.readline():
+                message = json.loads(line)
+                future = self._pending.get(message.get('id'))
+                if future is None or future.done():
+                    continue  # ответ на запрос, который уже не ждут (тайм-аут)
+                if 'error' in message:
+                    future.set_exception(RemoteError(message['error']))
+                else:
+                    future.set_result(message.get('result'))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("Remote client disconnected"))
+
+    async def close(self):
+        self._flush()
+        self.writer.close()
+        await self.writer.wait_closed()
+        self._reader_task.cancel()
+
+
+async def open_server(on_connection: typing.Callable[[RemoteConnection], typing.Awaitable | None],
+                      host: str = '127.0.0.1', port: int = 0) -> asyncio.Server:
+    """TCP-сервер: для каждого клиента создаётся RemoteConnection и вызывается on_connection."""
+    async def accept(reader, writer):
+        result = on_connection(RemoteConnection(reader, writer))
+        if result is not None:
+            await result
+    return await asyncio.start_server(accept, host, port, limit=LINE_LIMIT)
+
+
+def _values(hand: Hand) -> list[int]:
+    return [card.value for card in hand.cards]
+
+
+class RemotePlayer(PlayerInteraction):
+    """Игрок, решения которого принимает клиент на другом конце соединения."""
+    def __init__(self, name: str, connection: RemoteConnection, seat: str | None = None):
+        self.name = name
+        self.connection = connection
+        self.seat = seat if seat is not None else name
+
+    def __str__(self):
+        return "RemotePlayer"
+
+    async def choose_card_async(self, hand: Hand, top: LlamaCard) -> LlamaCard | None:
+        value = await self.connection.request(self.seat, 'choose_card', hand=_values(hand), top=top.value)
+        return None if value is None else CARDS[value]
+
+    async def choose_quit_async(self, hand: Hand, top: LlamaCard) -> bool:
+        return bool(await self.connection.request(self.seat, 'choose_quit', hand=_values(hand), top=top.value))
+
+    async def choose_to_play_async(self, top: LlamaCard, drawn: LlamaCard) -> bool:
+        return bool(await self.connection.request(self.seat, 'choose_to_play', top=top.value, drawn=drawn.value))
+
+    def choose_card(self, hand: Hand, top: LlamaCard, hand_counts: list[int] | None = None) -> LlamaCard | None:
+        raise RuntimeError("RemotePlayer decisions are only available in the async host")
+
+    choose_quit = choose_to_play = choose_card
+
+    def inform_card_played(self, player: Player, card: LlamaCard):
+        self.connection.notify(self.seat, 'card_played', player.name, card.value)
+
+    def inform_card_drawn(self, player: Player, card: LlamaCard):
+        self.connection.notify(self.seat, 'card_drawn', player.name, card.value)
+
+    def inform_round_begin(self, game_state):
+        self.connection.notify(self.seat, 'round_begin')
+
+    def inform_game_state(self, game_state, seat: int):
+        # только то, что игрок может знать: своя рука, размеры рук, размер колоды, флаги выхода, верхняя карта
+        players = game_state.players
+        top = game_state.top
+        self.connection.notify(self.seat, 'game_state', seat, [p.name for p in players],
+                               [len(p.hand) for p in players], len(game_state.deck), [p.quit for p in players],
+                               _values(players[seat].hand), None if top is None else top.value)
+
+
+def visible_state(seat: int, names: list[str], sizes: list[int], deck_size: int, quit: list[bool],
+                  hand: list[int], top: int | None) -> GameState:
+    """Состояние стола глазами игрока seat: чужие карты и колода - заглушки (ламы) известного размера."""
+    players = []
+    for i, (name, size, quit_flag) in enumerate(zip(names, sizes, quit)):
+        cards = [CARDS[value] for value in hand] if i == seat else [CARDS[0]] * size
+        player = Player(name, Hand(cards))
+        player.quit = quit_flag
+        players.append(player)
+    return GameState(players, Deck.from_values(bytes(deck_size)), None if top is None else CARDS[top], seat)
+
+
+class RemoteClient:
+    """
+    Эталонный клиент: каждое место (seat) обслуживает свой объект PlayerInteraction,
+    созданный factory(seat). Запросы обрабатываются в порядке поступления.
+    """
+    def __init__(self, factory: typing.Callable[[str], PlayerInteraction]):
+        self.factory = factory
+        self.interactions: dict[str, PlayerInteraction] = {}
+        self._players: dict[str, Player] = {}  # соперники по именам для уведомлений
+        self.requests = 0
+
+    def interaction(self, seat: str) -> PlayerInteraction:
+        interaction = self.interactions.get(seat)
+        if interaction is None:
+            interaction = self.interactions[seat] = self.factory(seat)
+        return interaction
+
+    def _player(self, name: str) -> Player:
+        player = self._players.get(name)
+        if player is None:
+            player = self._players[name] = Player(name, Hand())
+        return player
+
+    def handle(self, message: dict) -> dict | None:
+        """Ответ на сообщение сервера; на пачку уведомлений ответа нет."""
+        op = message['op']
+        if op == 'inform':
+            for seat, event, *args in message['events']:
+                interaction = self.interaction(seat)
+                if event == 'card_played':
+                    interaction.inform_card_played(self._player(args[0]), CARDS[args[1]])
+                elif event == 'card_drawn':
+                    interaction.inform_card_drawn(self._player(args[0]), CARDS[args[1]])
+                elif event == 'round_begin':
+                    interaction.inform_round_begin(None)
+                elif event == 'game_state':
+                    interaction.inform_game_state(visible_state(*args), args[0])
+            return None
+        self.requests += 1
+        interaction = self.interaction(message['seat'])
+        try:
+            if op == 'choose_to_play':
+                result = bool(interaction.choose_to_play(CARDS[message['top']], CARDS[message['drawn']]))
+            else:
+                hand = Hand([CARDS[value] for value in message['hand']])
+                if op == 'choose_card':
+                    card = interaction.choose_card(hand, CARDS[message['top']])
+                    result = None if card is None else card.value
+                elif op == 'choose_quit':
+                    result = bool(interaction.choose_quit(hand, CARDS[message['top']]))
+                else:
+                    return {'id': message['id'], 'error': f"unknown op {op!r}"}
+        except Exception as error:  # ошибка игрока не должна рвать соединение
+            return {'id': message['id'], 'error': repr(error)}
+        return {'id': message['id'], 'result': result}
+
+    async def serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Обрабатывает сообщения, пока сервер не закроет соединение."""
+        try:
+            while line := await reader.readline():
+                reply = self.handle(json.loads(line))
+                if reply is not None:
+                    writer.write(encode(reply))
+                    await writer.drain()
+        finally:
+            writer.close()
+
+    async def connect(self, host: str = '127.0.0.1', port: int = 7777):
+        reader, writer = await asyncio.open_connection(host, port, limit=LINE_LIMIT)
+        await self.serve(reader, writer)
+
+
+def __main__(argv: list[str] | None = None):
+    from src.tournament import resolve_strategy
+    parser = argparse.ArgumentParser(description="Клиент удалённого игрока Lama")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--player', default='Bot', help="имя из all_player_types или путь 'модуль:Класс'")
+    args = parser.parse_args(argv)
+    strategy = resolve_strategy(args.player)
+    asyncio.run(RemoteClient(strategy).connect(args.host, args.port))
+
+
+if __name__ == "__main__":
+    __main__()
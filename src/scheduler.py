@@ -0,0 +1,104 @@
+"""
+Планировщик партий в одном потоке, без потоков и asyncio.
+
+    scheduler = Scheduler()
+    for seed in range(10000):
+        scheduler.add(GameServer.new_game(players(), seed=seed, headless=True))
+    servers = scheduler.run()
+
+Каждая партия - генератор GameServer.play(): он выдаёт DecisionRequest и получает ответ
+через send(). За один такт step() планировщик продвигает до batch_size партий до их
+следующего решения, затем отвечает на все собранные запросы разом. Для типа игрока можно
+зарегистрировать пакетное решение (register): оно получает запросы всех партий сразу,
+остальным игрокам вопросы задаются по одному, как в GameServer.run().
+"""
+import collections
+import typing
+
+from src.GameServer import GameServer, DecisionRequest
+from src.player_interaction import PlayerInteraction
+from src.player_interactions.ai_player import Bot
+
+BatchDecider = typing.Callable[[list[DecisionRequest]], list]
+
+
+def bot_batch(requests: list[DecisionRequest]) -> list:
+    """Решения Bot для пачки запросов."""
+    answers = []
+    for request in requests:
+        if request.method == 'choose_card':
+            answers.append(request.playable_cards[0])  # запрос choose_card бывает только с играбельными картами
+        elif request.method == 'choose_quit':
+            answers.append(False)
+        else:
+            top, card = request.args
+            answers.append(card.can_play_on(top))
+    return answers
+
+
+class Scheduler:
+    def __init__(self, batch_size: int = 1024):
+        self.batch_size = batch_size  # сколько партий продвигается за такт
+        self.deciders: dict[type[PlayerInteraction], BatchDecider] = {}
+        self.finished: list[GameServer] = []
+        self.decisions = 0  # решений принято
+        self._ready: collections.deque[tuple[GameServer, typing.Generator, object]] = collections.deque()
+
+    def register(self, interaction_type: type[PlayerInteraction], decider: BatchDecider = bot_batch):
+        """Решения игроков типа interaction_type (точно этого типа, не наследников) принимаются пачкой."""
+        self.deciders[interaction_type] = decider
+
+    def add(self, server: GameServer):
+        self._ready.append((server, server.play(), None))
+
+    def __len__(self):
+        """Сколько партий ещё не закончено."""
+        return len(self._ready)
+
+    def step(self) -> int:
+        """Один такт: продвигает партии до их следующих решений и отвечает на них; возвращает число решений."""
+        games = []
+        requests = []
+        for _ in range(min(self.batch_size, len(self._ready))):
+            server, game, answer = self._ready.popleft()
+            try:
+                request = game.send(answer)
+            except StopIteration:
+                self.finished.append(server)
+                continue
+            games.append((server, game))
+            requests.append(request)
+        for (server, game), answer in zip(games, self._decide(requests)):
+            self._ready.append((server, game, answer))
+        self.decisions += len(requests)
+        return len(requests)
+
+    def _decide(self, requests: list[DecisionRequest]) -> list:
+        answers = [None] * len(requests)
+        batches: dict[BatchDecider, list[int]] = {}
+        for i, request in enumerate(requests):
+            decider = self.deciders.get(type(request.interaction))
+            if decider is None:
+                answers[i] = request.ask()
+            else:
+                batches.setdefault(decider, []).append(i)
+        for decider, indices in batches.items():
+            for i, answer in zip(indices, decider([requests[i] for i in indices])):
+                answers[i] = answer
+        return answers
+
+    def run(self) -> list[GameServer]:
+        """Доигрывает все партии; возвращает их в порядке окончания."""
+        while self._ready:
+            self.step()
+        return self.finished
+
+
+def run_games(servers: typing.Iterable[GameServer], batch_bots: bool = True, **kwargs) -> list[GameServer]:
+    """Доигрывает партии servers в одном потоке; batch_bots - решения Bot пачками."""
+    scheduler = Scheduler(**kwargs)
+    if batch_bots:
+        scheduler.register(Bot)
+    for server in servers:
+        scheduler.add(server)
+    return scheduler.run()
@@ -0,0 +1,213 @@
+"""
+Быстрая модель раунда для поиска (MCTS-бот, перебор эндшпиля).
+
+Руки хранятся гистограммами значений карт и битовыми масками, колода - списком значений
+(верхняя карта последняя). Ход по умолчанию повторяет Bot на HistogramHand: сыграть первую
+играбельную карту в порядке LlamaCard.VALUES, иначе взять карту (из пустой колоды - выйти
+из раунда) и сыграть первую играбельную. Конец раунда и очки - как в GameServer.
+"""
+import random
+import typing
+
+from src.card import LlamaCard, PLAYABLE_MASK, CARDS_BY_MASK
+
+N_VALUES = len(LlamaCard.VALUES)
+
+# Виды решений игрока: выбор карты, выход или взятие карты, игра после взятия
+CARD, QUIT_OR_DRAW, AGAIN = 0, 1, 2
+# Коды действий: сыграть карту значения v - код v
+QUIT, DRAW, PLAY, PASS = N_VALUES, N_VALUES + 1, N_VALUES + 2, N_VALUES + 3
+N_ACTIONS = N_VALUES + 4
+
+# играбельные значения по маске в порядке LlamaCard.VALUES и первое из них
+VALUES_BY_MASK: tuple[tuple[int, ...], ...] = tuple(tuple(c.value for c in cards) for cards in CARDS_BY_MASK)
+FIRST_BY_MASK: tuple[int, ...] = tuple(values[0] if values else -1 for values in VALUES_BY_MASK)
+
+
+def hand_histogram(hand) -> list[int]:
+    """Гистограмма руки (Hand или HistogramHand): counts[value] - число карт значения value."""
+    counts = getattr(hand, 'counts', None)
+    if counts is not None:
+        return list(counts)
+    counts = [0] * N_VALUES
+    for card in hand.cards:
+        counts[card.value] += 1
+    return counts
+
+
+def counts_mask(counts: typing.Sequence[int]) -> int:
+    mask = 0
+    for value in range(N_VALUES):
+        if counts[value]:
+            mask |= 1 << value
+    return mask
+
+
+def round_points(counts: typing.Sequence[int]) -> int:
+    """Очки руки в конце раунда, как в GameServer.round_end: сумма различных значений."""
+    return sum(value for value in range(N_VALUES) if counts[value])
+
+
+class RoundSim:
+    """Состояние раунда с полной информацией: руки всех игроков, колода, верхняя карта, флаги quit."""
+    __slots__ = ('counts', 'masks', 'sizes', 'deck', 'top', 'current', 'quit', 'active')
+
+    def __init__(self, counts: list[list[int]], deck: list[int], top: int, current: int, quit: list[bool]):
+        self.counts = counts
+        self.masks = [counts_mask(c) for c in counts]
+        self.sizes = [sum(c) for c in counts]
+        self.deck = deck
+        self.top = top
+        self.current = current
+        self.quit = quit
+        self.active = quit.count(False)  # число игроков, не вышедших из раунда
+
+    @classmethod
+    def from_game_state(cls, game_state) -> typing.Self:
+        return cls(
+            [hand_histogram(p.hand) for p in game_state.players],
+            list(game_state.deck.values),
+            game_state.top.value,
+            game_state.current_player_index,
+            [p.quit for p in game_state.players],
+        )
+
+    def copy(self) -> typing.Self:
+        sim = RoundSim.__new__(RoundSim)
+        sim.counts = [list(c) for c in self.counts]
+        sim.masks = list(self.masks)
+        sim.sizes = list(self.sizes)
+        sim.deck = list(self.deck)
+        sim.top = self.top
+        sim.current = self.current
+        sim.quit = list(self.quit)
+        sim.active = self.active
+        return sim
+
+    def playable(self, seat: int) -> int:
+        """Маска значений, которые игрок seat может сыграть на верхнюю карту."""
+        return self.masks[seat] & PLAYABLE_MASK[self.top]
+
+    def play(self, seat: int, value: int):
+        counts = self.counts[seat]
+        counts[value] -= 1
+        if not counts[value]:
+            self.masks[seat] &= ~(1 << value)
+        self.sizes[seat] -= 1
+        self.top = value
+
+    def draw(self, seat: int) -> int:
+        """Игрок берёт верхнюю карту колоды; -1, если колода пуста."""
+        if not self.deck:
+            return -1
+        value = self.deck.pop()
+        self.counts[seat][value] += 1
+        self.masks[seat] |= 1 << value
+        self.sizes[seat] += 1
+        return value
+
+    def quit_round(self, seat: int):
+        self.quit[seat] = True
+        self.active -= 1
+
+    def default_turn(self, seat: int):
+        """Ход игрока seat политикой по умолчанию (фазы CHOOSE_CARD, DRAW_EXTRA, CHOOSE_CARD_AGAIN)."""
+        if self.quit[seat]:
+            return
+        playable = self.masks[seat] & PLAYABLE_MASK[self.top]
+        if not playable:
+            if self.draw(seat) < 0:
+                self.quit_round(seat)
+                return
+            playable = self.masks[seat] & PLAYABLE_MASK[self.top]
+            if not playable:
+                return
+        self.play(seat, FIRST_BY_MASK[playable])
+
+    def take_action(self, seat: int, kind: int, action: int):
+        """Действие action игрока seat в решении вида kind; остаток хода - политикой по умолчанию."""
+        if kind == CARD:
+            self.play(seat, action)
+            return
+        if kind == QUIT_OR_DRAW:
+            if action == QUIT or self.draw(seat) < 0:
+                self.quit_round(seat)
+                return
+            action = PLAY
+        playable = self.playable(seat)
+        if action == PLAY and playable:
+            self.play(seat, FIRST_BY_MASK[playable])
+
+    def end_turn(self) -> bool:
+        """Фаза NEXT_PLAYER: True, если раунд окончен, иначе ход переходит следующему игроку."""
+        current = self.current
+        if not self.sizes[current] or not self.active:
+            return True
+        self.current = (current + 1) % len(self.sizes)
+        return False
+
+    def rollout(self):
+        """Доигрывает раунд политикой по умолчанию, начиная с хода текущего игрока."""
+        # то же, что default_turn + end_turn в цикле, но на локальных переменных
+        counts, masks, sizes, deck, quit = self.counts, self.masks, self.sizes, self.deck, self.quit
+        top, current, active, n = self.top, self.current, self.active, len(sizes)
+        while True:
+            if not quit[current]:
+                mask = masks[current]
+                playable = mask & PLAYABLE_MASK[top]
+                if not playable and deck:
+                    value = deck.pop()
+                    counts[current][value] += 1
+                    mask = masks[current] = mask | 1 << value
+                    sizes[current] += 1
+                    playable = mask & PLAYABLE_MASK[top]
+                elif not playable:
+                    quit[current] = True
+                    active -= 1
+                if playable:
+                    top = FIRST_BY_MASK[playable]
+                    hand = counts[current]
+                    hand[top] -= 1
+                    if not hand[top]:
+                        masks[current] = mask & ~(1 << top)
+                    sizes[current] -= 1
+            if not sizes[current] or not active:
+                break
+            current += 1
+            if current == n:
+                current = 0
+        self.top, self.current, self.active = top, current, active
+
+    def points(self) -> list[int]:
+        return [round_points(c) for c in self.counts]
+
+
+def unseen_counts(own: typing.Sequence[int], played: typing.Sequence[int]) -> list[int]:
+    """Карты раунда, которых игрок не видел: вся колода без своей руки и сыгранных карт."""
+    return [max(0, LlamaCard.COPIES - own[v] - played[v]) for v in range(N_VALUES)]
+
+
+def determinize(seat: int, own: list[int], sizes: typing.Sequence[int], deck_size: int,
+                unseen: typing.Sequence[int], top: int, current: int, quit: list[bool],
+                rng: random.Random) -> RoundSim:
+    """
+    Случайная расстановка невидимых карт, согласованная с тем, что знает игрок seat:
+    своя рука, размеры чужих рук и колоды. Если невидимых карт больше, чем нужно
+    (например, начальная верхняя карта не была объявлена), берётся случайное подмножество.
+    """
+    pool = [v for v in range(N_VALUES) for _ in range(unseen[v])]
+    rand = rng.random
+    pool.sort(key=lambda _: rand())  # случайная перестановка; быстрее random.shuffle на малых списках
+    counts = []
+    pos = 0
+    for other, size in enumerate(sizes):
+        if other == seat:
+            counts.append(list(own))
+            continue
+        hand = [0] * N_VALUES
+        for v in pool[pos:pos + size]:
+            hand[v] += 1
+        pos += size
+        counts.append(hand)
+    deck = pool[pos:pos + deck_size]
+    return RoundSim(counts, deck, top, current, list(quit))
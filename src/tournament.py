@@ -0,0 +1,260 @@
+"""
+Турнир стратегий (классов PlayerInteraction): много партий с детерминированными seed.
+
+Партия i играется с seed game_seed(seed, i) и рассадкой rotations[i % len(rotations)]
+(по умолчанию - все циклические сдвиги, чтобы ни одна стратегия не сидела всегда первой).
+Партии раздаются пакетами по процессам; каждый процесс возвращает суммы по пакету,
+поэтому итог не зависит ни от числа процессов, ни от порядка завершения пакетов.
+
+    python -m src.tournament Bot Bot --games 10000 --workers 8
+"""
+import argparse
+import concurrent.futures
+import hashlib
+import importlib
+import math
+import os
+import random
+import sys
+import typing
+
+from src.GameServer import GameServer
+from src.game_log import NULL_LOG
+from src.hand import Hand, HistogramHand
+from src.player import Player
+from src.player_interaction import PlayerInteraction
+from src.player_interactions.init import all_player_types
+
+Z_95 = 1.96  # квантиль нормального распределения для 95% доверительного интервала
+
+
+def game_seed(seed: int, index: int) -> int:
+    """Seed партии index турнира seed; не зависит от того, какой процесс играет партию."""
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def cyclic_rotations(n: int) -> list[tuple[int, ...]]:
+    """Все циклические сдвиги рассадки: rotation[seat] - номер стратегии на месте seat."""
+    return [tuple((seat + shift) % n for seat in range(n)) for shift in range(n)]
+
+
+def play_game(strategies: typing.Sequence[type[PlayerInteraction]], rotation: typing.Sequence[int],
+              seed: int, hand_type: type[Hand] = HistogramHand) -> tuple[list[int], int, int]:
+    """
+    Играет одну партию без интерфейса.
+    :return: очки каждой стратегии, номер стратегии-победителя и число раундов.
+    """
+    # генераторы стратегий без явного seed (make_rng()) берутся из глобального random:
+    # на время партии он получает seed партии, потом состояние вызывающего возвращается
+    caller_state = random.getstate()
+    random.seed(seed)
+    try:
+        players = {}
+        for seat, index in enumerate(rotation):
+            name = f"P{seat}_{strategies[index].__name__}"  # имена уникальны: Player сравнивается по имени
+            players[Player(name, hand_type())] = strategies[index](name)
+        server = GameServer.new_game(players, seed=seed, headless=True, log=NULL_LOG)
+        server.run()
+    finally:
+        random.setstate(caller_state)
+    scores = [0] * len(strategies)
+    winner = -1
+    for player, index in zip(server.game_state.players, rotation):
+        scores[index] = player.score
+        if player is server.winner:
+            winner = index
+    return scores, winner, server.rounds_played
+
+
+class TournamentStats:
+    """Суммы по сыгранным партиям; складываются между пакетами (merge)."""
+    def __init__(self, n: int):
+        self.games = 0
+        self.wins = [0] * n
+        self.score_sum = [0] * n
+        self.score_sq = [0] * n
+        self.rounds_sum = 0
+        self.rounds_sq = 0
+
+    def add_game(self, scores: list[int], winner: int, rounds: int):
+        self.games += 1
+        if winner >= 0:
+            self.wins[winner] += 1
+        for i, score in enumerate(scores):
+            self.score_sum[i] += score
+            self.score_sq[i] += score * score
+        self.rounds_sum += rounds
+        self.rounds_sq += rounds * rounds
+
+    def merge(self, other: 'TournamentStats'):
+        self.games += other.games
+        for i in range(len(self.wins)):
+            self.wins[i] += other.wins[i]
+            self.score_sum[i] += other.score_sum[i]
+            self.score_sq[i] += other.score_sq[i]
+        self.rounds_sum += other.rounds_sum
+        self.rounds_sq += other.rounds_sq
+
+    def copy(self) -> 'TournamentStats':
+        stats = TournamentStats(len(self.wins))
+        stats.merge(self)
+        return stats
+
+
+def wilson_interval(successes: int, n: int, z: float = Z_95) -> tuple[float, float]:
+    """Доверительный интервал Уилсона для доли успехов."""
+    if n == 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def mean_interval(total: int, total_sq: int, n: int, z: float = Z_95) -> tuple[float, float, float]:
+    """Среднее и нормальный доверительный интервал для среднего: (mean, low, high)."""
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    mean = total / n
+    var = (total_sq - total * total / n) / (n - 1) if n > 1 else 0.0
+    half = z * math.sqrt(max(var, 0.0) / n)
+    return mean, mean - half, mean + half
+
+
+class TournamentResult:
+    """Итоги турнира (или его части при потоковой выдаче)."""
+    def __init__(self, names: list[str], stats: TournamentStats, total_games: int):
+        self.names = names
+        self.stats = stats
+        self.total_games = total_games
+
+    @property
+    def games(self) -> int:
+        return self.stats.games
+
+    def win_rate(self, index: int) -> tuple[float, float, float]:
+        """Доля побед стратегии и 95% интервал Уилсона: (rate, low, high)."""
+        stats = self.stats
+        rate = stats.wins[index] / stats.games if stats.games else 0.0
+        return (rate, *wilson_interval(stats.wins[index], stats.games))
+
+    def mean_score(self, index: int) -> tuple[float, float, float]:
+        """Средний итоговый счёт стратегии и 95% интервал: (mean, low, high)."""
+        return mean_interval(self.stats.score_sum[index], self.stats.score_sq[index], self.stats.games)
+
+    def mean_rounds(self) -> tuple[float, float, float]:
+        """Среднее число раундов за партию и 95% интервал: (mean, low, high)."""
+        return mean_interval(self.stats.rounds_sum, self.stats.rounds_sq, self.stats.games)
+
+    def to_dict(self) -> dict:
+        return {
+            'games': self.games,
+            'rounds': self.mean_rounds(),
+            'strategies': [
+                {'name': name, 'wins': self.stats.wins[i], 'win_rate': self.win_rate(i), 'score': self.mean_score(i)}
+                for i, name in enumerate(self.names)
+            ],
+        }
+
+    def format(self) -> str:
+        lines = [f"Партий: {self.games}/{self.total_games}"]
+        for i, name in enumerate(self.names):
+            rate, low, high = self.win_rate(i)
+            mean, s_low, s_high = self.mean_score(i)
+            lines.append(f"{name:>16}: победы {rate:6.1%} [{low:.1%}, {high:.1%}]"
+                         f"  счёт {mean:6.2f} [{s_low:.2f}, {s_high:.2f}]")
+        mean, low, high = self.mean_rounds()
+        lines.append(f"{'раундов':>16}: {mean:.2f} [{low:.2f}, {high:.2f}]")
+        return "\n".join(lines)
+
+
+def _play_chunk(strategies, rotations, seed, start, stop, hand_type) -> TournamentStats:
+    # выполняется в процессе пула: партии start..stop-1, наружу передаются только суммы
+    stats = TournamentStats(len(strategies))
+    for i in range(start, stop):
+        stats.add_game(*play_game(strategies, rotations[i % len(rotations)], game_seed(seed, i), hand_type))
+    return stats
+
+
+class Tournament:
+    def __init__(self, strategies: typing.Sequence[type[PlayerInteraction]], games: int, seed: int = 0,
+                 rotations: typing.Sequence[typing.Sequence[int]] | None = None, workers: int | None = None,
+                 chunk_size: int | None = None, hand_type: type[Hand] = HistogramHand):
+        n = len(strategies)
+        if n < 2:
+            raise ValueError("A tournament needs at least two strategies")
+        self.strategies = list(strategies)
+        self.games = games
+        self.seed = seed
+        self.rotations = [tuple(r) for r in rotations] if rotations is not None else cyclic_rotations(n)
+        for rotation in self.rotations:
+            if sorted(rotation) != list(range(n)):
+                raise ValueError(f"Rotation {rotation} is not a permutation of {n} strategies")
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        # пакеты крупные, чтобы накладные расходы пула были малы, но их хватало на всех процессов
+        self.chunk_size = chunk_size or max(1, min(256, games // (self.workers * 8) or 1))
+        self.hand_type = hand_type
+        self.names = self._names()
+
+    def _names(self) -> list[str]:
+        names = [cls.__name__ for cls in self.strategies]
+        return [f"{name}#{i}" if names.count(name) > 1 else name for i, name in enumerate(names)]
+
+    def _chunks(self) -> list[tuple[int, int]]:
+        return [(start, min(start + self.chunk_size, self.games)) for start in range(0, self.games, self.chunk_size)]
+
+    def stream(self) -> typing.Iterator[TournamentResult]:
+        """Играет турнир, выдавая накопленные итоги после каждого завершённого пакета партий."""
+        total = TournamentStats(len(self.strategies))
+        args = (self.strategies, self.rotations, self.seed)
+        if self.workers <= 1:
+            for start, stop in self._chunks():
+                total.merge(_play_chunk(*args, start, stop, self.hand_type))
+                yield TournamentResult(self.names, total.copy(), self.games)
+            return
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(_play_chunk, *args, start, stop, self.hand_type) for start, stop in self._chunks()]
+            for future in concurrent.futures.as_completed(futures):
+                total.merge(future.result())
+                yield TournamentResult(self.names, total.copy(), self.games)
+
+    def run(self) -> TournamentResult:
+        result = TournamentResult(self.names, TournamentStats(len(self.strategies)), self.games)
+        for result in self.stream():
+            pass
+        return result
+
+
+def resolve_strategy(name: str) -> type[PlayerInteraction]:
+    """Класс стратегии по имени из all_player_types или по пути 'модуль:Класс'."""
+    if ':' in name:
+        module, _, attr = name.partition(':')
+        return getattr(importlib.import_module(module), attr)
+    for cls in all_player_types:
+        if cls.__name__ == name:
+            return cls
+    raise ValueError(f"Unknown strategy {name!r}")
+
+
+def __main__(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Турнир стратегий Lama")
+    parser.add_argument('strategies', nargs='+', help="имена из all_player_types или пути 'модуль:Класс'")
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunk-size', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    tournament = Tournament([resolve_strategy(name) for name in args.strategies], args.games, seed=args.seed,
+                            workers=args.workers, chunk_size=args.chunk_size)
+    result = None
+    for result in tournament.stream():
+        print(f"\r{result.games}/{result.total_games}", end='', file=sys.stderr, flush=True)
+    print(file=sys.stderr)
+    print(result.format())
+
+
+if __name__ == "__main__":
+    __main__()
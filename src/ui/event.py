@@ -1,6 +1,8 @@
 from enum import IntEnum, auto
 import pygame
 
+from src.event_bus import EventBus, EventType, GameEvent
+
 class CustomEvent(IntEnum):
     PLAY_CARD = pygame.USEREVENT + 1   # Событие для игры карты
     DRAW_CARD = auto()                  # Событие для вытягивания карты
@@ -12,3 +14,19 @@ def post_event(event_type: int, **kwargs):
     event = pygame.event.Event(event_type)  # Создаем новое событие
     event.user_data = kwargs                  # Сохраняем дополнительные данные в user_data
     pygame.event.post(event)                  # Публикуем событие в очередь событий Pygame
+
+
+# события шины, которые интерфейс получает из очереди pygame
+_PYGAME_EVENTS = {
+    EventType.PLAY: CustomEvent.PLAY_CARD,
+    EventType.DRAW: CustomEvent.DRAW_CARD,
+    EventType.WINNER: CustomEvent.DECLARE_WINNER,
+}
+
+def _forward(event: GameEvent):
+    post_event(_PYGAME_EVENTS[event.type], card=event.card, player_index=event.player_index)
+
+def subscribe_pygame(bus: EventBus):
+    """ Переправляет события шины игры в очередь pygame (только при подключенном интерфейсе). """
+    bus.unsubscribe(_forward)  # несколько видов одной партии не дублируют события
+    bus.subscribe(_forward, *_PYGAME_EVENTS)
@@ -3,17 +3,144 @@ from src.card import LlamaCard
 from src.resource import RESOURCE as RSC
 from src.ui.event import CustomEvent
 
+
+class CardImages:
+    """
+    Общий на процесс кэш картинок карт: 7 лицевых сторон и рубашка, уже масштабированные
+    и приведённые к формату экрана (convert). Загружается один раз - явно при старте
+    интерфейса (CARD_IMAGES.load()) или при первом обращении.
+    """
+    MISSING_COLOR = 'gray'  # заливка вместо картинки, которую не удалось загрузить
+    SELECTED_COLOR = 'magenta'  # Цвет рамки выделенной карты
+    BORDER = (RSC["border_x"], RSC["border_y"])
+    _by_size: dict[tuple[int, int], 'CardImages'] = {}
+
+    def __init__(self, directory: str = 'img', size: tuple[int, int] = (RSC["card_width"], RSC["card_height"])):
+        self.directory = directory
+        self.size = size
+        self.fronts: list[pygame.Surface] = []
+        self.back: pygame.Surface | None = None
+        self._framed: dict[int, pygame.Surface] = {}
+
+    @classmethod
+    def for_size(cls, size: tuple[int, int]) -> 'CardImages':
+        """Общий кэш для карт размера size (например, для уменьшенных столов у зрителя)."""
+        images = cls._by_size.get(size)
+        if images is None:
+            images = cls._by_size[size] = cls(size=size)
+        return images
+
+    def load(self):
+        self.fronts = [self._load(f"{self.directory}/{value}.png") for value in range(len(LlamaCard.VALUES))]
+        self.back = self._load(f"{self.directory}/back.png")
+
+    def _load(self, path: str) -> pygame.Surface:
+        try:
+            img = pygame.transform.scale(pygame.image.load(path), self.size)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Ошибка загрузки изображения: {e}")
+            img = pygame.Surface(self.size)
+            img.fill(self.MISSING_COLOR)
+        if pygame.display.get_surface() is not None:
+            img = img.convert()  # формат экрана: blit без преобразования пикселей
+        return img
+
+    def front(self, card: LlamaCard) -> pygame.Surface:
+        if not self.fronts:
+            self.load()
+        return self.fronts[card.value]
+
+    def back_image(self) -> pygame.Surface:
+        if self.back is None:
+            self.load()
+        return self.back
+
+    def framed(self, card: LlamaCard) -> pygame.Surface:
+        """Лицевая сторона с рамкой выделения (размер больше карты на рамку с каждой стороны)."""
+        img = self._framed.get(card.value)
+        if img is None:
+            bx, by = self.BORDER
+            img = pygame.Surface((self.size[0] + 2 * bx, self.size[1] + 2 * by))
+            img.fill(self.SELECTED_COLOR)
+            img.blit(self.front(card), (bx, by))
+            if pygame.display.get_surface() is not None:
+                img = img.convert()
+            self._framed[card.value] = img
+        return img
+
+
+CARD_IMAGES = CardImages.for_size((RSC["card_width"], RSC["card_height"]))
+
+
+class CardSprite(pygame.sprite.DirtySprite):
+    """
+    Карта для групп спрайтов (pygame.sprite.LayeredDirty): картинки берутся из кэша,
+    image и rect пересчитываются в refresh() только при изменении карты, положения,
+    переворота или выделения; группа рисует лишь изменившиеся спрайты одним пакетом.
+    """
+    def __init__(self, images: CardImages, card: LlamaCard | None, x: int = 0, y: int = 0, opened: bool = True):
+        super().__init__()
+        self.images = images
+        self.card = card
+        self.x = x
+        self.y = y
+        self.opened = opened
+        self.selected = False
+        self._state = None
+        self.refresh()
+
+    def refresh(self):
+        state = (self.card, self.x, self.y, self.opened, self.selected)
+        if state == self._state:
+            return
+        self._state = state
+        if not self.opened or self.card is None:
+            self.image = self.images.back_image()
+            self.rect = self.image.get_rect(topleft=(self.x, self.y))
+        elif self.selected:
+            bx, by = self.images.BORDER
+            self.image = self.images.framed(self.card)
+            self.rect = self.image.get_rect(topleft=(self.x - bx, self.y - by))
+        else:
+            self.image = self.images.front(self.card)
+            self.rect = self.image.get_rect(topleft=(self.x, self.y))
+        self.dirty = 1
+
+    def update(self):
+        self.refresh()
+
+
+class _ViewState:
+    """Атрибут вида карты, изменение которого требует перерисовки (ставит dirty)."""
+    def __set_name__(self, owner, name):
+        self.name = '_' + name
+
+    def __get__(self, obj, objtype=None):
+        return self if obj is None else getattr(obj, self.name)
+
+    def __set__(self, obj, value):
+        if getattr(obj, self.name, None) != value:
+            setattr(obj, self.name, value)
+            obj.dirty = True
+
+
 class ViewCard:
     WIDTH = RSC["card_width"]
     HEIGHT = RSC["card_height"]
-    IMAGE_BACK = None
     SELECTED_COLOR = 'magenta' # Цвет выделения карты
     BORDERX = RSC["border_x"]
     BORDERY = RSC["border_y"]
+    IMAGES = CARD_IMAGES  # Кэш картинок
+
+    x = _ViewState()
+    y = _ViewState()
+    opened = _ViewState()
+    selected = _ViewState()
 
     def __init__(self, card: LlamaCard, x: int = 0, y: int = 0, opened: bool = True):
-        self.img_front = None
-        self.card = card  # Вызовет сеттер, который загрузит изображение
+        self.dirty = True  # карту надо перерисовать
+        self.drawn_bounds: pygame.Rect | None = None  # где карта была нарисована в прошлый раз
+        self.card = card
         self.x = x
         self.y = y
         self.opened = opened
@@ -29,18 +156,15 @@ class ViewCard:
         if not isinstance(value, LlamaCard):
             raise TypeError(f'Expected LlamaCard, got {type(value)}')
         self.__card = value
-        self.load_images()
+        self.dirty = True
 
-    def load_images(self):
-        # Загрузка изображений
-        try:
-            img = pygame.image.load(f"img/{self.card.value}.png")  # Путь к изображению
-            self.img_front = pygame.transform.scale(img, (self.WIDTH, self.HEIGHT))
-            if self.IMAGE_BACK is None:
-                img_back = pygame.image.load("img/back.png")
-                self.IMAGE_BACK = pygame.transform.scale(img_back, (self.WIDTH, self.HEIGHT))
-        except pygame.error as e:
-            print(f"Ошибка загрузки изображения: {e}")
+    @property
+    def img_front(self) -> pygame.Surface:
+        return self.IMAGES.front(self.card)
+
+    @property
+    def img_back(self) -> pygame.Surface:
+        return self.IMAGES.back_image()
 
     def __repr__(self):
         return f'{self.card} ({self.x}, {self.y})'
@@ -49,6 +173,11 @@ class ViewCard:
         # Метод для получения прямоугольника, представляющего карту
         return pygame.Rect(self.x, self.y, self.WIDTH, self.HEIGHT)
 
+    def bounds(self) -> pygame.Rect:
+        # Прямоугольник карты вместе с рамкой выделения
+        return pygame.Rect(self.x - self.BORDERX, self.y - self.BORDERY,
+                           self.WIDTH + 2 * self.BORDERX, self.HEIGHT + 2 * self.BORDERY)
+
     def redraw(self, display: pygame.Surface):
         # Метод для отрисовки карты на экране
         if self.selected:
@@ -61,8 +190,10 @@ class ViewCard:
             )
             display.fill(self.SELECTED_COLOR, r) # Заполняем область выделения цветом
 
-        img = self.img_front if self.opened else self.IMAGE_BACK # Выбираем изображение для отрисовки
+        img = self.img_front if self.opened else self.img_back # Выбираем изображение для отрисовки
         display.blit(img, (self.x, self.y)) # Отрисовываем изображение на экране
+        self.dirty = False
+        self.drawn_bounds = self.bounds()
 
     def event_processing(self, event: pygame.event.Event):
         if event.type == CustomEvent.SELECT_INTERACTIVE_CARDS:
@@ -91,3 +222,28 @@ class ViewCard:
         self.selected = not self.selected
         print(f'{self.selected=}')
 
+
+def redraw_dirty(cards: list[ViewCard], display: pygame.Surface, background: pygame.Surface) -> list[pygame.Rect]:
+    """
+    Перерисовывает только изменившиеся карты (выбор, переворот, перемещение) и возвращает
+    прямоугольники для pygame.display.update. Старое и новое место изменившейся карты
+    закрашиваются фоном, и в них (с отсечением по области) заново рисуются все карты,
+    которые туда попадают, в порядке списка - так сохраняется порядок наложения.
+    """
+    areas = []
+    for view in cards:
+        if view.dirty:
+            if view.drawn_bounds is not None:
+                areas.append(view.drawn_bounds)
+            areas.append(view.bounds())
+    if not areas:
+        return areas
+    clip = display.get_clip()
+    for area in areas:
+        display.set_clip(area)
+        display.blit(background, area, area)
+        for view in cards:
+            if view.bounds().colliderect(area):
+                view.redraw(display)
+    display.set_clip(clip)
+    return areas
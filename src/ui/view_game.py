@@ -0,0 +1,171 @@
+"""
+Вид стола и экран зрителя.
+
+ViewGame рисует одну партию (колода, верхняя карта, руки и очки игроков) в заданном
+прямоугольнике экрана, поэтому на одном экране помещается несколько столов.
+Движок и отрисовка разделены: EngineStepper продвигает партии в каждом кадре в пределах
+своего бюджета времени (и, если задано, не быстрее steps_per_second), а кадр рисуется
+группой спрайтов только по изменившимся областям.
+
+    python -m src.ui.view_game --tables 4 --players 3
+"""
+import argparse
+import math
+import time
+
+import pygame
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.resource import RESOURCE as RSC
+from src.ui import event as ui_event
+from src.ui.view_card import CardImages
+from src.ui.view_hand import ViewHand
+from src.ui.view_playzone import ViewPlayzone, TextSprite
+
+BACKGROUND_COLOR = 'darkgreen'
+
+
+class ViewGame:
+    LABEL_WIDTH = 0.22  # доля ширины стола под имена и очки
+    MARGIN = 4
+
+    def __init__(self, server: GameServer, rect: pygame.Rect, group: pygame.sprite.LayeredDirty | None = None,
+                 opened: bool = True):
+        self.server = server
+        ui_event.subscribe_pygame(server.attach_event_bus())  # события партии идут в очередь pygame
+        self.rect = pygame.Rect(rect)
+        self.group = group if group is not None else pygame.sprite.LayeredDirty()
+        players = server.game_state.players
+        row_height = self.rect.height // (len(players) + 1)  # строка колоды и по строке на игрока
+        card_height = max(6, row_height - 2 * self.MARGIN)
+        self.images = CardImages.for_size((card_height * 2 // 3, card_height))
+        font = pygame.font.Font(None, max(12, row_height // 4))
+        label_width = int(self.rect.width * self.LABEL_WIDTH)
+        left = self.rect.x + label_width
+        self.status = TextSprite(font, self.rect.x + self.MARGIN, self.rect.y + self.MARGIN)
+        self.group.add(self.status)
+        self.playzone = ViewPlayzone(left, self.rect.y + self.MARGIN, self.images, font, self.group)
+        self.hands: list[ViewHand] = []
+        self.labels: list[TextSprite] = []
+        for i, player in enumerate(players):
+            y = self.rect.y + (i + 1) * row_height + self.MARGIN
+            self.labels.append(TextSprite(font, self.rect.x + self.MARGIN, y))
+            self.hands.append(ViewHand(player, left, y, self.rect.right - left - self.MARGIN, opened,
+                                       self.images, self.group, layer=i * 100))
+        self.group.add(*self.labels)
+
+    def sync(self):
+        """Приводит спрайты к состоянию партии; раскладка меняется только у изменившихся рук."""
+        game_state = self.server.game_state
+        self.playzone.sync(game_state)
+        current = game_state.current_player_index
+        for i, (hand, label, player) in enumerate(zip(self.hands, self.labels, game_state.players)):
+            hand.sync()
+            marker = '>' if i == current else ' '
+            label.set_text(f"{marker}{player.name}: {player.score}{' (quit)' if player.quit else ''}")
+        winner = self.server.winner
+        self.status.set_text(f"{winner.name} wins" if winner is not None else f"round {self.server.rounds_played + 1}")
+
+
+class EngineStepper:
+    """
+    Продвигает партии вне цикла отрисовки. advance() выполняет шаги всех незаконченных
+    партий по кругу, пока не исчерпан бюджет времени кадра; steps_per_second ограничивает
+    темп (шагов каждой партии в секунду), чтобы за игрой можно было следить.
+    """
+    MAX_BACKLOG = 4.0  # сколько шагов темпа можно накопить, если кадры запаздывают
+
+    def __init__(self, servers: list[GameServer], steps_per_second: float | None = None, clock=time.perf_counter):
+        self.servers = servers
+        self.steps_per_second = steps_per_second
+        self.clock = clock
+        self._credit = 0.0
+
+    @property
+    def finished(self) -> bool:
+        return all(server.current_phase == GamePhase.GAME_END for server in self.servers)
+
+    def advance(self, dt: float, budget: float) -> int:
+        """Шаги за кадр длительностью dt секунд, не дольше budget секунд; возвращает число шагов."""
+        if self.steps_per_second is None:
+            self._credit = math.inf
+        else:
+            self._credit = min(self._credit + dt * self.steps_per_second, self.MAX_BACKLOG)
+        deadline = self.clock() + budget
+        steps = 0
+        while self._credit >= 1:
+            live = [server for server in self.servers if server.current_phase != GamePhase.GAME_END]
+            if not live:
+                break
+            for server in live:
+                server.run_one_step()
+            steps += len(live)
+            self._credit -= 1
+            if self.clock() >= deadline:
+                break
+        return steps
+
+
+def grid(count: int, rect: pygame.Rect) -> list[pygame.Rect]:
+    """Прямоугольники столов: сетка, близкая к квадратной."""
+    cols = math.ceil(math.sqrt(count))
+    rows = math.ceil(count / cols)
+    width, height = rect.width // cols, rect.height // rows
+    return [pygame.Rect(rect.x + (i % cols) * width, rect.y + (i // cols) * height, width, height)
+            for i in range(count)]
+
+
+def run_spectator(servers: list[GameServer], size: tuple[int, int] = (RSC["width"], RSC["height"]),
+                  fps: int = RSC["FPS"], steps_per_second: float | None = 4.0, engine_share: float = 0.5,
+                  max_frames: int | None = None):
+    """
+    Экран зрителя: все столы servers в одном окне. На движок в каждом кадре уходит
+    не больше engine_share длительности кадра, остальное - на отрисовку.
+    """
+    pygame.init()
+    display = pygame.display.set_mode(size)
+    pygame.display.set_caption(RSC["title"])
+    background = pygame.Surface(size)
+    background.fill(BACKGROUND_COLOR)
+    display.blit(background, (0, 0))
+    pygame.display.flip()
+
+    group = pygame.sprite.LayeredDirty()
+    group.clear(display, background)
+    views = [ViewGame(server, rect, group) for server, rect in zip(servers, grid(len(servers), display.get_rect()))]
+    stepper = EngineStepper(servers, steps_per_second)
+    clock = pygame.time.Clock()
+    frames = 0
+    running = True
+    while running and (max_frames is None or frames < max_frames):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+        dt = clock.tick(fps) / 1000
+        stepper.advance(dt, engine_share / fps)
+        for view in views:
+            view.sync()
+        pygame.display.update(group.draw(display))
+        frames += 1
+    pygame.quit()
+
+
+def __main__(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Экран зрителя: несколько партий ботов")
+    parser.add_argument('--tables', type=int, default=4)
+    parser.add_argument('--players', type=int, default=3)
+    parser.add_argument('--speed', type=float, default=4.0, help="шагов каждой партии в секунду")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+    servers = []
+    for table in range(args.tables):
+        players = {Player(f"Bot{i + 1}", Hand()): Bot(f"Bot{i + 1}") for i in range(args.players)}
+        seed = None if args.seed is None else args.seed + table
+        servers.append(GameServer.new_game(players, seed=seed, headless=True))
+    run_spectator(servers, steps_per_second=args.speed)
+
+
+if __name__ == "__main__":
+    __main__()
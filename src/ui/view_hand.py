@@ -0,0 +1,66 @@
+import pygame
+from src.card import LlamaCard
+from src.player import Player
+from src.resource import RESOURCE as RSC
+from src.ui.view_card import CardImages, CardSprite, CARD_IMAGES
+
+
+class ViewHand:
+    """
+    Рука игрока рядом карт в прямоугольнике шириной width. Спрайты карт лежат в общей
+    группе group; раскладка пересчитывается в sync() только когда изменилась рука.
+    Если карты не помещаются с промежутком card_xgap, они раскладываются внахлёст.
+    """
+    GAP = RSC["card_xgap"]
+
+    def __init__(self, player: Player, x: int, y: int, width: int, opened: bool = True,
+                 images: CardImages = CARD_IMAGES, group: pygame.sprite.LayeredDirty | None = None, layer: int = 0):
+        self.player = player
+        self.x = x
+        self.y = y
+        self.width = width
+        self.opened = opened
+        self.images = images
+        self.group = group if group is not None else pygame.sprite.LayeredDirty()
+        self.layer = layer  # карты руки занимают слои layer, layer + 1, ...
+        self.sprites: list[CardSprite] = []
+        self._layout: tuple[int, ...] | None = None  # значения карт, для которых посчитана раскладка
+
+    def sync(self) -> bool:
+        """Подстраивает спрайты под руку игрока; False, если рука не изменилась."""
+        cards = self.player.hand.cards
+        layout = tuple(card.value for card in cards)
+        if layout == self._layout:
+            return False
+        self._layout = layout
+        sprites = self.sprites
+        while len(sprites) < len(cards):
+            sprite = CardSprite(self.images, cards[len(sprites)], opened=self.opened)
+            self.group.add(sprite, layer=self.layer + len(sprites))
+            sprites.append(sprite)
+        while len(sprites) > len(cards):
+            self.group.remove(sprites.pop())
+        card_width = self.images.size[0]
+        step = card_width + self.GAP
+        if len(cards) > 1:
+            step = min(step, (self.width - card_width) / (len(cards) - 1))
+        for i, (sprite, card) in enumerate(zip(sprites, cards)):
+            sprite.card = card
+            sprite.x = self.x + round(i * step)
+            sprite.y = self.y
+            sprite.opened = self.opened
+            sprite.refresh()
+        return True
+
+    def highlight(self, cards: list[LlamaCard]):
+        """Выделяет рамкой карты из cards (например, играбельные)."""
+        for sprite in self.sprites:
+            sprite.selected = sprite.card in cards
+            sprite.refresh()
+
+    def card_at(self, pos: tuple[int, int]) -> LlamaCard | None:
+        """Карта под точкой pos (верхняя из перекрывающихся)."""
+        for sprite in reversed(self.sprites):
+            if sprite.rect.collidepoint(pos):
+                return sprite.card
+        return None
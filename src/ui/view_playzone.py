@@ -0,0 +1,57 @@
+import pygame
+from src.resource import RESOURCE as RSC
+from src.ui.view_card import CardImages, CardSprite, CARD_IMAGES
+
+
+class TextSprite(pygame.sprite.DirtySprite):
+    """Строка текста; картинка перерисовывается только при изменении текста."""
+    def __init__(self, font: pygame.font.Font, x: int, y: int, color='white'):
+        super().__init__()
+        self.font = font
+        self.color = color
+        self.x = x
+        self.y = y
+        self.text = None
+        self.set_text('')
+
+    def set_text(self, text: str):
+        if text == self.text:
+            return
+        self.text = text
+        self.image = self.font.render(text, True, self.color)
+        self.rect = self.image.get_rect(topleft=(self.x, self.y))
+        self.dirty = 1
+
+
+class ViewPlayzone:
+    """Колода (рубашкой вверх, с числом карт) и верхняя карта сброса."""
+    GAP = RSC["card_xgap"]
+
+    def __init__(self, x: int, y: int, images: CardImages = CARD_IMAGES, font: pygame.font.Font | None = None,
+                 group: pygame.sprite.LayeredDirty | None = None):
+        self.images = images
+        self.group = group if group is not None else pygame.sprite.LayeredDirty()
+        width, height = images.size
+        self.deck = CardSprite(images, None, x, y, opened=False)
+        self.top = CardSprite(images, None, x + width + self.GAP, y)
+        font = font if font is not None else pygame.font.Font(None, max(12, height // 6))
+        self.deck_size = TextSprite(font, x + 2 * (width + self.GAP), y)
+        self.group.add(self.deck, self.top, self.deck_size)
+        self._state = None
+
+    def sync(self, game_state) -> bool:
+        """Подстраивает спрайты под колоду и верхнюю карту; False, если ничего не изменилось."""
+        state = (len(game_state.deck), game_state.top)
+        if state == self._state:
+            return False
+        self._state = state
+        deck_size, top = state
+        self.deck.visible = 1 if deck_size else 0
+        self.deck.dirty = 1
+        self.deck_size.set_text(str(deck_size))
+        self.top.visible = 1 if top is not None else 0
+        if top is not None:
+            self.top.card = top
+            self.top.refresh()
+        self.top.dirty = 1
+        return True
@@ -0,0 +1,252 @@
+"""
+Замеры скорости движка с сохранением базовых результатов в JSON.
+
+    python -m test.benchmark                  # все группы, сравнение с базой
+    python -m test.benchmark --group micro
+    python -m test.benchmark --save           # записать результаты как новую базу
+
+Каждый замер повторяется несколько раз (timeit с автоподбором числа вызовов),
+берётся лучшее время на операцию: оно меньше всего зависит от фоновой нагрузки.
+Все партии и колоды строятся с фиксированными seed. Отклонение от базы печатается
+в процентах; с --max-regression процесс завершается с кодом 1, если какой-то
+замер стал медленнее больше чем на заданный процент.
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import timeit
+import typing
+from pathlib import Path
+
+from src.card import CARDS
+from src.deck import Deck, make_rng
+from src.game_state import GameState
+from src.GameServer import GameServer
+from src.hand import Hand, HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.scheduler import run_games
+
+BASELINE = Path(__file__).with_name('benchmark_baseline.json')
+REPEAT = 5
+MIN_TIME = 0.2  # секунд на один повтор
+
+# имя -> (группа, функция подготовки, возвращающая замеряемый вызов)
+BENCHMARKS: dict[str, tuple[str, typing.Callable[[], typing.Callable[[], object]]]] = {}
+
+
+def benchmark(group: str):
+    def register(setup):
+        BENCHMARKS[setup.__name__] = (group, setup)
+        return setup
+    return register
+
+
+def _bot_server(n_players: int, seed: int, hand_type: type[Hand] = Hand) -> GameServer:
+    players = {Player(f"P{i}", hand_type()): Bot(f"P{i}") for i in range(n_players)}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def _mid_game_state() -> GameState:
+    server = _bot_server(3, seed=1)
+    for _ in range(40):
+        server.run_one_step()
+    return server.game_state
+
+
+_HAND_CARDS = [CARDS[v] for v in (1, 2, 2, 3, 5, 6, 0, 0, 4)]
+
+
+@benchmark('micro')
+def hand_score():
+    hand = Hand(list(_HAND_CARDS))
+    return hand.score
+
+
+@benchmark('micro')
+def hand_playable_cards():
+    hand = Hand(list(_HAND_CARDS))
+    top = CARDS[2]
+    return lambda: hand.playable_cards(top)
+
+
+@benchmark('micro')
+def histogram_hand_playable_cards():
+    hand = HistogramHand(list(_HAND_CARDS))
+    top = CARDS[2]
+    return lambda: hand.playable_cards(top)
+
+
+@benchmark('micro')
+def can_play_on_all_pairs():
+    pairs = [(a, b) for a in CARDS for b in CARDS]
+    return lambda: [a.can_play_on(b) for a, b in pairs]
+
+
+@benchmark('micro')
+def deck_new():
+    rng = make_rng(1)
+    return lambda: Deck(rng=rng)
+
+
+@benchmark('micro')
+def deck_shuffle():
+    deck = Deck(rng=make_rng(1))
+    return deck.shuffle
+
+
+@benchmark('micro')
+def game_state_save_load():
+    state = _mid_game_state()
+    return lambda: GameState.load(state.save())
+
+
+@benchmark('micro')
+def game_state_bytes_roundtrip():
+    state = _mid_game_state()
+    return lambda: GameState.from_bytes(state.to_bytes())
+
+
+@benchmark('micro')
+def game_state_apply_undo():
+    state = _mid_game_state()
+    actions = state.legal_actions()
+
+    def branch():
+        for action in actions:
+            state.apply(action)
+            state.undo()
+    return branch
+
+
+@benchmark('micro')
+def server_save_to_dict():
+    server = _bot_server(3, seed=1)
+    for _ in range(40):
+        server.run_one_step()
+    return server.save_to_dict
+
+
+GAME_SEEDS = 20  # партии макро-замеров идут по кругу по одним и тем же seed
+
+
+def _games(n_players: int, hand_type: type[Hand]):
+    seeds = itertools.cycle(range(GAME_SEEDS))
+
+    def play():
+        _bot_server(n_players, next(seeds), hand_type).run()
+    return play
+
+
+@benchmark('macro')
+def bot_game_3p():
+    return _games(3, Hand)
+
+
+@benchmark('macro')
+def bot_game_3p_histogram():
+    return _games(3, HistogramHand)
+
+
+@benchmark('macro')
+def bot_game_5p():
+    return _games(5, Hand)
+
+
+@benchmark('macro')
+def bot_game_3p_decisions():
+    # та же партия, но ведётся по решениям: run_until_decision + decide
+    seeds = itertools.cycle(range(GAME_SEEDS))
+
+    def play():
+        server = _bot_server(3, next(seeds))
+        while (request := server.run_until_decision()) is not None:
+            server.decide(request.ask())
+    return play
+
+
+@benchmark('macro')
+def scheduler_20_games():
+    # GAME_SEEDS партий вперемешку в одном потоке (src/scheduler.py), решения Bot пачками
+    def play():
+        run_games([_bot_server(3, seed) for seed in range(GAME_SEEDS)])
+    return play
+
+
+def measure(name: str, repeat: int = REPEAT, min_time: float = MIN_TIME) -> float:
+    """Лучшее время одного вызова замера name в наносекундах."""
+    call = BENCHMARKS[name][1]()
+    timer = timeit.Timer(call)
+    number = 1
+    while True:  # как Timer.autorange, но до min_time
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / number * 1e9
+
+
+def compare(results: dict[str, float], baseline: dict[str, float]) -> dict[str, float]:
+    """Изменение времени в процентах относительно базы (плюс - медленнее)."""
+    return {name: (ns / baseline[name] - 1) * 100 for name, ns in results.items() if baseline.get(name)}
+
+
+def _environment() -> dict:
+    return {'python': platform.python_version(), 'implementation': platform.python_implementation(),
+            'machine': platform.machine(), 'system': platform.system()}
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (('s', 1e9), ('ms', 1e6), ('us', 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def run(names: list[str], baseline: dict[str, float], repeat: int = REPEAT, min_time: float = MIN_TIME,
+        write: typing.Callable[[str], None] = print) -> dict[str, float]:
+    results = {}
+    for name in names:
+        results[name] = ns = measure(name, repeat, min_time)
+        line = f"{BENCHMARKS[name][0]:>6} {name:<32} {_format_ns(ns):>12}  {1e9 / ns:>12.1f}/s"
+        if baseline.get(name):
+            line += f"  {compare({name: ns}, baseline)[name]:+7.1f}%"
+        write(line)
+    return results
+
+
+def __main__(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Замеры скорости движка Lama")
+    parser.add_argument('--group', choices=['micro', 'macro', 'all'], default='all')
+    parser.add_argument('--baseline', type=Path, default=BASELINE)
+    parser.add_argument('--save', action='store_true', help="записать результаты как новую базу")
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--min-time', type=float, default=MIN_TIME)
+    parser.add_argument('--max-regression', type=float, default=None, help="допустимое замедление, %%")
+    parser.add_argument('names', nargs='*', help="отдельные замеры")
+    args = parser.parse_args(argv)
+
+    names = args.names or [name for name, (group, _) in BENCHMARKS.items() if args.group in ('all', group)]
+    stored = json.loads(args.baseline.read_text(encoding='utf-8')) if args.baseline.exists() else {}
+    baseline = stored.get('results', {})
+    if stored and stored.get('environment') != _environment():
+        print(f"База снята в другом окружении: {stored.get('environment')}", file=sys.stderr)
+    results = run(names, baseline, args.repeat, args.min_time)
+
+    if args.save:
+        merged = {**baseline, **results}
+        args.baseline.write_text(json.dumps({'environment': _environment(), 'results': merged}, indent=4),
+                                 encoding='utf-8')
+    if args.max_regression is not None:
+        slower = {name: pct for name, pct in compare(results, baseline).items() if pct > args.max_regression}
+        for name, pct in slower.items():
+            print(f"регрессия: {name} медленнее на {pct:.1f}%", file=sys.stderr)
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(__main__())
@@ -0,0 +1,108 @@
+import asyncio
+
+from src.async_host import GameHost, run_tables, needs_await
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.player_interactions.human_player import Human
+
+
+class RemoteBot(Bot):
+    """Бот, который отвечает через цикл событий, как удалённый игрок."""
+    delay = 0.0
+
+    def __init__(self, name: str, log: list | None = None, table: int = 0):
+        super().__init__(name)
+        self.log = log
+        self.table = table
+
+    async def choose_card_async(self, hand, top):
+        await asyncio.sleep(self.delay)
+        if self.log is not None:
+            self.log.append(self.table)
+        return self.choose_card(hand, top)
+
+
+class SilentBot(RemoteBot):
+    delay = 10.0
+
+
+def new_server(seed, kind=Bot, **kwargs):
+    players = {Player(name, Hand()): kind(name, **kwargs) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def scores(server):
+    return [p.score for p in server.game_state.players]
+
+
+def test_needs_await():
+    assert not needs_await(Bot("A"), 'choose_card')
+    assert needs_await(RemoteBot("A"), 'choose_card')
+    assert not needs_await(RemoteBot("A"), 'choose_quit')
+    assert Human.BLOCKING
+
+
+def test_tables_play_like_sync_server():
+    expected = []
+    for seed in range(5):
+        server = new_server(seed)
+        server.run()
+        expected.append(scores(server))
+    servers = run_tables([new_server(seed, RemoteBot) for seed in range(5)])
+    assert [scores(server) for server in servers] == expected
+    assert all(server.current_phase == GamePhase.GAME_END for server in servers)
+
+
+def test_tables_interleave():
+    log = []
+    host = GameHost()
+    host.add(new_server(1, RemoteBot, log=log, table=1))
+    host.add(new_server(2, RemoteBot, log=log, table=2))
+    asyncio.run(host.run())
+    # ответы столов идут вперемешку, а не сначала все ответы первого стола
+    assert log[:4] == [1, 2, 1, 2]
+
+
+def test_timeout_falls_back_to_bot():
+    server = new_server(3)
+    slow = new_server(3, SilentBot)
+    host = GameHost(move_timeout=0.001)
+    table = host.add(slow)
+    server.run()
+    asyncio.run(host.run())
+    assert table.timeouts > 0
+    assert scores(slow) == scores(server)  # запасной Bot ходит так же, как Bot
+
+
+class InformCounter(RemoteBot):
+    """Считает сообщения о состоянии игры и решения."""
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.informs = 0
+        self.decisions = 0
+
+    def inform_game_state(self, game_state, seat):
+        self.informs += 1
+
+    def choose_card(self, hand, top):
+        self.decisions += 1
+        return super().choose_card(hand, top)
+
+    def choose_quit(self, hand, top):
+        self.decisions += 1
+        return super().choose_quit(hand, top)
+
+    def choose_to_play(self, top, card):
+        self.decisions += 1
+        return super().choose_to_play(top, card)
+
+
+def test_one_inform_per_decision():
+    server = new_server(4, InformCounter)
+    run_tables([server])
+    players = server.interactions
+    assert all(player.decisions > 0 for player in players)
+    # ожидаемое решение не выполняет фазу заново и не сообщает состояние игры повторно
+    assert [player.informs for player in players] == [player.decisions for player in players]
@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.batch_sim import simulate
+from src.GameServer import GameServer
+from src.hand import HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def scalar_scores(seed, n_players):
+    players = {Player(f"P{i}", HistogramHand()): Bot(f"P{i}") for i in range(n_players)}
+    server = GameServer.new_game(players, seed=seed, headless=True)
+    server.run()
+    return [p.score for p in server.game_state.players]
+
+
+@pytest.mark.parametrize("n_players", [2, 3, 4, 5])
+def test_matches_game_server(n_players):
+    seeds = list(range(40))
+    result = simulate(seeds, n_players)
+    for i, seed in enumerate(seeds):
+        scores = scalar_scores(seed, n_players)
+        assert result.scores[i].tolist() == scores
+        below = [s for s in scores if s < 40]
+        expected_winner = scores.index(min(below) if below else min(scores))
+        assert result.winners[i] == expected_winner
+    assert (result.rounds >= 1).all()
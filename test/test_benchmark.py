@@ -0,0 +1,26 @@
+import json
+
+import pytest
+
+from test import benchmark
+
+
+def test_compare():
+    delta = benchmark.compare({'a': 110.0, 'b': 50.0, 'c': 1.0}, {'a': 100.0, 'b': 100.0})
+    assert delta == pytest.approx({'a': 10.0, 'b': -50.0})
+
+
+def test_groups():
+    groups = {group for group, _ in benchmark.BENCHMARKS.values()}
+    assert groups == {'micro', 'macro'}
+
+
+def test_save_and_regression(tmp_path):
+    path = tmp_path / 'baseline.json'
+    args = ['--baseline', str(path), '--repeat', '1', '--min-time', '0', 'hand_score']
+    assert benchmark.__main__(args + ['--save']) == 0
+    stored = json.loads(path.read_text(encoding='utf-8'))
+    assert stored['results']['hand_score'] > 0
+    stored['results']['hand_score'] /= 1000  # база в тысячу раз быстрее - регрессия
+    path.write_text(json.dumps(stored), encoding='utf-8')
+    assert benchmark.__main__(args + ['--max-regression', '10']) == 1
@@ -77,3 +77,33 @@ def test_score():
 
     c_lama = LlamaCard(0)  # Проверка карты Лама
     assert c_lama.score() == 10  # Теперь карта Лама имеет 10 очков
+
+def test_shared_instances():
+    # на каждое значение существует один общий экземпляр карты
+    assert LlamaCard(3) is LlamaCard(3)
+    assert LlamaCard.load('0') is LlamaCard(0)
+    cards = LlamaCard.all_cards()
+    assert len(cards) == 56
+    assert len({id(c) for c in cards}) == 7
+
+def test_immutable():
+    c = LlamaCard(3)
+    with pytest.raises(AttributeError):
+        c.value = 4
+    assert not hasattr(c, '__dict__')
+
+def test_eq_int():
+    c = LlamaCard(3)
+    assert c == 3
+    assert c != 4
+    assert hash(c) == hash(3)
+
+def test_play_on_table():
+    # таблица совпадает с правилами игры
+    from src.card import CAN_PLAY_ON, PLAYABLE_MASK, CARDS_BY_MASK
+    assert CAN_PLAY_ON[3][3] and CAN_PLAY_ON[4][3] and not CAN_PLAY_ON[5][3]
+    assert CAN_PLAY_ON[0][6] and CAN_PLAY_ON[0][0] and CAN_PLAY_ON[1][0]
+    assert not CAN_PLAY_ON[2][0]
+    assert PLAYABLE_MASK[0] == 0b11
+    assert PLAYABLE_MASK[6] == 0b1000001
+    assert CARDS_BY_MASK[PLAYABLE_MASK[6]] == (LlamaCard(6), LlamaCard(0))
@@ -53,4 +53,25 @@ def test_is_empty():
     deck = Deck([])
     assert deck.is_empty()  # Проверяем, что колода пуста
     deck = Deck([LlamaCard(0)])
-    assert not deck.is_empty()  # Проверяем, что колода не пуста
\ No newline at end of file
+    assert not deck.is_empty()  # Проверяем, что колода не пуста
+
+
+def test_deal():
+    deck = Deck.load("0 1 2 3 4 5 6")
+    hands = deck.deal(3, 2)
+    # карты раздаются по кругу сверху колоды
+    assert hands == [[LlamaCard(6), LlamaCard(3)], [LlamaCard(5), LlamaCard(2)], [LlamaCard(4), LlamaCard(1)]]
+    assert deck.save() == "0"
+
+    hands = Deck.load("1 2 3").deal(2, 3)  # карт не хватает на всех
+    assert hands == [[LlamaCard(3), LlamaCard(1)], [LlamaCard(2)]]
+
+def test_seeded_shuffle():
+    import random
+    deck1 = Deck(rng=random.Random(42))
+    deck2 = Deck(rng=random.Random(42))
+    assert deck1 == deck2
+    assert sorted(deck1.cards) == sorted(LlamaCard.all_cards())
+    deck1.draw_card()
+    assert len(deck1) == 55
+    assert deck1.values == deck2.values[:-1]
@@ -0,0 +1,62 @@
+import random
+
+from src.endgame import EndgameSolver, EndgameMixin
+from src.GameServer import GameServer, GamePhase
+from src.hand import HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.simulation import CARD, QUIT_OR_DRAW, QUIT, DRAW
+
+EMPTY = [0] * 7
+
+
+def hand(*values):
+    counts = [0] * 7
+    for v in values:
+        counts[v] += 1
+    return counts
+
+
+class EndgameBot(EndgameMixin, Bot):
+    pass
+
+
+def test_exact_choice():
+    solver = EndgameSolver()
+    # сыграв 4, соперник не может ответить шестёркой и выходит, а 5 доигрывается следующим ходом
+    values = solver.action_values(CARD, [hand(4, 5), hand(6)], EMPTY, 4, [False, False], 0)
+    assert values == {4: 0.0, 5: 4.0}
+
+
+def test_draw_is_expectation():
+    solver = EndgameSolver()
+    # нечего играть на 6: выход оставляет 3 очка, взятие - ожидание по двум картам колоды
+    values = solver.action_values(QUIT_OR_DRAW, [hand(3), hand(2, 2)], hand(1, 5), 6, [False, False], 0)
+    assert values[QUIT] == 3.0
+    assert set(values) == {QUIT, DRAW}
+
+
+def test_cache_and_canonical_key():
+    solver = EndgameSolver(max_entries=1000)
+    hands = [hand(1, 2, 5), hand(3, 4), hand(0, 6)]
+    first = solver.action_values(CARD, hands, hand(2, 3), 1, [False] * 3, 0)
+    misses = solver.misses
+    assert solver.action_values(CARD, hands, hand(2, 3), 1, [False] * 3, 0) == first
+    # та же позиция, но ходящий сидит на другом месте
+    rotated = [hands[2], hands[0], hands[1]]
+    assert solver.action_values(CARD, rotated, hand(2, 3), 1, [False] * 3, 1) == first
+    assert solver.misses == misses
+    assert solver.hits > 0
+    assert len(solver.table) <= 1000
+
+
+def test_mixin_plays_full_game():
+    scores = []
+    for _ in range(2):
+        random.seed(9)  # генератор примеси создаётся из глобального random
+        players = {Player("E", HistogramHand()): EndgameBot("E"), Player("B", HistogramHand()): Bot("B")}
+        server = GameServer.new_game(players, seed=9, headless=True)
+        server.run()
+        assert server.current_phase == GamePhase.GAME_END
+        scores.append([p.score for p in server.game_state.players])
+    assert scores[0] == scores[1]
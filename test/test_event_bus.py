@@ -0,0 +1,71 @@
+from src.card import CARDS
+from src.event_bus import EventBus, EventType, GameEvent
+from src.GameServer import GameServer
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def new_server(seed):
+    players = {Player(name, Hand()): Bot(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_subscribe_by_type():
+    bus = EventBus()
+    plays = []
+    bus.subscribe(lambda e: plays.append(e.copy()), EventType.PLAY)
+    bus.publish(EventType.PLAY, 1, CARDS[3])
+    bus.publish(EventType.DRAW, 1, CARDS[4])
+    assert plays == [GameEvent(EventType.PLAY, 1, CARDS[3])]
+    assert bus.seq == 2
+
+
+def test_batches_reuse_records():
+    bus = EventBus(capacity=4)
+    batches = []
+    bus.subscribe_batch(lambda batch: batches.append([(e.type, e.player_index) for e in batch]))
+    for i in range(6):
+        bus.publish(EventType.QUIT, i)
+    assert batches == [[(EventType.QUIT, i) for i in range(4)]]  # буфер заполнился - пачка ушла досрочно
+    bus.flush()
+    assert batches[1] == [(EventType.QUIT, 4), (EventType.QUIT, 5)]
+    bus.flush()
+    assert len(batches) == 2
+
+
+def test_unsubscribe():
+    bus = EventBus()
+    seen = []
+    bus.subscribe(seen.append)
+    bus.unsubscribe(seen.append)
+    bus.publish(EventType.ROUND_END)
+    assert seen == []
+
+
+def test_server_events_match_journal(tmp_path):
+    import json
+    server = new_server(seed=6)
+    events = []
+    server.attach_event_bus().subscribe_batch(lambda batch: events.extend(e.copy() for e in batch))
+    journal = server.attach_journal(tmp_path / 'lama.json', checkpoint_every=10 ** 6)
+    server.run()
+    journal.close()
+    ops = [json.loads(line) for line in open(journal.log_path, encoding='utf-8')]
+    plays = [(seat, value) for _, op, *args in ops if op == 'play' for seat, value in [args]]
+    assert [(e.player_index, e.card.value) for e in events if e.type == EventType.PLAY] == plays
+    assert sum(e.type == EventType.DRAW for e in events) == sum(op == 'draw' for _, op, *_ in ops)
+    assert sum(e.type == EventType.QUIT for e in events) == sum(op == 'quit' for _, op, *_ in ops)
+    assert sum(e.type == EventType.ROUND_END for e in events) == server.rounds_played
+    assert events[-1].type == EventType.WINNER
+    assert server.game_state.players[events[-1].player_index] is server.winner
+
+
+def test_round_end_sees_new_scores():
+    server = GameServer.new_game({Player(name, Hand()): Bot(name) for name in ("Alex", "Bob")}, seed=3, headless=True)
+    seen = []
+    server.attach_event_bus().subscribe(
+        lambda event: seen.append([p.score for p in server.game_state.players]), EventType.ROUND_END)
+    server.run()
+    assert len(seen) == server.rounds_played
+    assert seen[-1] == [p.score for p in server.game_state.players]  # очки последнего раунда уже начислены
@@ -0,0 +1,159 @@
+import pytest
+
+from src.GameServer import GameServer, GamePhase
+from src.game_log import GameLog, LogLevel
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def bot_players(*names):
+    return {Player(name, Hand()): Bot(name) for name in names}
+
+
+def test_headless_game_is_silent(capsys):
+    server = GameServer.new_game(bot_players("Alex", "Bob"), seed=1, headless=True)
+    server.run()
+    assert server.current_phase == GamePhase.GAME_END
+    assert capsys.readouterr().out == ""
+
+
+def test_same_seed_same_game():
+    scores = []
+    for _ in range(2):
+        server = GameServer.new_game(bot_players("Alex", "Bob", "Charley"), seed=11, headless=True)
+        server.run()
+        scores.append([p.score for p in server.game_state.players])
+    assert scores[0] == scores[1]
+
+
+def test_log_levels():
+    lines = []
+    log = GameLog(LogLevel.INFO, write=lines.append)
+    log.debug("debug %s", 1)
+    log.info("info %s", 2)
+    log.warning("warning")
+    assert lines == ["info 2", "warning"]
+
+    server = GameServer.new_game(bot_players("Alex", "Bob"), seed=1, headless=True, log=log)
+    server.run()
+    assert any("выиграл" in line for line in lines)
+
+
+def test_seats_allow_duplicate_names():
+    bots = [Bot("Bot"), Bot("Bot"), Bot("Bot")]
+    server = GameServer.new_game([(Player("Bot", Hand()), bot) for bot in bots], seed=3, headless=True)
+    assert server.interactions == bots
+    server.run()
+    assert server.current_phase == GamePhase.GAME_END
+    assert [p["kind"] for p in server.save_to_dict()["players"]] == ["Bot"] * 3
+
+
+def test_player_types_mapping_is_compatible():
+    seats = bot_players("Alex", "Bob")
+    server = GameServer.new_game(seats, seed=1, headless=True)
+    assert list(server.player_types) == server.game_state.players
+    for player, interaction in seats.items():
+        assert server.player_types[player] is interaction
+    assert list(server.player_types.values()) == list(seats.values())
+    server.player_types = [Bot("Carl"), Bot("Dan")]
+    assert [i.name for i in server.interactions] == ["Carl", "Dan"]
+
+    alex, bob = server.game_state.players
+    reordered = {bob: Bot("Bob"), alex: Bot("Alex")}  # порядок словаря не совпадает с местами
+    server = GameServer(reordered, server.game_state, headless=True)
+    assert server.player_types[alex] is reordered[alex] and server.player_types[bob] is reordered[bob]
+    assert [i.name for i in server.interactions] == ["Alex", "Bob"]
+    with pytest.raises(ValueError):
+        GameServer({alex: Bot("Alex")}, server.game_state, headless=True)
+
+
+class Quitter(Bot):
+    @classmethod
+    def choose_quit(cls, hand, top, hand_counts=None) -> bool:
+        return True
+
+
+def test_quit_seats_are_skipped():
+    seats = [(Player(name, Hand()), Quitter(name) if name != "Eve" else Bot(name))
+             for name in ("Alex", "Bob", "Charley", "Dan", "Eve")]
+    server = GameServer.new_game(seats, seed=2, headless=True)
+    state = server.game_state
+    choose_phases = 0
+    while server.current_phase != GamePhase.GAME_END:
+        if server.current_phase == GamePhase.CHOOSE_CARD:
+            assert not state.current_player().quit  # вышедшие места не получают фазу выбора карты
+            choose_phases += 1
+        server.run_one_step()
+        assert state.active_count == sum(not p.quit for p in state.players)
+    assert choose_phases > 0
+
+
+def test_next_active_seat():
+    state = GameServer.new_game(bot_players("A", "B", "C", "D"), seed=1, headless=True).game_state
+    assert [state.next_active_seat(seat) for seat in range(4)] == [1, 2, 3, 0]
+    state.set_quit(1, True)
+    state.set_quit(3, True)
+    assert [state.next_active_seat(seat) for seat in range(4)] == [2, 2, 0, 0]
+    state.set_quit(0, True)
+    assert state.next_active_seat(2) == 2 and state.active_count == 1
+    state.set_quit(2, True)
+    assert state.all_quit() and state.next_active_seat(0) == -1
+
+
+def test_run_until_decision_matches_run():
+    reference = GameServer.new_game(bot_players("Alex", "Bob", "Charley"), seed=7, headless=True)
+    reference.run()
+    server = GameServer.new_game(bot_players("Alex", "Bob", "Charley"), seed=7, headless=True)
+    decisions = 0
+    while (request := server.run_until_decision()) is not None:
+        assert request.seat == server.game_state.current_player_index
+        assert request.method in ("choose_card", "choose_quit", "choose_to_play")
+        server.decide(request.ask())
+        decisions += 1
+    assert server.current_phase == GamePhase.GAME_END and decisions > 0
+    assert [p.score for p in server.game_state.players] == [p.score for p in reference.game_state.players]
+
+
+def test_decide_overrides_interaction():
+    server = GameServer.new_game(bot_players("Alex", "Bob"), seed=1, headless=True)
+    while (request := server.run_until_decision()) is not None:
+        if request.method == "choose_quit":
+            seat = request.seat
+            server.decide(True)  # Bot сам никогда не выходит из раунда
+            assert server.game_state.players[seat].quit
+            break
+        server.decide(request.ask())
+    else:
+        assert False, "choose_quit was never asked"
+
+
+class InformRecorder(Bot):
+    def __init__(self, name):
+        super().__init__(name)
+        self.informed = []
+
+    def inform_game_state(self, game_state, seat):
+        self.informed.append(seat)
+
+
+def test_request_comes_after_inform_game_state():
+    seats = [(Player(name, Hand()), InformRecorder(name)) for name in ("Alex", "Bob", "Charley")]
+    server = GameServer.new_game(seats, seed=5, headless=True)
+    decisions = 0
+    while (request := server.run_until_decision()) is not None:
+        informed = request.interaction.informed
+        assert informed and informed[-1] == request.seat  # игрок видел состояние до решения
+        count = len(informed)
+        server.decide(request.ask())
+        assert len(informed) == count  # decide не сообщает состояние повторно
+        decisions += 1
+    assert sum(len(interaction.informed) for _, interaction in seats) == decisions
+
+
+def test_decision_path_is_measured():
+    server = GameServer.new_game(bot_players("Alex", "Bob"), seed=1, headless=True)
+    metrics = server.attach_metrics()
+    while (request := server.run_until_decision()) is not None:
+        server.decide(request.ask())
+    assert metrics.counters["plays"] > 0 and metrics.counters["games"] == 1
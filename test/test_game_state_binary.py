@@ -0,0 +1,47 @@
+import pytest
+from src.game_state import GameState
+
+data = {
+    "top": "6",
+    "current_player_index": 1,
+    "deck": "2 6 0 4 4 1 3",
+    "players": [
+        {"name": "Alex", "hand": "3 6", "score": 9},
+        {"name": "Коля", "hand": "5", "score": 45},
+        {"name": "Charley", "hand": "0 1 2", "score": 10},
+    ],
+}
+
+
+def test_round_trip():
+    game = GameState.load(data)
+    game.players[2].quit = True
+    raw = game.to_bytes()
+    assert len(raw) < 64
+
+    restored = GameState.from_bytes(raw)
+    assert restored == GameState.load(data)
+    assert restored.save() == data
+    assert [p.quit for p in restored.players] == [False, False, True]
+    assert restored.current_player_index == 1
+
+
+def test_empty_deck_and_hands():
+    game = GameState.load({**data, "deck": "", "players": [{"name": "A", "hand": "", "score": 0}]})
+    assert GameState.from_bytes(game.to_bytes()).save() == game.save()
+
+
+def test_bad_version():
+    raw = bytearray(GameState.load(data).to_bytes())
+    raw[0] = 99
+    with pytest.raises(ValueError):
+        GameState.from_bytes(bytes(raw))
+
+
+def test_limits_raise_value_error():
+    game = GameState.load({**data, "players": [{"name": "A" * 256, "hand": "", "score": 0}]})
+    with pytest.raises(ValueError, match="255 bytes"):
+        game.to_bytes()
+    game = GameState.load({**data, "players": [{"name": "A", "hand": "", "score": 70000}]})
+    with pytest.raises(ValueError, match="65535"):
+        game.to_bytes()
@@ -1,6 +1,8 @@
 import random
+
+import pytest
 from src.card import LlamaCard
-from src.hand import Hand
+from src.hand import Hand, HistogramHand
 
 # Инициализация карт, включая карту Лама
 cards = [LlamaCard(3), LlamaCard(1), LlamaCard(6), LlamaCard(0)]  # 0 - карта Лама
@@ -44,3 +46,32 @@ def test_remove_card():
     c = LlamaCard.load('0')  # Удаление карты Лама
     h.remove_card(c)
     assert repr(h) == '3 1 6 4'  # Проверка, что Лама была успешно удалена
+
+def test_histogram_hand():
+    h = HistogramHand.load('3 1 6 0 3')
+    assert len(h) == 5
+    assert h.save() == '1 3 3 6 0'
+    assert HistogramHand.load(h.save()) == h
+    assert h == Hand.load('3 1 6 0 3')  # порядок карт не важен
+    assert h.score() == Hand.load('3 1 6 0 3').score()
+
+    h.remove_card(LlamaCard(3))
+    assert h.score() == 10 + 3 + 1 + 6
+    h.add_card(LlamaCard(0))
+    assert h.score() == 20 + 3 + 1 + 6
+    assert h.playable_cards(LlamaCard(0)) == [LlamaCard(1), LlamaCard(0)]
+    assert h.playable_cards(LlamaCard(4)) == []
+
+    h.clear()
+    assert h.is_empty()
+    assert h.save() == ''
+
+
+def test_pop_card_last():
+    hand = Hand.load("3 1 3 5")
+    assert hand.pop_card(LlamaCard(3), last=True) == 2
+    assert hand.save() == "3 1 5"
+    hand.insert_card(2, LlamaCard(3))
+    assert hand.pop_card(LlamaCard(3)) == 0
+    with pytest.raises(ValueError):
+        hand.pop_card(LlamaCard(6), last=True)
@@ -0,0 +1,79 @@
+import json
+
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.instrumentation import GameMetrics
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def new_server(seed):
+    players = {Player(name, Hand()): Bot(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_metrics_do_not_change_game():
+    plain = new_server(seed=4)
+    plain.run()
+    server = new_server(seed=4)
+    metrics = server.attach_metrics()
+    server.run()
+    assert [p.score for p in server.game_state.players] == [p.score for p in plain.game_state.players]
+    data = metrics.to_dict()
+    assert data['counters']['rounds'] == server.rounds_played
+    assert data['counters']['games'] == 1
+    assert data['counters']['plays'] > 0
+    assert data['phases'][str(GamePhase.CHOOSE_CARD)]['count'] > 0
+    assert data['callbacks']['choose_card']['count'] > 0
+
+
+def test_counters_match_journal(tmp_path):
+    server = new_server(seed=9)
+    metrics = server.attach_metrics()
+    journal = server.attach_journal(tmp_path / 'lama.json', checkpoint_every=10 ** 6)
+    server.run()
+    journal.close()
+    ops = [json.loads(line)[1] for line in open(journal.log_path, encoding='utf-8')]
+    assert metrics.counters['plays'] == ops.count('play')
+    assert metrics.counters['draws'] == ops.count('draw')
+    assert metrics.counters['quits'] == ops.count('quit')
+    assert metrics.counters['rounds'] == ops.count('round_end')
+
+
+def test_detach_restores_methods():
+    server = new_server(seed=1)
+    bot = next(iter(server.player_types.values()))
+    server.attach_metrics()
+    assert 'choose_card_phase' in vars(server) and 'choose_card' in vars(bot)
+    server.detach_metrics()
+    assert 'choose_card_phase' not in vars(server) and 'choose_card' not in vars(bot)
+    assert server.metrics is None
+
+
+def test_exports(tmp_path):
+    ticks = iter(range(0, 10 ** 9, 1000))
+    metrics = GameMetrics(clock=lambda: next(ticks))
+    server = new_server(seed=2)
+    server.attach_metrics(metrics)
+    server.run()
+    metrics.save_json(tmp_path / 'metrics.json')
+    assert json.loads((tmp_path / 'metrics.json').read_text(encoding='utf-8')) == metrics.to_dict()
+    text = metrics.to_prometheus()
+    assert '# TYPE lama_phase_seconds summary' in text
+    assert 'lama_phase_seconds_count{phase="Choose card"}' in text
+    assert f'lama_rounds_total {server.rounds_played}' in text
+    metrics.reset()
+    assert metrics.to_dict()['counters']['plays'] == 0
+
+
+def test_class_players_are_not_patched():
+    original = Bot.__dict__['choose_card']
+    server = GameServer.new_game({Player(name, Hand()): Bot for name in ("Alex", "Bob")}, seed=2, headless=True)
+    metrics = server.attach_metrics()
+    server.run()
+    server.detach_metrics()
+    assert Bot.__dict__['choose_card'] is original  # метод класса не подменён и не удалён
+    assert metrics.counters['games'] == 1
+    other = new_server(seed=3)
+    other.run()
+    assert other.current_phase == GamePhase.GAME_END
@@ -0,0 +1,40 @@
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.journal import GameJournal
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def new_server(seed):
+    players = {Player(name, Hand()): Bot(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_restore_from_journal(tmp_path):
+    filename = tmp_path / "lama.json"
+    server = new_server(seed=3)
+    journal = server.attach_journal(filename, checkpoint_every=7)
+    steps = 0
+    while server.current_phase != GamePhase.GAME_END:
+        server.run_one_step()
+        steps += 1
+        if steps % 5 == 0:
+            restored = GameServer.load_game(filename, headless=True)
+            assert restored.game_state == server.game_state
+            assert [p.quit for p in restored.game_state.players] == [p.quit for p in server.game_state.players]
+            assert restored.current_phase == server.current_phase or server.current_phase in (
+                GamePhase.NEXT_PLAYER, GamePhase.END_ROUND, GamePhase.DETERMINE_WINNER, GamePhase.GAME_END)
+    journal.close()
+
+
+def test_torn_record_is_ignored(tmp_path):
+    filename = tmp_path / "lama.json"
+    server = new_server(seed=5)
+    journal = server.attach_journal(filename)
+    for _ in range(10):
+        server.run_one_step()
+    journal.close()
+    with open(GameJournal.log_path_for(filename), 'a', encoding='utf-8') as fout:
+        fout.write('[999,"pl')  # запись оборвалась при сбое
+    restored = GameServer.load_game(filename, headless=True)
+    assert restored.game_state == server.game_state
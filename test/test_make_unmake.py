@@ -0,0 +1,67 @@
+import random
+
+from src.card import CARDS
+from src.deck import Deck
+from src.game_state import GameState
+from src.GameServer import GameServer
+from src.hand import Hand, HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.simulation import QUIT, DRAW, PASS
+
+
+def new_state(seed, hand_type=Hand) -> GameState:
+    players = {Player(name, hand_type()): Bot(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True).game_state
+
+
+def test_apply_undo_restores_state():
+    rng = random.Random(5)
+    for seed, hand_type in ((1, Hand), (2, HistogramHand), (3, Hand)):
+        state = new_state(seed, hand_type)
+        snapshot = state.to_bytes()
+        start_hash = state.state_hash
+        depth = 0
+        while actions := state.legal_actions():
+            state.apply(rng.choice(actions))
+            depth += 1
+            assert state.state_hash == GameState.from_bytes(state.to_bytes()).state_hash
+        assert depth > 0
+        for _ in range(depth):
+            state.undo()
+        assert state.to_bytes() == snapshot
+        assert state.state_hash == start_hash
+        assert state.legal_actions()
+
+
+def test_legal_actions_follow_turn_order():
+    players = [Player("Alex", Hand([CARDS[2], CARDS[5]])), Player("Bob", Hand([CARDS[4]]))]
+    state = GameState(players, Deck.from_values(b'\x00\x03'), CARDS[1])
+    assert state.legal_actions() == (2, PASS)
+    state.apply(2)
+    assert state.current_player_index == 1 and state.top == CARDS[2]
+    assert state.legal_actions() == (QUIT, DRAW)
+    state.apply(DRAW)  # взята 3 - её можно сыграть
+    assert state.legal_actions() == (3, PASS)
+    state.apply(PASS)
+    assert state.current_player_index == 0
+    assert state.legal_actions() == (QUIT, DRAW)
+    state.apply(QUIT)
+    assert state.current_player_index == 1  # Alex вышел, ход снова у Bob
+    state.apply(3)
+    assert state.legal_actions() == (4, PASS)
+    state.apply(4)
+    assert state.legal_actions() == ()  # Bob сыграл все карты
+    for _ in range(5):
+        state.undo()
+    assert state.legal_actions() == (QUIT, DRAW) and state.current_player_index == 1
+    assert len(state.deck) == 2 and state.players[1].hand.cards == [CARDS[4]]
+
+
+def test_empty_deck_leaves_only_quit():
+    players = [Player("Alex", Hand([CARDS[5]])), Player("Bob", Hand([CARDS[5]]))]
+    state = GameState(players, Deck.from_values(b''), CARDS[1])
+    assert state.legal_actions() == (QUIT,)
+    state.apply(QUIT)
+    state.apply(QUIT)
+    assert state.legal_actions() == ()
@@ -0,0 +1,65 @@
+from src.GameServer import GameServer, GamePhase
+from src.hand import HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.player_interactions.mcts_player import MCTSBot, CARD
+
+
+def new_server(mcts, seed=1):
+    players = {Player("MCTS", HistogramHand()): mcts, Player("Bot", HistogramHand()): Bot("Bot")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_plays_full_game():
+    server = new_server(MCTSBot("MCTS", iterations=10, seed=1))
+    server.run()
+    assert server.current_phase == GamePhase.GAME_END
+
+
+def test_time_budget():
+    server = new_server(MCTSBot("MCTS", time_budget=0.001, seed=2), seed=2)
+    server.run()
+    assert server.current_phase == GamePhase.GAME_END
+
+
+def test_iteration_budget_and_tree_reuse():
+    mcts = MCTSBot("MCTS", iterations=30, seed=3)
+    seed = 0
+    while True:  # позиция, где есть выбор из нескольких карт
+        server = new_server(mcts, seed=seed)
+        state = server.game_state
+        if len({card.value for card in state.players[0].hand.playable_cards(state.top)}) > 1:
+            break
+        seed += 1
+    mcts.inform_game_state(state, 0)
+    mcts.search(CARD)
+    root = max(mcts.nodes.values(), key=lambda node: node[0])
+    assert root[0] == 30
+    nodes = len(mcts.nodes)
+    mcts.search(CARD)
+    assert root[0] == 60  # та же позиция - тот же узел
+    assert len(mcts.nodes) >= nodes
+    mcts.inform_round_begin(server.game_state)
+    assert not mcts.nodes
+
+
+def test_same_seed_same_decisions():
+    scores = []
+    for _ in range(2):
+        server = new_server(MCTSBot("MCTS", iterations=10, seed=4), seed=4)
+        server.run()
+        scores.append([p.score for p in server.game_state.players])
+    assert scores[0] == scores[1]
+
+
+def test_decision_request_after_state():
+    mcts = MCTSBot("MCTS", iterations=20, seed=1)
+    server = new_server(mcts)
+    while (request := server.run_until_decision()) is not None:
+        if request.interaction is mcts:
+            assert mcts.game_state is server.game_state and mcts.seat == request.seat  # поиск, а не эвристика
+            server.decide(request.ask())
+            break
+        server.decide(request.ask())
+    else:
+        assert False, "MCTSBot was never asked"
@@ -0,0 +1,63 @@
+import pytest
+
+from src.GameServer import GameServer, GamePhase
+from src.hand import HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.player_interactions.table_player import TableBot
+from src.policy_table import PolicyTable, SIZE, UNKNOWN, open_table, state_index, train
+from src.simulation import CARD
+
+
+@pytest.fixture(scope="module")
+def policy_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("policy") / "policy.bin"
+    PolicyTable.write(path, train(rounds=50, passes=1, seed=1))
+    return path
+
+
+def test_state_index_is_in_range():
+    indices = {state_index(kind, hand, top, opp, deck)
+               for kind in (0, 2) for top in (0, 6) for opp in (0, 7) for deck in (0, 40)
+               for hand in ([0] * 7, [2] * 7)}
+    assert len(indices) == 32
+    assert all(0 <= i < SIZE for i in indices)
+    assert state_index(CARD, [3] * 7, 1, 2, 5) == state_index(CARD, [2] * 7, 1, 2, 6)
+
+
+def test_table_roundtrip(policy_file):
+    table = open_table(policy_file)
+    assert open_table(policy_file) is table  # отображается один раз на процесс
+    data = policy_file.read_bytes()
+    assert len(data) > SIZE
+    known = [i for i in range(0, SIZE, 997) if table[i] != UNKNOWN]
+    assert all(table[i] == data[-SIZE + i] for i in known)
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        PolicyTable(path)
+
+
+def test_table_bot_plays_full_game(policy_file):
+    players = {Player("T", HistogramHand()): TableBot("T", str(policy_file)),
+               Player("B", HistogramHand()): Bot("B")}
+    server = GameServer.new_game(players, seed=2, headless=True)
+    server.run()
+    assert server.current_phase == GamePhase.GAME_END
+
+
+def test_table_bot_game_save_and_load(policy_file, tmp_path):
+    players = {Player("T", HistogramHand()): TableBot("T", str(policy_file)),
+               Player("B", HistogramHand()): Bot("B")}
+    server = GameServer.new_game(players, seed=3, headless=True)
+    for _ in range(10):
+        server.run_one_step()
+    server.save(tmp_path / "game.json")
+    loaded = GameServer.load_game(tmp_path / "game.json", headless=True)
+    bot = loaded.interactions[0]
+    assert isinstance(bot, TableBot) and bot.table.path == policy_file.resolve()
+    loaded.run()
+    assert loaded.current_phase == GamePhase.GAME_END
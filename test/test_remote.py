@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from src.async_host import GameHost
+from src.GameServer import GameServer
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.remote import RemoteClient, RemoteError, open_server
+
+NAMES = ("Alex", "Bob", "Charley")
+
+
+def local_scores(seed):
+    server = GameServer.new_game({Player(name, Hand()): Bot(name) for name in NAMES}, seed=seed, headless=True)
+    server.run()
+    return [p.score for p in server.game_state.players]
+
+
+async def play_remote(seeds, factory=Bot):
+    connected = asyncio.get_running_loop().create_future()
+    server = await open_server(connected.set_result)
+    port = server.sockets[0].getsockname()[1]
+    client = RemoteClient(factory)
+    client_task = asyncio.create_task(client.connect(port=port))
+    connection = await connected
+
+    host = GameHost()
+    for seed in seeds:
+        players = {Player(name, Hand()): connection.player(name, seat=f"{seed}/{name}") for name in NAMES}
+        host.add(GameServer.new_game(players, seed=seed, headless=True))
+    try:
+        servers = await host.run()
+    finally:
+        await connection.close()
+        await client_task
+        server.close()
+    return [[p.score for p in s.game_state.players] for s in servers], client
+
+
+def test_remote_games_match_local():
+    seeds = range(4)
+    scores, client = asyncio.run(play_remote(seeds))
+    assert scores == [local_scores(seed) for seed in seeds]
+    assert client.requests > 0
+    assert len(client.interactions) == len(NAMES) * len(seeds)
+
+
+class Recorder(Bot):
+    def __init__(self, name):
+        super().__init__(name)
+        self.played = []
+
+    def inform_card_played(self, player, card):
+        self.played.append((player.name, card.value))
+
+
+def test_notifications_reach_client():
+    _, client = asyncio.run(play_remote([5], Recorder))
+    histories = [interaction.played for interaction in client.interactions.values()]
+    assert histories[0]
+    assert all(history == histories[0] for history in histories)
+
+
+class StateRecorder(Bot):
+    def __init__(self, name):
+        super().__init__(name)
+        self.game_state = None
+        self.checked = 0
+
+    def inform_game_state(self, game_state, seat):
+        self.game_state = game_state
+        self.seat = seat
+
+    def choose_card(self, hand, top):
+        state = self.game_state
+        assert self.name.endswith(state.players[self.seat].name)  # клиент называет игрока по seat "игра/имя"
+        assert state.current_player_index == self.seat and state.top == top
+        assert [c.value for c in state.players[self.seat].hand.cards] == [c.value for c in hand.cards]
+        self.checked += 1
+        return super().choose_card(hand, top)
+
+
+def test_game_state_reaches_client():
+    scores, client = asyncio.run(play_remote([2], StateRecorder))
+    assert scores == [local_scores(2)]
+    assert all(interaction.checked for interaction in client.interactions.values())
+
+
+class Broken(Bot):
+    def choose_card(self, hand, top):
+        raise ValueError("broken")
+
+
+def test_client_error_is_raised():
+    with pytest.raises(RemoteError):
+        asyncio.run(play_remote([1], Broken))
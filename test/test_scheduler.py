@@ -0,0 +1,63 @@
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.scheduler import Scheduler, bot_batch, run_games
+
+
+def new_server(seed, kind=Bot):
+    players = {Player(name, Hand()): kind(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def scores(server):
+    return [p.score for p in server.game_state.players]
+
+
+def test_play_generator():
+    reference = new_server(4)
+    reference.run()
+    server = new_server(4)
+    game = server.play()
+    request = next(game)
+    try:
+        while True:
+            request = game.send(request.ask())
+    except StopIteration as stop:
+        assert stop.value is server.winner
+    assert server.current_phase == GamePhase.GAME_END
+    assert scores(server) == scores(reference)
+
+
+def test_scheduler_matches_run():
+    seeds = range(30)
+    expected = []
+    for seed in seeds:
+        server = new_server(seed)
+        server.run()
+        expected.append(scores(server))
+    servers = [new_server(seed) for seed in seeds]
+    finished = run_games(servers, batch_size=7)
+    assert sorted(map(id, finished)) == sorted(map(id, servers))
+    assert [scores(server) for server in servers] == expected
+
+
+class CountingBot(Bot):
+    pass
+
+
+def test_batches_span_games():
+    batches = []
+
+    def decider(requests):
+        batches.append(len(requests))
+        return bot_batch(requests)
+
+    scheduler = Scheduler()
+    scheduler.register(CountingBot, decider)
+    for seed in range(10):
+        scheduler.add(new_server(seed, CountingBot))
+    scheduler.run()
+    assert len(scheduler.finished) == 10
+    assert max(batches) == 10  # пока все партии идут, решения одного такта приходят одной пачкой
+    assert sum(batches) == scheduler.decisions
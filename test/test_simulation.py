@@ -0,0 +1,35 @@
+from src.GameServer import GameServer, GamePhase
+from src.hand import HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.simulation import RoundSim, determinize, hand_histogram, unseen_counts
+
+
+def new_server(seed, n_players=3):
+    players = {Player(f"P{i}", HistogramHand()): Bot(f"P{i}") for i in range(n_players)}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_rollout_matches_game_server():
+    for seed in range(20):
+        server = new_server(seed)
+        sim = RoundSim.from_game_state(server.game_state)
+        sim.rollout()
+        while server.current_phase != GamePhase.END_ROUND:
+            server.run_one_step()
+        assert sim.counts == [hand_histogram(p.hand) for p in server.game_state.players]
+        assert sim.top == server.game_state.top.value
+
+
+def test_determinize_keeps_visible_information():
+    server = new_server(5, n_players=4)
+    state = server.game_state
+    own = hand_histogram(state.players[1].hand)
+    sizes = [len(p.hand) for p in state.players]
+    sim = determinize(1, own, sizes, len(state.deck), unseen_counts(own, [0] * 7), state.top.value, 1,
+                      [False] * 4, server.rng)
+    assert sim.counts[1] == own
+    assert sim.sizes == sizes
+    assert len(sim.deck) == len(state.deck)
+    total = [sum(c[v] for c in sim.counts) + sim.deck.count(v) for v in range(7)]
+    assert all(n <= 8 for n in total)
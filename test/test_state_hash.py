@@ -0,0 +1,47 @@
+from src.game_state import GameState
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand, HistogramHand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+
+
+def new_server(seed, hand_type=Hand):
+    players = {Player(name, hand_type()): Bot(name) for name in ("Alex", "Bob", "Charley")}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_incremental_hash_matches_rehash():
+    for seed, hand_type in ((1, Hand), (2, HistogramHand)):
+        server = new_server(seed, hand_type)
+        state = server.game_state
+        while server.current_phase != GamePhase.GAME_END:
+            server.run_one_step()
+            expected = GameState.from_bytes(state.to_bytes())
+            assert state.state_hash == expected.state_hash
+            assert hash(state) == hash(expected)
+
+
+def test_hash_tracks_quit_and_equality():
+    state = new_server(3).game_state
+    copy = GameState.from_bytes(state.to_bytes())
+    assert copy == state and copy.state_hash == state.state_hash
+    copy.set_quit(1, True)
+    assert copy.state_hash != state.state_hash
+    assert copy == state and hash(copy) == hash(state)  # __eq__ не сравнивает флаги quit
+    copy.set_quit(1, False)
+    assert copy.state_hash == state.state_hash
+
+
+def test_transpositions_share_hash():
+    a = GameState.from_bytes(new_server(4).game_state.to_bytes())
+    b = GameState.from_bytes(a.to_bytes())
+    a.add_score(0, 3)
+    a.add_score(0, 2)
+    b.add_score(0, 5)
+    a.next_player()
+    a.next_player()
+    a.next_player()
+    assert a.state_hash == b.state_hash
+    b.next_player()
+    assert a.state_hash != b.state_hash
+    assert len({a.state_hash, b.state_hash, GameState.from_bytes(a.to_bytes()).state_hash}) == 2
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from src.player_interactions.ai_player import Bot
+from src.tournament import Tournament, game_seed, wilson_interval, resolve_strategy, play_game
+
+
+class LazyBot(Bot):
+    # никогда не играет карту после взятия из колоды
+    @classmethod
+    def choose_to_play(cls, top, drawn):
+        return False
+
+
+def test_game_seed_is_stable():
+    assert game_seed(0, 5) == game_seed(0, 5)
+    assert game_seed(0, 5) != game_seed(0, 6)
+    assert game_seed(0, 5) != game_seed(1, 5)
+
+
+def test_result_does_not_depend_on_workers():
+    single = Tournament([Bot, LazyBot], games=24, seed=3, workers=1, chunk_size=5).run()
+    pooled = Tournament([Bot, LazyBot], games=24, seed=3, workers=2, chunk_size=5).run()
+    assert single.games == pooled.games == 24
+    assert single.to_dict() == pooled.to_dict()
+    assert sum(single.stats.wins) == 24
+    assert single.names == ["Bot", "LazyBot"]
+
+
+def test_stream_and_names():
+    tournament = Tournament([Bot, Bot, Bot], games=9, workers=1, chunk_size=4)
+    assert tournament.names == ["Bot#0", "Bot#1", "Bot#2"]
+    assert [result.games for result in tournament.stream()] == [4, 8, 9]
+
+
+def test_bad_rotation():
+    with pytest.raises(ValueError):
+        Tournament([Bot, Bot], games=1, rotations=[(0, 0)])
+
+
+def test_wilson_interval():
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert wilson_interval(0, 10)[0] == 0.0
+    assert resolve_strategy("Bot") is Bot
+    assert resolve_strategy("src.player_interactions.ai_player:Bot") is Bot
+
+
+def test_play_game_keeps_global_random():
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    play_game([Bot, Bot], (0, 1), seed=5)
+    assert random.random() == expected
@@ -0,0 +1,55 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pytest
+
+from src.card import CARDS
+from src.ui.view_card import CardImages, ViewCard, redraw_dirty
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield pygame.display.set_mode((400, 300))
+    pygame.quit()
+
+
+@pytest.fixture
+def images(tmp_path, display):
+    for name, color in [(str(v), (30 * v, 0, 0)) for v in range(7)] + [('back', (0, 0, 255))]:
+        surface = pygame.Surface((10, 10))
+        surface.fill(color)
+        pygame.image.save(surface, str(tmp_path / f"{name}.png"))
+    cache = CardImages(str(tmp_path), (ViewCard.WIDTH, ViewCard.HEIGHT))
+    cache.load()
+    return cache
+
+
+def test_images_are_shared(images, monkeypatch):
+    monkeypatch.setattr(ViewCard, 'IMAGES', images)
+    a, b = ViewCard(CARDS[3]), ViewCard(CARDS[3])
+    assert a.img_front is b.img_front
+    assert a.img_back is ViewCard(CARDS[1]).img_back
+    assert a.img_front.get_size() == (ViewCard.WIDTH, ViewCard.HEIGHT)
+
+
+def test_missing_images_get_placeholder(tmp_path, display):
+    cache = CardImages(str(tmp_path / 'missing'))
+    assert cache.front(CARDS[0]).get_size() == cache.size
+
+
+def test_redraw_only_dirty(images, monkeypatch, display):
+    monkeypatch.setattr(ViewCard, 'IMAGES', images)
+    background = pygame.Surface(display.get_size())
+    views = [ViewCard(CARDS[v], x=10 + 120 * i, y=20) for i, v in enumerate((1, 2, 3))]
+    assert len(redraw_dirty(views, display, background)) == 3  # первый кадр: все карты
+    assert redraw_dirty(views, display, background) == []  # ничего не изменилось
+    views[1].flip()
+    assert redraw_dirty(views, display, background) == [views[1].bounds(), views[1].bounds()]
+    assert display.get_at((views[1].x + 1, views[1].y + 1))[:3] == (0, 0, 255)
+    views[2].x += 50
+    old = views[2].drawn_bounds
+    areas = redraw_dirty(views, display, background)
+    assert areas == [old, views[2].bounds()]
+    assert display.get_at((old.x + 6, old.y + 6))[:3] == (0, 0, 0)  # старое место закрашено фоном
@@ -0,0 +1,99 @@
+import itertools
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+import pygame
+import pytest
+
+from src.card import CARDS
+from src.event_bus import EventType
+from src.game_log import NULL_LOG
+from src.GameServer import GameServer, GamePhase
+from src.hand import Hand
+from src.player import Player
+from src.player_interactions.ai_player import Bot
+from src.ui.event import CustomEvent
+from src.ui.view_card import CardImages
+from src.ui.view_game import ViewGame, EngineStepper, grid, run_spectator
+from src.ui.view_hand import ViewHand
+
+
+@pytest.fixture
+def display():
+    pygame.init()
+    yield pygame.display.set_mode((800, 600))
+    pygame.quit()
+
+
+def new_server(seed, n=3):
+    players = {Player(f"P{i}", Hand()): Bot(f"P{i}") for i in range(n)}
+    return GameServer.new_game(players, seed=seed, headless=True)
+
+
+def test_hand_layout_only_on_change(display):
+    player = Player("A", Hand([CARDS[v] for v in (1, 2, 3)]))
+    images = CardImages.for_size((20, 30))
+    view = ViewHand(player, 10, 10, 200, images=images)
+    assert view.sync()
+    assert not view.sync()
+    assert [s.x for s in view.sprites] == [10, 10 + 20 + view.GAP, 10 + 2 * (20 + view.GAP)]
+    player.hand.add_cards([CARDS[v] for v in (4, 5, 6, 0, 1, 2, 3)])
+    assert view.sync()
+    assert len(view.group) == 10
+    assert view.sprites[-1].rect.right <= 10 + 200  # не помещаются - внахлёст
+    assert view.card_at((view.sprites[-1].rect.right - 1, 15)) == CARDS[3]
+
+
+def test_stepper_budget_and_rate():
+    servers = [new_server(seed) for seed in range(3)]
+    stepper = EngineStepper(servers, steps_per_second=10)
+    assert stepper.advance(0.05, budget=1.0) == 0  # полшага на партию - ещё рано
+    assert stepper.advance(0.05, budget=1.0) == 3
+    assert stepper.advance(10.0, budget=1.0) == 3 * int(EngineStepper.MAX_BACKLOG)
+    ticks = itertools.count()
+    stepper = EngineStepper(servers, clock=lambda: next(ticks))
+    assert stepper.advance(0.04, budget=0) == 3  # бюджет исчерпан после первого круга
+    while not stepper.finished:
+        stepper.advance(0.04, budget=1.0)
+    assert all(server.current_phase == GamePhase.GAME_END for server in servers)
+
+
+def test_game_view_redraws_changes(display):
+    server = new_server(1)
+    group = pygame.sprite.LayeredDirty()
+    background = pygame.Surface(display.get_size())
+    group.clear(display, background)
+    view = ViewGame(server, grid(4, display.get_rect())[0], group)
+    view.sync()
+    group.draw(display)
+    group.draw(display)
+    assert group.draw(display) == []  # без изменений ничего не рисуется
+    server.run()
+    view.sync()
+    assert group.draw(display)
+    assert view.status.text == f"{server.winner.name} wins"
+
+
+def test_spectator_runs():
+    servers = [new_server(seed) for seed in range(4)]
+    before = [server.save_to_dict() for server in servers]
+    run_spectator(servers, fps=1000, steps_per_second=None, max_frames=20)
+    assert all(server.save_to_dict() != data for server, data in zip(servers, before))
+
+
+def test_only_views_post_pygame_events(display):
+    players = {Player(f"P{i}", Hand()): Bot(f"P{i}") for i in range(3)}
+    server = GameServer.new_game(players, seed=2, log=NULL_LOG)  # с консолью, но без интерфейса
+    pygame.event.clear()
+    for _ in range(30):
+        server.run_one_step()
+    assert server.event_bus is None
+    assert not pygame.event.get(list(CustomEvent))
+    rect = grid(2, display.get_rect())[0]
+    ViewGame(server, rect)
+    ViewGame(server, rect)  # второй вид той же партии
+    plays = []
+    server.event_bus.subscribe(plays.append, EventType.PLAY)
+    while not plays:
+        server.run_one_step()
+    assert len(pygame.event.get(CustomEvent.PLAY_CARD)) == len(plays)